@@ -0,0 +1,138 @@
+"""JSON codec benchmark.
+
+Compares the JSON backends installed here (``json`` always; ``orjson`` and
+``msgspec`` when available) on the two hot ends of a search:
+
+1. Upstream decode: parsing an API page body (``$top`` items with HTML
+   descriptions, as ``fetch_raw`` receives it), and the same followed by
+   ``_parse_item`` into ``AzureUpdate`` records, to show the decoder's share of
+   the whole parse.
+2. Response encoding: serializing a search result of the same updates, as
+   the tool serializer does. FastMCP's default serializer (pydantic-core) is
+   measured alongside for reference.
+
+Usage:
+    python benchmarks/codec.py [--items 100] [--runs 200] [--json]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import pydantic_core
+
+from azure_updates_mcp.codec import CODEC, available_codecs
+from azure_updates_mcp.feeds.azure_api import _parse_item
+
+STATUSES = ["Launched", "In preview", "In development", "Retirements"]
+PRODUCTS = ["Azure Kubernetes Service (AKS)", "Azure Functions", "Azure Cosmos DB", "Azure SQL"]
+CATEGORIES = ["Compute", "Containers", "Databases", "Networking"]
+WORDS = ["kubernetes", "autoscaling", "preview", "regions", "security", "vector", "retire", "gpu"]
+
+
+def make_page(count: int, seed: int = 1) -> str:
+    """Build an API page body with ``count`` items, newest first."""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1)
+    items = []
+    for n in range(count):
+        created = start - timedelta(hours=6 * n)
+        link = f"<a href='https://aka.ms/update-{n}'>Learn more</a>"
+        paragraphs = "".join(
+            f"<p>{' '.join(rng.choices(WORDS, k=30))} {link}</p>" for _ in range(4)
+        )
+        items.append(
+            {
+                "id": f"bench-{n:06d}",
+                "title": f"Update {n}: {' '.join(rng.sample(WORDS, 3))}",
+                "description": paragraphs,
+                "status": rng.choice(STATUSES),
+                "created": created.isoformat() + "Z",
+                "modified": (created + timedelta(days=rng.randint(0, 30))).isoformat() + "Z",
+                "products": [rng.choice(PRODUCTS)],
+                "productCategories": [rng.choice(CATEGORIES)],
+                "tags": ["Features"],
+                "generalAvailabilityDate": f"2026-{rng.randint(1, 12):02d}",
+            }
+        )
+    return json.dumps({"@odata.count": count, "value": items})
+
+
+def measure(fn, runs: int) -> dict:
+    """Time ``runs`` calls of ``fn`` and return median and p90 in microseconds."""
+    fn()
+    samples = []
+    for _ in range(runs):
+        began = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - began) * 1e6)
+    samples.sort()
+    return {
+        "median_us": round(statistics.median(samples), 1),
+        "p90_us": round(samples[int(len(samples) * 0.9) - 1], 1),
+    }
+
+
+def run(items: int, runs: int) -> dict:
+    body = make_page(items)
+    codecs = available_codecs()
+    updates = [_parse_item(item) for item in json.loads(body)["value"]]
+    result = {
+        "total_found": len(updates),
+        "updates": [update.to_dict() for update in updates],
+        "filters_applied": {"query": "kubernetes"},
+    }
+
+    report: dict = {
+        "items": items,
+        "page_bytes": len(body.encode()),
+        "default_backend": CODEC.name,
+        "decode": {},
+        "decode_and_parse": {},
+        "encode": {},
+    }
+    for name, codec in codecs.items():
+        report["decode"][name] = measure(lambda: codec.loads(body), runs)
+        report["decode_and_parse"][name] = measure(
+            lambda: [_parse_item(item) for item in codec.loads(body)["value"]], runs
+        )
+        report["encode"][name] = measure(lambda: codec.dumps(result), runs)
+    report["encode"]["pydantic-core (FastMCP default)"] = measure(
+        lambda: pydantic_core.to_json(result, fallback=str), runs
+    )
+    return report
+
+
+def print_report(report: dict) -> None:
+    print(
+        f"{report['items']} items, {report['page_bytes'] / 1024:.1f} KiB page; "
+        f"server default backend: {report['default_backend']}"
+    )
+    for section in ("decode", "decode_and_parse", "encode"):
+        rows = report[section]
+        baseline = rows["json"]["median_us"]
+        print(f"\n{section:<34} {'median us':>10} {'p90 us':>10} {'vs json':>8}")
+        for name, stats in rows.items():
+            speedup = baseline / stats["median_us"] if stats["median_us"] else float("inf")
+            print(f"{name:<34} {stats['median_us']:>10} {stats['p90_us']:>10} {speedup:>7.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100, help="Items per API page")
+    parser.add_argument("--runs", type=int, default=200, help="Timed runs per measurement")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = run(args.items, args.runs)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+"""Load test for the HTTP transport.
+
+Starts a local fake Azure Updates API, launches the server in HTTP mode against
+it (``MCP_TRANSPORT=http``, optionally with ``MCP_WORKERS``), then opens N
+concurrent MCP sessions that replay a weighted mix of ``azure_updates_search``
+calls for a fixed duration.
+
+Reports:
+
+- throughput (completed calls per second) and errors;
+- latency percentiles (p50, p90, p99, max) overall and per call type;
+- upstream amplification: requests the server made to the fake upstream per
+  tool call during the measured window (the initial corpus sync is reported
+  separately);
+- resident memory of the server process tree, sampled over time.
+
+Usage:
+    python benchmarks/load.py [--sessions 50] [--duration 30] [--workers 1]
+        [--items 2000] [--port 8765] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+STATUSES = ["Launched", "In preview", "In development", "Retirements"]
+CATEGORIES = ["Compute", "Containers", "Databases", "AI + machine learning", "Networking"]
+PRODUCTS = [
+    "Azure Kubernetes Service (AKS)",
+    "Azure Functions",
+    "Azure Cosmos DB",
+    "Azure SQL Database",
+    "Azure OpenAI Service",
+    "Azure Virtual Network",
+]
+WORDS = ["kubernetes", "autoscaling", "preview", "regions", "security", "vector", "retire", "gpu"]
+
+
+# -- fake upstream ---------------------------------------------------------------
+
+
+def make_corpus(count: int, seed: int) -> list[dict]:
+    """Build ``count`` synthetic API items, newest first."""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1)
+    items = []
+    for n in range(count):
+        created = start - timedelta(hours=6 * n)
+        words = rng.sample(WORDS, 3)
+        items.append(
+            {
+                "id": f"load-{n:06d}",
+                "title": f"Update {n}: {' '.join(words)}",
+                "description": f"<p>{' '.join(rng.choices(WORDS, k=40))}</p>",
+                "status": rng.choice(STATUSES),
+                "created": created.isoformat() + "Z",
+                "modified": (created + timedelta(days=rng.randint(0, 30))).isoformat() + "Z",
+                "products": [rng.choice(PRODUCTS)],
+                "productCategories": [rng.choice(CATEGORIES)],
+                "tags": rng.sample(["Features", "Retirements", "Security", "Regions"], 1),
+                "generalAvailabilityDate": f"Q{rng.randint(1, 4)} 2026",
+            }
+        )
+    return items
+
+
+class FakeUpstream:
+    """Threaded HTTP server answering Azure Updates API queries from memory."""
+
+    def __init__(self, items: list[dict]):
+        self.items = items
+        self.by_modified = sorted(items, key=lambda item: item["modified"], reverse=True)
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_port}/api"
+
+    def start(self) -> None:
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+
+    def respond(self, query: str) -> dict:
+        params = {key.lstrip("$"): values[0] for key, values in parse_qs(query).items()}
+        items = self.by_modified if params.get("orderby", "").startswith("modified") else self.items
+        if search := params.get("search", "").strip('"').lower():
+            items = [i for i in items if search in i["title"].lower() or search in i["description"]]
+        top, skip = int(params.get("top", 20)), int(params.get("skip", 0))
+        data: dict = {"value": items[skip : skip + top]}
+        if params.get("count") == "true":
+            data["@odata.count"] = len(items)
+        if params.get("includeFacets") == "true":
+            data["facets"] = [
+                {"name": name, "values": _facet_values(items, key)}
+                for name, key in (
+                    ("ProductCategory", "productCategories"),
+                    ("Product", "products"),
+                    ("Tags", "tags"),
+                    ("Status", "status"),
+                )
+            ]
+        return data
+
+    def _handler(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with upstream._lock:
+                    upstream.requests += 1
+                body = json.dumps(upstream.respond(urlparse(self.path).query)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def _facet_values(items: list[dict], key: str) -> list[dict]:
+    counts: dict[str, int] = {}
+    for item in items:
+        values = item[key] if isinstance(item[key], list) else [item[key]]
+        for value in values:
+            counts[value] = counts.get(value, 0) + 1
+    return [{"value": value, "count": count} for value, count in counts.items()]
+
+
+# -- workload --------------------------------------------------------------------
+
+
+def call_mix(items: list[dict]) -> list[tuple[str, int, Callable[[random.Random], dict]]]:
+    """Weighted mix of search calls as (name, weight, argument factory)."""
+    ids = [item["id"] for item in items[:200]]
+    return [
+        ("recent", 30, lambda rng: {"limit": 10}),
+        ("keyword", 25, lambda rng: {"query": rng.choice(WORDS), "limit": 10}),
+        ("status", 15, lambda rng: {"status": rng.choice(STATUSES), "limit": 10}),
+        ("category", 15, lambda rng: {"product_category": rng.choice(CATEGORIES), "limit": 10}),
+        ("facets", 10, lambda rng: {"include_facets": True, "limit": 0}),
+        ("guid", 5, lambda rng: {"guid": rng.choice(ids)}),
+    ]
+
+
+async def run_session(url: str, mix, deadline: float, seed: int, samples: list) -> None:
+    """One MCP session issuing calls back to back until ``deadline``."""
+    from fastmcp import Client
+
+    rng = random.Random(seed)
+    names = [name for name, _, _ in mix]
+    weights = [weight for _, weight, _ in mix]
+    factories = {name: factory for name, _, factory in mix}
+
+    async with Client(url, timeout=60) as client:
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            try:
+                await client.call_tool("azure_updates_search", factories[name](rng))
+                ok = True
+            except Exception:
+                ok = False
+            samples.append((name, time.perf_counter() - start, ok))
+
+
+# -- server process --------------------------------------------------------------
+
+
+def start_server(port: int, workers: int, upstream_url: str, store_path: str) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "MCP_TRANSPORT": "http",
+        "MCP_HOST": "127.0.0.1",
+        "MCP_PORT": str(port),
+        "MCP_WORKERS": str(workers),
+        "AZURE_UPDATES_API_URL": upstream_url,
+        "AZURE_UPDATES_STORE": store_path,
+    }
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "azure_updates_mcp.server"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Server exited with code {proc.returncode}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("Server did not start listening within 60s")
+
+
+def tree_rss_bytes(pid: int) -> int:
+    """Resident memory of ``pid`` and all its descendants (Linux /proc)."""
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    total, stack = 0, [pid]
+    page = os.sysconf("SC_PAGE_SIZE")
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f"/proc/{current}/statm") as f:
+                total += int(f.read().split()[1]) * page
+        except OSError:
+            continue
+        stack.extend(children.get(current, []))
+    return total
+
+
+async def sample_rss(pid: int, interval: float, stop: asyncio.Event, samples: list) -> None:
+    start = time.perf_counter()
+    while not stop.is_set():
+        samples.append((time.perf_counter() - start, tree_rss_bytes(pid)))
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+# -- reporting -------------------------------------------------------------------
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+def summarize(latencies: list[float]) -> dict:
+    return {
+        "calls": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p90_ms": round(percentile(latencies, 90) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "max_ms": round(max(latencies, default=0) * 1000, 1),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 1) if latencies else 0.0,
+    }
+
+
+def print_report(report: dict) -> None:
+    overall = report["latency"]
+    print(
+        f"{report['sessions']} sessions x {report['duration_s']}s against "
+        f"{report['workers']} worker(s), {report['items']} upstream items"
+    )
+    print(
+        f"Throughput: {report['throughput_per_s']:.1f} calls/s "
+        f"({overall['calls']} calls, {report['errors']} errors)"
+    )
+    print(
+        f"Latency: p50 {overall['p50_ms']} ms, p90 {overall['p90_ms']} ms, "
+        f"p99 {overall['p99_ms']} ms, max {overall['max_ms']} ms"
+    )
+    print(f"{'call':<10} {'calls':>7} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, stats in report["latency_by_call"].items():
+        print(f"{name:<10} {stats['calls']:>7} {stats['p50_ms']:>8} {stats['p99_ms']:>8}")
+    upstream = report["upstream"]
+    print(
+        f"Upstream: {upstream['sync_requests']} requests during startup sync, "
+        f"{upstream['load_requests']} during load "
+        f"({upstream['amplification']:.3f} per tool call)"
+    )
+    rss = report["rss_mb"]
+    timeline = ", ".join(f"{t:.0f}s {mb:.0f}" for t, mb in rss["timeline"])
+    print(
+        f"Server RSS (MB): start {rss['start']:.0f}, peak {rss['peak']:.0f}, end {rss['end']:.0f}"
+    )
+    print(f"  over time: {timeline}")
+
+
+async def run(args) -> dict:
+    items = make_corpus(args.items, args.seed)
+    upstream = FakeUpstream(items)
+    upstream.start()
+
+    store_path = os.path.join(tempfile.mkdtemp(prefix="azure-updates-load-"), "store.sqlite3")
+    proc = start_server(args.port, args.workers, upstream.url, store_path)
+    try:
+        # Let the background sync pull the corpus before measuring
+        await asyncio.sleep(args.warmup)
+        sync_requests = upstream.requests
+
+        url = f"http://127.0.0.1:{args.port}/mcp"
+        mix = call_mix(items)
+        samples: list = []
+        rss: list = []
+        stop = asyncio.Event()
+        sampler = asyncio.create_task(sample_rss(proc.pid, args.sample_interval, stop, rss))
+
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(
+            *(run_session(url, mix, deadline, args.seed + i, samples) for i in range(args.sessions))
+        )
+        elapsed = time.perf_counter() - start
+        load_requests = upstream.requests - sync_requests
+        stop.set()
+        await sampler
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        upstream.stop()
+
+    completed = [latency for _, latency, ok in samples if ok]
+    by_call = {
+        name: summarize([lat for n, lat, ok in samples if n == name and ok]) for name, _, _ in mix
+    }
+    mb = [(t, size / 2**20) for t, size in rss]
+    return {
+        "sessions": args.sessions,
+        "duration_s": args.duration,
+        "workers": args.workers,
+        "items": args.items,
+        "throughput_per_s": len(completed) / elapsed,
+        "errors": len(samples) - len(completed),
+        "latency": summarize(completed),
+        "latency_by_call": by_call,
+        "upstream": {
+            "sync_requests": sync_requests,
+            "load_requests": load_requests,
+            "amplification": load_requests / max(len(samples), 1),
+        },
+        "rss_mb": {
+            "start": mb[0][1] if mb else 0.0,
+            "peak": max((size for _, size in mb), default=0.0),
+            "end": mb[-1][1] if mb else 0.0,
+            "timeline": mb,
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=50, help="Concurrent MCP sessions")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load")
+    parser.add_argument("--workers", type=int, default=1, help="Server worker processes")
+    parser.add_argument("--items", type=int, default=2000, help="Updates in the fake upstream")
+    parser.add_argument("--port", type=int, default=8765, help="Port for the server under test")
+    parser.add_argument("--warmup", type=float, default=3.0, help="Seconds before measuring")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="RSS sampling period")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
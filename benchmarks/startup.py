@@ -0,0 +1,107 @@
+"""Startup benchmark for the stdio transport.
+
+Measures two things:
+
+1. Import cost, via ``python -X importtime``. The report lists the slowest
+   modules by cumulative time and the subtotal spent in this package.
+2. Time-to-first-``initialize``-response. The server is spawned the same way an
+   MCP client does, an ``initialize`` request is written to stdin, and the
+   wall-clock time until the JSON-RPC reply appears on stdout is recorded.
+
+Usage:
+    python benchmarks/startup.py [--runs 10] [--top 15]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+PACKAGE = "azure_updates_mcp"
+
+INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "startup-benchmark", "version": "0"},
+    },
+}
+
+
+def import_time_report(top: int) -> None:
+    """Print the slowest imports for ``azure_updates_mcp.server``."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {PACKAGE}.server"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    rows: list[tuple[int, int, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        rows.append((int(self_us), int(cumulative_us), module.rstrip()))
+
+    total_us = sum(row[0] for row in rows)
+    package_us = sum(row[0] for row in rows if row[2].strip().startswith(PACKAGE))
+
+    print(f"Import time: {total_us / 1000:.1f} ms total, {package_us / 1000:.1f} ms in {PACKAGE}")
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for self_us, cumulative_us, module in sorted(rows, key=lambda r: -r[1])[:top]:
+        print(f"{self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {module}")
+
+    package_modules = sorted({row[2].strip() for row in rows if row[2].strip().startswith(PACKAGE)})
+    print(f"\n{PACKAGE} modules loaded at startup: {', '.join(package_modules)}")
+
+
+def time_to_initialize() -> float:
+    """Spawn the stdio server and return seconds until the initialize reply."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", f"{PACKAGE}.server"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        proc.stdin.write((json.dumps(INITIALIZE_REQUEST) + "\n").encode())
+        proc.stdin.flush()
+        reply = proc.stdout.readline()
+        elapsed = time.perf_counter() - start
+    finally:
+        proc.kill()
+        proc.wait()
+
+    if b'"result"' not in reply:
+        raise RuntimeError(f"Unexpected initialize reply: {reply[:200]!r}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Number of cold starts to time")
+    parser.add_argument("--top", type=int, default=15, help="Number of slow imports to list")
+    args = parser.parse_args()
+
+    import_time_report(args.top)
+
+    samples = [time_to_initialize() for _ in range(args.runs)]
+    samples.sort()
+    p90 = samples[min(len(samples) - 1, int(len(samples) * 0.9))]
+    print(
+        f"\nTime to initialize response over {args.runs} runs: "
+        f"min {samples[0] * 1000:.0f} ms, "
+        f"median {statistics.median(samples) * 1000:.0f} ms, "
+        f"p90 {p90 * 1000:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
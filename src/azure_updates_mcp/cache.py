@@ -0,0 +1,119 @@
+"""In-process cache of complete tool results.
+
+Identical tool calls are answered with the ``ToolResult`` produced the first
+time (content already serialized to JSON), skipping filtering, slicing, and
+serialization altogether. Entries are keyed on the tool name, the call's
+arguments normalised against the tool's signature (defaults filled in, strings
+stripped), and the store's corpus version, so every sync that changes the
+corpus invalidates them. Results built from upstream API calls are also only as fresh as the
+upstream response cache, so entries expire after the same TTL.
+"""
+
+import asyncio
+import inspect
+import json
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+
+RESULT_CACHE_SIZE_ENV = "AZURE_UPDATES_RESULT_CACHE_SIZE"
+DEFAULT_RESULT_CACHE_SIZE = 512
+
+# Arguments that do not change a complete result
+UNKEYED_ARGUMENTS = frozenset({"deadline_seconds"})
+
+
+class ToolResultCache(Middleware):
+    """LRU cache of tool results, invalidated when the corpus version changes."""
+
+    def __init__(self, tools: dict[str, Callable], max_entries: int | None = None):
+        """Cache calls to ``tools`` (tool name -> tool function).
+
+        Args:
+            tools: Tools whose results depend only on their arguments and the
+                corpus (and upstream data within the cache TTL).
+            max_entries: Maximum number of cached results. Defaults to
+                AZURE_UPDATES_RESULT_CACHE_SIZE (512); 0 disables the cache.
+        """
+        self._signatures = {name: inspect.signature(fn) for name, fn in tools.items()}
+        if max_entries is None:
+            max_entries = int(os.getenv(RESULT_CACHE_SIZE_ENV, str(DEFAULT_RESULT_CACHE_SIZE)))
+        self.max_entries = max_entries
+        # key -> (corpus version, expires at, result)
+        self._entries: OrderedDict[str, tuple[int, float, ToolResult]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._entries.clear()
+
+    def cache_key(self, tool: str, arguments: dict | None) -> str | None:
+        """Return the normalised cache key for a call, or None if not cacheable."""
+        signature = self._signatures.get(tool)
+        if signature is None or self.max_entries <= 0:
+            return None
+        try:
+            bound = signature.bind(**(arguments or {}))
+        except TypeError:
+            # Let the tool report invalid arguments
+            return None
+        bound.apply_defaults()
+        normalized = {
+            name: value.strip() if isinstance(value, str) else value
+            for name, value in bound.arguments.items()
+            if name not in UNKEYED_ARGUMENTS
+        }
+        return tool + ":" + json.dumps(normalized, sort_keys=True, default=str)
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext,
+        call_next: CallNext,
+    ) -> ToolResult:
+        key = self.cache_key(context.message.name, context.message.arguments)
+        if key is None:
+            return await call_next(context)
+
+        # Deferred so stdio startup does not load sqlite3
+        from .store import get_store
+
+        store = get_store()
+        # Read in a worker thread; a corpus rewrite can hold the store for seconds
+        version = await asyncio.to_thread(getattr, store, "version")
+        now = time.monotonic()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version and entry[1] > now:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+        self.misses += 1
+        result = await call_next(context)
+        if _is_cacheable(result):
+            self._entries[key] = (version, now + store.cache_ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+
+def _is_cacheable(result: ToolResult) -> bool:
+    """Whether a result may be cached.
+
+    Error responses are often transient (e.g. corpus still syncing), stale or
+    partial results were cut short by a deadline, and feed_errors marks a
+    federated result missing a feed, so none of them is kept.
+    """
+    data = result.structured_content
+    if not isinstance(data, dict) or "error" in data or "feed_errors" in data:
+        return False
+    if data.get("stale") or data.get("partial"):
+        return False
+    filters = data.get("filters_applied")
+    return not (isinstance(filters, dict) and "error" in filters)
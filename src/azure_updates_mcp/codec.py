@@ -0,0 +1,107 @@
+"""JSON encoding and decoding with an optional fast backend.
+
+Upstream API pages, stored corpus items, NDJSON exports, and tool results all
+go through this module. It uses ``orjson`` or ``msgspec`` when one is installed
+(``pip install "azure-updates-mcp[orjson]"``) and the standard library's
+``json`` otherwise. ``AZURE_UPDATES_JSON_CODEC`` picks a backend explicitly
+(``orjson``, ``msgspec``, or ``json``); a backend that is not installed falls
+back to ``json``.
+
+Every backend produces compact, UTF-8 output and accepts ``str`` or ``bytes``.
+"""
+
+import json
+import os
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+JSON_CODEC_ENV = "AZURE_UPDATES_JSON_CODEC"
+
+# Fast backends tried, in order, when no backend is configured
+PREFERRED_BACKENDS = ("orjson", "msgspec")
+
+
+class Codec(NamedTuple):
+    """A JSON backend: ``loads`` parses str or bytes, ``dumps`` returns bytes."""
+
+    name: str
+    loads: Callable[[str | bytes], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _json_codec() -> Codec:
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str).encode()
+
+    return Codec("json", json.loads, dumps)
+
+
+def _orjson_codec() -> Codec:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str)
+
+    return Codec("orjson", orjson.loads, dumps)
+
+
+def _msgspec_codec() -> Codec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder(enc_hook=str)
+    decoder = msgspec.json.Decoder()
+    return Codec("msgspec", decoder.decode, encoder.encode)
+
+
+_FACTORIES: dict[str, Callable[[], Codec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _json_codec,
+}
+
+
+def available_codecs() -> dict[str, Codec]:
+    """Return every backend that can be loaded here, keyed by name."""
+    codecs = {}
+    for name, factory in _FACTORIES.items():
+        try:
+            codecs[name] = factory()
+        except ImportError:
+            continue
+    return codecs
+
+
+def select_codec(name: str | None = None) -> Codec:
+    """Return the backend called ``name``, or the fastest installed one.
+
+    Raises:
+        ValueError: If ``name`` is not a known backend.
+    """
+    if name and name not in _FACTORIES:
+        raise ValueError(f"Invalid JSON codec: {name}. Valid values: {', '.join(_FACTORIES)}")
+    for candidate in (name,) if name else PREFERRED_BACKENDS:
+        try:
+            return _FACTORIES[candidate]()
+        except ImportError:
+            continue
+    return _json_codec()
+
+
+CODEC = select_codec(os.getenv(JSON_CODEC_ENV) or None)
+
+loads = CODEC.loads
+dumps = CODEC.dumps
+
+
+def dumps_text(obj: Any) -> str:
+    """Encode ``obj`` as a JSON string."""
+    return dumps(obj).decode()
+
+
+def tool_serializer() -> Callable[[Any], str] | None:
+    """Return the serializer for tool results, or None for FastMCP's default.
+
+    FastMCP's default (pydantic-core) already beats the standard library, so
+    it is only replaced when a fast backend is in use.
+    """
+    return None if CODEC.name == "json" else dumps_text
@@ -0,0 +1,211 @@
+"""In-memory snapshot of the full updates corpus and its indexes.
+
+The snapshot is rebuilt from the store whenever the store's corpus version
+changes, so every index is computed once per sync rather than per request.
+
+A shared store is kept current by the background sync. A private in-memory
+store (stdio without ``AZURE_UPDATES_STORE``) has no sync loop, so it is
+backfilled on first use and backfilled again once its last sync is older than
+``AZURE_UPDATES_SYNC_INTERVAL``; until then searches that upstream can answer
+go to the API rather than to an out-of-date snapshot.
+"""
+
+import asyncio
+import time
+from bisect import bisect_left
+from collections import Counter
+from functools import cached_property
+
+import httpx
+
+from .deadline import DeadlineExceeded, current_deadline, deadline_scope, within_deadline
+from .feeds.azure_api import _parse_item, fetch_updates
+from .index import DateIndex, SimilarityIndex, TaxonomyResolver, build_columns
+from .models.update import AzureUpdate
+from .store import UpdateStore, get_store
+from .sync import sync_interval, sync_once
+
+
+class Corpus:
+    """Every known update, newest first, with indexes built at ingest."""
+
+    def __init__(self, updates: list[AzureUpdate], version: int):
+        # created desc, id desc: the order search results and page cursors use
+        self.updates = sorted(updates, key=lambda u: (u.created, u.id), reverse=True)
+        self.version = version
+        self.rows_by_id = {update.id: row for row, update in enumerate(self.updates)}
+        self.dates = DateIndex(self.updates)
+        self.columns = build_columns(self.updates)
+
+    def __len__(self) -> int:
+        return len(self.updates)
+
+    @cached_property
+    def similarity(self) -> SimilarityIndex:
+        """TF-IDF index for similar_to lookups, built on first use."""
+        return SimilarityIndex(self.updates)
+
+    @cached_property
+    def taxonomy(self) -> TaxonomyResolver:
+        """Fuzzy taxonomy name resolver over the corpus's facet counts."""
+        return TaxonomyResolver(count_facets(self.updates))
+
+    def get(self, update_id: str) -> AzureUpdate | None:
+        """Return the update with ``update_id``, or None."""
+        row = self.rows_by_id.get(update_id)
+        return self.updates[row] if row is not None else None
+
+
+def position_after(updates: list[AzureUpdate], anchor: tuple) -> int:
+    """Return the index of the first update after a ``(created, id)`` anchor.
+
+    ``updates`` must be in corpus order (created desc, id desc).
+    """
+    return bisect_left(updates, True, key=lambda u: (u.created, u.id) < anchor)
+
+
+def count_facets(updates: list[AzureUpdate]) -> dict:
+    """Count taxonomy values over ``updates`` in the same shape as API facets.
+
+    Returns:
+        Dictionary with product_categories, products, tags, and statuses lists
+        of {name, count} items, most frequent first.
+    """
+    counters = {
+        "product_categories": Counter(),
+        "products": Counter(),
+        "tags": Counter(),
+        "statuses": Counter(),
+    }
+    for update in updates:
+        counters["product_categories"].update(update.product_categories)
+        counters["products"].update(update.products)
+        counters["tags"].update(update.tags)
+        if update.status:
+            counters["statuses"][update.status] += 1
+
+    return {
+        key: [
+            {"name": name, "count": count}
+            for name, count in sorted(counter.items(), key=lambda x: (-x[1], x[0]))
+        ]
+        for key, counter in counters.items()
+    }
+
+
+_cached: tuple[UpdateStore, Corpus] | None = None
+_load_lock = asyncio.Lock()
+
+# Backfill of a private store (empty or out of date) in progress: (store, task)
+_backfill: tuple[UpdateStore, asyncio.Task] | None = None
+
+# Resolver built from API facets when no corpus is loaded: (store, built at, resolver)
+_facet_taxonomy: tuple[UpdateStore, float, TaxonomyResolver] | None = None
+
+
+async def corpus_available() -> bool:
+    """Whether the store holds a corpus recent enough to answer queries from."""
+    version, fresh = await asyncio.to_thread(_store_state, get_store())
+    return version > 0 and fresh
+
+
+async def get_corpus(backfill: bool = True) -> Corpus | None:
+    """Return the corpus snapshot for the current store version.
+
+    A private in-memory store with no corpus yet, or one last synced more than
+    a sync interval ago, is backfilled from upstream when ``backfill`` is set;
+    if a refresh fails the previous snapshot is served and the call's deadline
+    is marked stale. A shared store is only ever written by the elected sync
+    leader, so other processes wait for it instead.
+
+    Returns:
+        The corpus, or None if none is available yet.
+    """
+    global _cached
+    store = get_store()
+
+    async with _load_lock:
+        version, fresh = await asyncio.to_thread(_store_state, store)
+        if backfill and not fresh and not store.is_shared:
+            # The backfill is shared work: a caller that gives up at its
+            # deadline leaves it running for the next call to pick up
+            try:
+                version = await within_deadline(asyncio.shield(_start_backfill(store)))
+            except (httpx.HTTPError, ValueError, DeadlineExceeded):
+                if version == 0:
+                    raise
+                deadline = current_deadline()
+                if deadline is not None:
+                    deadline.stale = True
+        if version == 0:
+            return None
+        if _cached is not None and _cached[0] is store and _cached[1].version == version:
+            return _cached[1]
+
+        corpus = await asyncio.to_thread(_build_corpus, store, version)
+        _cached = (store, corpus)
+        return corpus
+
+
+async def get_taxonomy() -> TaxonomyResolver | None:
+    """Return a taxonomy resolver for fuzzy filter names.
+
+    Uses the loaded corpus when there is one. Otherwise the resolver is built
+    from a facets-only API request and kept for the store's cache TTL.
+
+    Returns:
+        The resolver, or None if upstream facets could not be fetched.
+    """
+    global _facet_taxonomy
+    store = get_store()
+    if await corpus_available():
+        corpus = await get_corpus(backfill=False)
+        if corpus is not None:
+            return corpus.taxonomy
+
+    now = time.monotonic()
+    if (
+        _facet_taxonomy is not None
+        and _facet_taxonomy[0] is store
+        and now - _facet_taxonomy[1] < store.cache_ttl
+    ):
+        return _facet_taxonomy[2]
+
+    try:
+        _, _, facets = await fetch_updates(top=0, include_facets=True)
+    except (httpx.HTTPError, ValueError, DeadlineExceeded):
+        return None
+    resolver = TaxonomyResolver(facets or {})
+    _facet_taxonomy = (store, now, resolver)
+    return resolver
+
+
+def _start_backfill(store: UpdateStore) -> asyncio.Task:
+    """Return the running backfill of ``store``, starting one if there is none."""
+    global _backfill
+    if _backfill is None or _backfill[0] is not store or _backfill[1].done():
+        _backfill = (store, asyncio.create_task(_backfill_detached(store)))
+    return _backfill[1]
+
+
+async def _backfill_detached(store: UpdateStore) -> int:
+    with deadline_scope(None):
+        return await sync_once(store)
+
+
+def _store_state(store: UpdateStore) -> tuple[int, bool]:
+    """Return the corpus version and whether the corpus is being kept current.
+
+    Runs off the event loop, as a sync holds the store while it writes.
+    """
+    version = store.version
+    if store.is_shared:
+        return version, True
+    synced_at = store.synced_at
+    return version, synced_at is not None and time.time() - synced_at < sync_interval()
+
+
+def _build_corpus(store: UpdateStore, version: int) -> Corpus:
+    """Parse the stored items and build the snapshot (runs off the event loop)."""
+    updates = [update for update in map(_parse_item, store.load_items()) if update is not None]
+    return Corpus(updates, version)
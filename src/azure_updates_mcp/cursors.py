@@ -0,0 +1,31 @@
+"""Opaque continuation cursors handed to MCP clients.
+
+A cursor is a URL-safe base64 encoding of a small JSON payload tagged with the
+kind of listing it belongs to, so a cursor from one tool is rejected by another.
+Clients should treat cursors as opaque strings.
+"""
+
+import base64
+import json
+
+
+def encode_cursor(kind: str, payload: dict) -> str:
+    """Encode a cursor payload for the given listing kind."""
+    raw = json.dumps({"k": kind, **payload}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(kind: str, cursor: str) -> dict:
+    """Decode a cursor produced by ``encode_cursor`` for the same kind.
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another kind.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+    if not isinstance(payload, dict) or payload.pop("k", None) != kind:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return payload
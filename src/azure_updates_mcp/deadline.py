@@ -0,0 +1,113 @@
+"""Per-call deadlines for tool calls that reach upstream.
+
+A deadline is set for the duration of a tool call with ``deadline_scope`` and
+carried in a context variable, so it reaches every upstream request the call
+makes (including concurrent ones) without being threaded through each feed
+function. Upstream requests then time out when the deadline does, instead of
+after the fixed 30 seconds, and the request is cancelled rather than left
+running. Callers degrade gracefully near the deadline: ``fetch_raw`` falls back
+to a recently expired cached response and multi-page scans return the pages
+read so far, and both are recorded on the ``Deadline`` so the tool can flag its
+result as stale or partial.
+
+The default deadline for a deployment comes from ``AZURE_UPDATES_DEADLINE``
+(seconds; unset means no deadline); a call can pass its own.
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+DEADLINE_ENV = "AZURE_UPDATES_DEADLINE"
+
+# Timeout for one upstream request when no deadline is set
+UPSTREAM_TIMEOUT = 30.0
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(TimeoutError):
+    """The call's deadline passed before it could produce an answer."""
+
+
+class Deadline:
+    """The time by which the current call must answer, and how it degraded."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+        # Set when an expired cached response was served in place of upstream
+        self.stale = False
+        # Set when a scan stopped early and returned what it had read
+        self.partial = False
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (negative once it has passed)."""
+        return self.expires_at - time.monotonic()
+
+    def exceeded(self) -> DeadlineExceeded:
+        """Return the error to raise for this deadline."""
+        return DeadlineExceeded(f"Deadline of {self.seconds:g}s exceeded waiting for upstream")
+
+
+_current: ContextVar[Deadline | None] = ContextVar("azure_updates_deadline", default=None)
+
+
+def default_deadline() -> float | None:
+    """Return the deployment's default deadline in seconds, or None if unset."""
+    value = os.getenv(DEADLINE_ENV)
+    return float(value) if value else None
+
+
+def current_deadline() -> Deadline | None:
+    """Return the deadline of the call in progress, or None."""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[Deadline | None]:
+    """Apply a deadline of ``seconds`` to everything run inside the block.
+
+    None (or a non-positive value) lifts any enclosing deadline, for work such
+    as a corpus backfill that must not be cut short by the call that started it.
+    """
+    deadline = Deadline(seconds) if seconds is not None and seconds > 0 else None
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def upstream_timeout() -> float:
+    """Return the timeout for the next upstream request.
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed.
+    """
+    deadline = _current.get()
+    if deadline is None:
+        return UPSTREAM_TIMEOUT
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise deadline.exceeded()
+    return min(UPSTREAM_TIMEOUT, remaining)
+
+
+async def within_deadline(awaitable: Awaitable[T]) -> T:
+    """Await ``awaitable``, giving up (and cancelling it) at the deadline.
+
+    Raises:
+        DeadlineExceeded: If the deadline passes first.
+    """
+    deadline = _current.get()
+    if deadline is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, max(deadline.remaining(), 0))
+    except TimeoutError:
+        raise deadline.exceeded() from None
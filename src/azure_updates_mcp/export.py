@@ -0,0 +1,274 @@
+"""Streaming bulk export of the updates corpus.
+
+The corpus is read from the store a page at a time, each page is filtered and
+encoded, and the encoded bytes are handed on before the next page is read, so
+memory stays bounded by the page size however large the corpus grows. NDJSON
+needs nothing beyond the standard library; Arrow IPC and Parquet output use the
+optional ``pyarrow`` package (``pip install "azure-updates-mcp[arrow]"``).
+
+Usage:
+    azure-updates-mcp export [--format ndjson|arrow|parquet] [--output FILE]
+        [--status S] [--product P] [--product-category C]
+        [--date-field F] [--start-date D] [--end-date D]
+"""
+
+import argparse
+import asyncio
+import sys
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+from . import codec
+from .feeds.azure_api import _parse_item
+from .index import DATE_FIELDS, parse_date_value
+from .models.update import AzureUpdate
+from .store import get_store
+
+FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Updates read from the store, filtered, and encoded per step
+EXPORT_BATCH_SIZE = 500
+
+
+@dataclass
+class ExportFilters:
+    """Filters applied to every exported update (all optional)."""
+
+    status: str | None = None
+    product: str | None = None
+    product_category: str | None = None
+    date_field: str = "created"
+    start: datetime | None = None
+    end: datetime | None = None
+
+    def matches(self, update: AzureUpdate) -> bool:
+        """Whether ``update`` passes every filter that is set."""
+        if self.status and (update.status or "").lower() != self.status.lower():
+            return False
+        if self.product and self.product.lower() not in (p.lower() for p in update.products):
+            return False
+        if self.product_category and self.product_category.lower() not in (
+            pc.lower() for pc in update.product_categories
+        ):
+            return False
+        if self.start or self.end:
+            value = parse_date_value(DATE_FIELDS[self.date_field](update))
+            if value is None:
+                return False
+            value = value.replace(tzinfo=None)
+            if self.start and value < self.start:
+                return False
+            if self.end and value > self.end:
+                return False
+        return True
+
+
+def build_filters(
+    status: str | None = None,
+    product: str | None = None,
+    product_category: str | None = None,
+    date_field: str = "created",
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> ExportFilters:
+    """Validate raw filter values into ExportFilters.
+
+    Raises:
+        ValueError: If date_field is unknown or a date cannot be parsed.
+    """
+    if date_field not in DATE_FIELDS:
+        raise ValueError(
+            f"Invalid date_field: {date_field}. Valid values: {', '.join(DATE_FIELDS)}"
+        )
+    try:
+        start = datetime.fromisoformat(start_date).replace(tzinfo=None) if start_date else None
+        end = datetime.fromisoformat(end_date).replace(tzinfo=None) if end_date else None
+    except ValueError:
+        raise ValueError(f"Invalid date format: {start_date or ''} {end_date or ''}".strip())
+    return ExportFilters(status, product, product_category, date_field, start, end)
+
+
+# -- encoders ---------------------------------------------------------------
+
+
+class NdjsonEncoder:
+    """One JSON object per line, in the same shape as tool results."""
+
+    def encode(self, updates: Iterable[AzureUpdate]) -> bytes:
+        return b"".join(codec.dumps(update.to_dict()) + b"\n" for update in updates)
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class _Drain:
+    """Write-only file object whose buffered bytes are taken after each batch."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ArrowEncoder:
+    """Arrow IPC stream (or Parquet file) with one record batch per page."""
+
+    def __init__(self, parquet: bool = False):
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ValueError(
+                'Arrow and Parquet export need pyarrow: pip install "azure-updates-mcp[arrow]"'
+            ) from e
+
+        self._pa = pa
+        self._sink = _Drain()
+        text = pa.string()
+        labels = pa.list_(pa.string())
+        self.schema = pa.schema(
+            [
+                ("id", text),
+                ("title", text),
+                ("link", text),
+                ("description", text),
+                ("status", text),
+                ("created", pa.timestamp("us", tz="UTC")),
+                ("modified", pa.timestamp("us", tz="UTC")),
+                ("products", labels),
+                ("product_categories", labels),
+                ("tags", labels),
+                ("general_availability_date", text),
+                ("preview_availability_date", text),
+                ("private_preview_availability_date", text),
+            ]
+        )
+        if parquet:
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(self._sink, self.schema)
+        else:
+            self._writer = pa.ipc.new_stream(self._sink, self.schema)
+
+    def encode(self, updates: Iterable[AzureUpdate]) -> bytes:
+        rows = [update.model_dump(include=set(self.schema.names)) for update in updates]
+        if rows:
+            self._writer.write_batch(self._pa.RecordBatch.from_pylist(rows, schema=self.schema))
+        return self._sink.take()
+
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._sink.take()
+
+
+def make_encoder(fmt: str) -> NdjsonEncoder | ArrowEncoder:
+    """Return an encoder for ``fmt``.
+
+    Raises:
+        ValueError: If the format is unknown or its optional dependency is missing.
+    """
+    if fmt == "ndjson":
+        return NdjsonEncoder()
+    if fmt in ("arrow", "parquet"):
+        return ArrowEncoder(parquet=fmt == "parquet")
+    raise ValueError(f"Invalid format: {fmt}. Valid values: {', '.join(FORMATS)}")
+
+
+# -- streaming ----------------------------------------------------------------
+
+
+async def stream_export(
+    encoder: NdjsonEncoder | ArrowEncoder,
+    filters: ExportFilters,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """Yield the encoded export of every update matching ``filters``, newest first.
+
+    A private store with no corpus yet is backfilled from upstream first.
+    """
+    from .sync import sync_once
+
+    store = get_store()
+    if not store.is_shared and await asyncio.to_thread(getattr, store, "version") == 0:
+        await sync_once(store)
+
+    after = None
+    while True:
+        items, after = await asyncio.to_thread(store.load_items_page, after, batch_size)
+        updates = (update for update in map(_parse_item, items) if update is not None)
+        chunk = encoder.encode(update for update in updates if filters.matches(update))
+        if chunk:
+            yield chunk
+        if after is None:
+            break
+
+    tail = encoder.finish()
+    if tail:
+        yield tail
+
+
+async def _write_export(output, encoder, filters: ExportFilters) -> None:
+    async for chunk in stream_export(encoder, filters):
+        output.write(chunk)
+    output.flush()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the ``export`` subcommand and return the process exit code."""
+    parser = argparse.ArgumentParser(
+        prog="azure-updates-mcp export",
+        description="Stream the Azure Updates corpus as NDJSON, Arrow IPC, or Parquet.",
+    )
+    parser.add_argument("--format", choices=list(FORMATS), default="ndjson")
+    parser.add_argument("--output", "-o", help="Output file (default: stdout)")
+    parser.add_argument("--status")
+    parser.add_argument("--product")
+    parser.add_argument("--product-category")
+    parser.add_argument("--date-field", choices=list(DATE_FIELDS), default="created")
+    parser.add_argument("--start-date")
+    parser.add_argument("--end-date")
+    args = parser.parse_args(argv)
+
+    try:
+        filters = build_filters(
+            status=args.status,
+            product=args.product,
+            product_category=args.product_category,
+            date_field=args.date_field,
+            start_date=args.start_date,
+            end_date=args.end_date,
+        )
+        encoder = make_encoder(args.format)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.output:
+        with open(args.output, "wb") as output:
+            asyncio.run(_write_export(output, encoder, filters))
+    else:
+        asyncio.run(_write_export(sys.stdout.buffer, encoder, filters))
+    return 0
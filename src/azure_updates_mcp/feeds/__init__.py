@@ -1 +1 @@
-"""Azure Updates JSON API client."""
+"""Azure Updates JSON API client and registry of sibling feeds."""
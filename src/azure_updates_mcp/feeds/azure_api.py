@@ -1,14 +1,50 @@
 """Azure Updates JSON API client for fetching and parsing updates."""
 
+import asyncio
+import os
+from collections import OrderedDict
 from datetime import datetime
 from urllib.parse import urlencode
 
 import httpx
 
+from .. import codec
+from ..deadline import DeadlineExceeded, current_deadline, upstream_timeout, within_deadline
+from ..index.text import strip_html
 from ..models.update import AzureUpdate
+from ..store import get_store
 
 AZURE_UPDATES_API_URL = "https://www.microsoft.com/releasecommunications/api/v2/azure"
 
+# Public page of an Azure update
+AZURE_UPDATE_LINK = "https://azure.microsoft.com/en-us/updates?id={id}"
+
+# Overrides the upstream URL, e.g. to point load tests at a local fake
+API_URL_ENV = "AZURE_UPDATES_API_URL"
+
+# Largest page requested when pulling the whole corpus
+CORPUS_PAGE_SIZE = 100
+
+# Page size for delta polls; most polls find the cursor on the first page
+DELTA_PAGE_SIZE = 25
+
+# Maximum concurrent page requests during a full corpus backfill
+BACKFILL_CONCURRENCY = 10
+
+# Extra items each backfill page reads into the next one, so updates published
+# mid-backfill (which push everything down) are not lost at page boundaries
+BACKFILL_PAGE_OVERLAP = 5
+
+# Share of @odata.count a full backfill must return to be trusted; a short read
+# (e.g. pages answered with an empty value) must not replace the corpus
+BACKFILL_MIN_COMPLETE = 0.9
+
+# Parsed updates kept for reuse by later API pages
+PARSED_CACHE_SIZE = 2048
+
+# (feed, id, modified) -> parsed update, least recently used first
+_parsed: OrderedDict[tuple, AzureUpdate] = OrderedDict()
+
 
 class AzureUpdatesQuery:
     """Builds OData-style query parameters for the Azure Updates API."""
@@ -21,6 +57,7 @@ class AzureUpdatesQuery:
         order_by: str = "created desc",
         count: bool = True,
         include_facets: bool = False,
+        base_url: str | None = None,
     ):
         self.search = search
         self.top = top
@@ -28,6 +65,8 @@ class AzureUpdatesQuery:
         self.order_by = order_by
         self.count = count
         self.include_facets = include_facets
+        # Feed endpoint; the Azure Updates API (or its override) when None
+        self.base_url = base_url
 
     def to_query_string(self) -> str:
         """Build a raw query string preserving literal $ in param names."""
@@ -48,7 +87,8 @@ class AzureUpdatesQuery:
 
     def to_url(self) -> str:
         """Build the full request URL."""
-        return f"{AZURE_UPDATES_API_URL}?{self.to_query_string()}"
+        base_url = self.base_url or os.getenv(API_URL_ENV) or AZURE_UPDATES_API_URL
+        return f"{base_url}?{self.to_query_string()}"
 
 
 def _parse_facets(data: dict) -> dict:
@@ -118,17 +158,13 @@ async def fetch_updates(
         include_facets=include_facets,
     )
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(query.to_url(), timeout=30.0)
-        response.raise_for_status()
-
-    data = response.json()
+    data = await fetch_raw(query)
     total_count = data.get("@odata.count", 0)
     items = data.get("value", [])
 
     updates = []
     for item in items:
-        update = _parse_item(item)
+        update = _parse_cached(item)
         if update:
             # Client-side status filter if specified
             if status and (not update.status or update.status.lower() != status.lower()):
@@ -140,11 +176,258 @@ async def fetch_updates(
     return updates, total_count, facets
 
 
-def _parse_item(item: dict) -> AzureUpdate | None:
+async def fetch_raw(
+    query: AzureUpdatesQuery,
+    use_cache: bool = True,
+    client: httpx.AsyncClient | None = None,
+) -> dict:
+    """Fetch one API page as decoded JSON.
+
+    Responses are cached in the shared store keyed by request URL, so repeated
+    queries (from this process or another worker) skip the upstream round-trip.
+
+    Under a call deadline the request times out (and is cancelled) when the
+    deadline passes. If it does, a recently expired cached copy of the response
+    is returned instead when there is one, and the deadline is marked stale.
+
+    Args:
+        query: The query to send.
+        use_cache: Whether to read from and write to the response cache.
+        client: Optional client to reuse pooled connections across requests.
+            A short-lived client is created when omitted.
+
+    Returns:
+        The decoded JSON response body.
+
+    Raises:
+        DeadlineExceeded: If the deadline passed with no cached copy to fall back to.
+    """
+    store = get_store()
+    url = query.to_url()
+
+    # Store calls run off the event loop: a corpus sync holds the store for
+    # the length of its rewrite
+    body = await asyncio.to_thread(store.get_response, url) if use_cache else None
+    if body is None:
+        deadline = current_deadline()
+        try:
+            body = await _get_body(url, client)
+        except (DeadlineExceeded, httpx.TimeoutException):
+            if deadline is None:
+                raise
+            body = (
+                await asyncio.to_thread(store.get_response, url, allow_stale=True)
+                if use_cache
+                else None
+            )
+            if body is None:
+                raise deadline.exceeded() from None
+            deadline.stale = True
+        else:
+            if use_cache:
+                await asyncio.to_thread(store.put_response, url, body)
+
+    return codec.loads(body)
+
+
+async def _get_body(url: str, client: httpx.AsyncClient | None) -> str:
+    """GET ``url`` within the call deadline and return the response text."""
+    timeout = upstream_timeout()
+    if client is None:
+        async with httpx.AsyncClient() as own_client:
+            response = await within_deadline(own_client.get(url, timeout=timeout))
+    else:
+        response = await within_deadline(client.get(url, timeout=timeout))
+    response.raise_for_status()
+    return response.text
+
+
+async def fetch_all_items(
+    page_size: int = CORPUS_PAGE_SIZE,
+    concurrency: int = BACKFILL_CONCURRENCY,
+) -> list[dict]:
+    """Fetch every raw API item with concurrent page requests.
+
+    The first page also returns ``@odata.count``, from which the remaining
+    pages are planned and fetched concurrently over one pooled client, with at
+    most ``concurrency`` requests in flight. Each page overlaps the next by
+    BACKFILL_PAGE_OVERLAP items and results are merged by id, so updates that
+    shift between pages during the backfill are neither lost nor duplicated.
+
+    Args:
+        page_size: Number of items each page advances by.
+        concurrency: Maximum number of page requests in flight.
+
+    Returns:
+        List of raw item dictionaries, newest first.
+
+    Raises:
+        ValueError: If far fewer items came back than ``@odata.count`` announced.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits) as client:
+
+        async def fetch_page(skip: int, count: bool = False) -> dict:
+            query = AzureUpdatesQuery(
+                top=page_size + BACKFILL_PAGE_OVERLAP,
+                skip=skip,
+                order_by="created desc",
+                count=count,
+            )
+            async with semaphore:
+                return await fetch_raw(query, use_cache=False, client=client)
+
+        first = await fetch_page(0, count=True)
+        total_count = first.get("@odata.count", 0)
+        rest = await asyncio.gather(
+            *(fetch_page(skip) for skip in range(page_size, total_count, page_size))
+        )
+
+    items_by_id: dict[str, dict] = {}
+    for page in (first, *rest):
+        for item in page.get("value", []):
+            item_id = str(item.get("id", ""))
+            if item_id:
+                items_by_id.setdefault(item_id, item)
+
+    if len(items_by_id) < total_count * BACKFILL_MIN_COMPLETE:
+        raise ValueError(
+            f"Incomplete corpus fetch: {len(items_by_id)} of {total_count} updates returned"
+        )
+    return list(items_by_id.values())
+
+
+async def fetch_updates_since(
+    modified_after: datetime,
+    after_id: str = "",
+    search: str | None = None,
+    status: str | None = None,
+    page_size: int = DELTA_PAGE_SIZE,
+) -> list[AzureUpdate]:
+    """Fetch updates created or modified after a ``(modified, id)`` position.
+
+    Pages through the API most recently modified first and stops at the first
+    page that reaches the position, so a poll with nothing new costs one small
+    request. Only items past the position are parsed.
+
+    Args:
+        modified_after: Modified timestamp of the position.
+        after_id: Update id of the position, breaking ties on equal timestamps.
+        search: Optional search term for server-side full-text search.
+        status: Optional status filter (applied client-side from results).
+        page_size: Number of items to request per page.
+
+    Returns:
+        Updates past the position, ordered oldest modification first.
+    """
+    position = (modified_after, after_id)
+    updates: list[AzureUpdate] = []
+    skip = 0
+
+    while True:
+        query = AzureUpdatesQuery(
+            search=search, top=page_size, skip=skip, order_by="modified desc", count=False
+        )
+        page = (await fetch_raw(query)).get("value", [])
+
+        crossed = False
+        for item in page:
+            modified = _parse_api_date(item.get("modified") or item.get("created"))
+            if modified is None:
+                continue
+            if modified < modified_after:
+                # Sorted by modified desc: everything after this is older
+                crossed = True
+                break
+            if (modified, str(item.get("id", ""))) <= position:
+                continue
+            update = _parse_cached(item)
+            if update is None:
+                continue
+            if status and (not update.status or update.status.lower() != status.lower()):
+                continue
+            updates.append(update)
+
+        if crossed or len(page) < page_size:
+            break
+        skip += page_size
+
+    updates.sort(key=change_position)
+    return updates
+
+
+def change_position(update: AzureUpdate) -> tuple[datetime, str]:
+    """Return the ``(modified, id)`` position of an update in modification order."""
+    return (update.modified or update.created, update.id)
+
+
+async def fetch_update_by_id(update_id: str) -> AzureUpdate | None:
+    """Look up a single update by id.
+
+    The local corpus is checked first while it is kept current; on a miss the
+    API is searched for the id.
+
+    Args:
+        update_id: The update's unique identifier.
+
+    Returns:
+        The matching AzureUpdate, or None if it does not exist.
+    """
+    from ..corpus import corpus_available
+
+    if await corpus_available():
+        item = await asyncio.to_thread(get_store().get_item, update_id)
+        if item is not None:
+            return _parse_item(item)
+
+    updates, _, _ = await fetch_updates(search=update_id, top=20)
+    for update in updates:
+        if update.id == update_id:
+            return update
+    return None
+
+
+def _parse_cached(
+    item: dict, feed: str | None = None, link_template: str | None = AZURE_UPDATE_LINK
+) -> AzureUpdate | None:
+    """Parse an API item, reusing the update parsed from an earlier copy of it.
+
+    Stripping and tokenizing the HTML description is most of the cost of a
+    page, and the same updates come back across pages, queries, and the
+    over-fetch of filtered searches. An update only changes upstream together
+    with its modified date, so copies are matched on ``(feed, id, modified)``.
+    Parsed updates are shared between callers and must not be mutated.
+    """
+    item_id, modified = item.get("id"), item.get("modified")
+    if not item_id or not modified:
+        return _parse_item(item, feed, link_template)
+
+    key = (feed, str(item_id), modified)
+    update = _parsed.get(key)
+    if update is not None:
+        _parsed.move_to_end(key)
+        return update
+
+    update = _parse_item(item, feed, link_template)
+    if update is not None:
+        _parsed[key] = update
+        if len(_parsed) > PARSED_CACHE_SIZE:
+            _parsed.popitem(last=False)
+    return update
+
+
+def _parse_item(
+    item: dict, feed: str | None = None, link_template: str | None = AZURE_UPDATE_LINK
+) -> AzureUpdate | None:
     """Parse a single JSON API item into an AzureUpdate.
 
     Args:
         item: A dictionary from the API response's 'value' array.
+        feed: Name of the feed the item came from, for federated results.
+        link_template: Public page URL with an ``{id}`` placeholder. When None,
+            the item's own ``link`` is used.
 
     Returns:
         AzureUpdate object or None if parsing fails.
@@ -152,7 +435,8 @@ def _parse_item(item: dict) -> AzureUpdate | None:
     try:
         item_id = str(item.get("id", ""))
         title = item.get("title", "")
-        description = item.get("description", "")
+        # Descriptions arrive as HTML; keep the plain text, tokenized once here
+        description = strip_html(item.get("description") or "")
         status = item.get("status", None)
 
         # Parse dates
@@ -160,7 +444,10 @@ def _parse_item(item: dict) -> AzureUpdate | None:
         modified = _parse_api_date(item.get("modified"))
 
         # Construct link
-        link = f"https://azure.microsoft.com/en-us/updates?id={item_id}" if item_id else ""
+        if link_template is None:
+            link = item.get("link") or ""
+        else:
+            link = link_template.format(id=item_id) if item_id else ""
 
         # Taxonomy fields are flat string lists in the API response
         products = [p for p in item.get("products", []) if isinstance(p, str)]
@@ -188,6 +475,7 @@ def _parse_item(item: dict) -> AzureUpdate | None:
             general_availability_date=ga_date,
             preview_availability_date=preview_date,
             private_preview_availability_date=private_preview_date,
+            feed=feed,
         )
     except Exception:
         return None
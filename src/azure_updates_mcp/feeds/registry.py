@@ -0,0 +1,154 @@
+"""Registry of release-communications feeds and federated fetching.
+
+Microsoft publishes several release-communications feeds with the same API
+shape as Azure Updates (OData-style ``search``/``top``/``skip``/``orderby``
+parameters and a ``value`` array of items). The built-in ``azure`` feed is the
+one every other tool reads; further feeds are registered through
+``AZURE_UPDATES_FEEDS`` as comma-separated ``name=url`` pairs, for example::
+
+    AZURE_UPDATES_FEEDS="m365=https://example.com/releasecommunications/api/v2/m365"
+
+A federated fetch requests the same page from each feed concurrently over one
+pooled client, so it takes as long as the slowest feed rather than the sum of
+all of them, and merges the pages (each already newest first) with a heap.
+"""
+
+import asyncio
+import heapq
+import os
+from dataclasses import dataclass, field
+
+import httpx
+
+from ..deadline import DeadlineExceeded
+from ..models.update import AzureUpdate
+from . import azure_api
+
+FEEDS_ENV = "AZURE_UPDATES_FEEDS"
+
+DEFAULT_FEED = "azure"
+
+
+@dataclass(frozen=True)
+class Feed:
+    """A release-communications feed with the Azure Updates API shape."""
+
+    name: str
+    # None means the Azure Updates API (or its AZURE_UPDATES_API_URL override)
+    url: str | None = None
+    # Public page URL with an {id} placeholder; None uses each item's own link
+    link_template: str | None = None
+
+
+@dataclass
+class FederatedPage:
+    """One page merged across feeds."""
+
+    # Newest first, each tagged with its feed
+    updates: list[AzureUpdate]
+    # Sum of the feeds' @odata.count totals
+    total: int
+    # Feed name -> error message for feeds that could not be read
+    errors: dict[str, str] = field(default_factory=dict)
+
+
+def get_feeds() -> dict[str, Feed]:
+    """Return every registered feed, keyed by name.
+
+    Raises:
+        ValueError: If AZURE_UPDATES_FEEDS is malformed.
+    """
+    feeds = {DEFAULT_FEED: Feed(DEFAULT_FEED, link_template=azure_api.AZURE_UPDATE_LINK)}
+    for entry in os.getenv(FEEDS_ENV, "").split(","):
+        if not entry.strip():
+            continue
+        name, sep, url = entry.partition("=")
+        name, url = name.strip().lower(), url.strip()
+        if not sep or not name or not url:
+            raise ValueError(f"Invalid {FEEDS_ENV} entry: {entry.strip()} (expected name=url)")
+        feeds[name] = Feed(name, url)
+    return feeds
+
+
+def resolve_feeds(names: list[str]) -> list[Feed]:
+    """Look up feeds by name (case-insensitive), keeping order and dropping repeats.
+
+    Raises:
+        ValueError: If a name is not registered.
+    """
+    registered = get_feeds()
+    feeds: list[Feed] = []
+    for name in names:
+        feed = registered.get(name.strip().lower())
+        if feed is None:
+            raise ValueError(f"Unknown feed: {name}. Valid values: {', '.join(registered)}")
+        if feed not in feeds:
+            feeds.append(feed)
+    return feeds
+
+
+async def fetch_feed_page(
+    feed: Feed,
+    client: httpx.AsyncClient,
+    search: str | None = None,
+    top: int = 20,
+    skip: int = 0,
+) -> tuple[list[AzureUpdate], int]:
+    """Fetch one page of ``feed``, newest first.
+
+    Returns:
+        Tuple of (updates tagged with the feed name, total count from the feed).
+    """
+    query = azure_api.AzureUpdatesQuery(search=search, top=top, skip=skip, base_url=feed.url)
+    data = await azure_api.fetch_raw(query, client=client)
+    updates = [
+        update
+        for update in (
+            azure_api._parse_cached(item, feed=feed.name, link_template=feed.link_template)
+            for item in data.get("value", [])
+        )
+        if update is not None
+    ]
+    return updates, data.get("@odata.count", 0)
+
+
+async def fetch_federated(
+    feeds: list[Feed],
+    search: str | None = None,
+    top: int = 20,
+    skip: int = 0,
+) -> FederatedPage:
+    """Fetch the same page from every feed concurrently and merge by ``created``.
+
+    A feed that fails (HTTP error, bad response, or the call deadline) is
+    reported in ``errors`` and the others are still merged.
+
+    Args:
+        feeds: Feeds to read.
+        search: Optional full-text search sent to every feed.
+        top: Items requested from each feed.
+        skip: Items skipped in each feed.
+
+    Returns:
+        The merged page: at most ``top`` items per feed, newest first.
+    """
+    async with httpx.AsyncClient() as client:
+        results = await asyncio.gather(
+            *(fetch_feed_page(feed, client, search, top, skip) for feed in feeds),
+            return_exceptions=True,
+        )
+
+    pages: list[list[AzureUpdate]] = []
+    total = 0
+    errors: dict[str, str] = {}
+    for feed, result in zip(feeds, results):
+        if isinstance(result, (httpx.HTTPError, ValueError, DeadlineExceeded)):
+            errors[feed.name] = str(result) or type(result).__name__
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            pages.append(result[0])
+            total += result[1]
+
+    merged = heapq.merge(*pages, key=lambda u: (u.created, u.id), reverse=True)
+    return FederatedPage(list(merged), total, errors)
@@ -0,0 +1,28 @@
+"""In-memory indexes built once over the local updates corpus."""
+
+from .columns import TAXONOMY_FIELDS, CategoricalColumn, build_columns
+from .dates import DATE_FIELDS, DateColumn, DateIndex, parse_date_value
+from .groupby import grouped_counts
+from .minhash import group_near_duplicates
+from .similarity import SimilarityIndex
+from .taxonomy import Resolution, TaxonomyResolver
+from .text import snippet, strip_html, token_spans, tokenize
+
+__all__ = [
+    "DATE_FIELDS",
+    "TAXONOMY_FIELDS",
+    "CategoricalColumn",
+    "DateColumn",
+    "DateIndex",
+    "Resolution",
+    "SimilarityIndex",
+    "TaxonomyResolver",
+    "build_columns",
+    "group_near_duplicates",
+    "grouped_counts",
+    "parse_date_value",
+    "snippet",
+    "strip_html",
+    "token_spans",
+    "tokenize",
+]
@@ -0,0 +1,55 @@
+"""Dictionary-encoded taxonomy columns.
+
+Each taxonomy field is stored as a label table plus two parallel arrays of
+``(row, code)`` pairs, one pair per value an update carries. Multi-valued fields
+such as products simply contribute several pairs for the same row, so grouping
+and filtering work the same way for every field.
+"""
+
+from array import array
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..models.update import AzureUpdate
+
+# Taxonomy fields and how to read each from an update as a list of labels
+TAXONOMY_FIELDS: dict[str, Callable[["AzureUpdate"], list[str]]] = {
+    "status": lambda u: [u.status] if u.status else [],
+    "product": lambda u: u.products,
+    "product_category": lambda u: u.product_categories,
+    "tag": lambda u: u.tags,
+}
+
+
+class CategoricalColumn:
+    """One taxonomy field as a label table and ``(row, code)`` pair arrays."""
+
+    def __init__(self, values: list[list[str]]):
+        self.labels: list[str] = []
+        codes_by_label: dict[str, int] = {}
+        self.rows = array("l")
+        self.codes = array("l")
+        for row, labels in enumerate(values):
+            for label in dict.fromkeys(labels):
+                code = codes_by_label.setdefault(label, len(self.labels))
+                if code == len(self.labels):
+                    self.labels.append(label)
+                self.rows.append(row)
+                self.codes.append(code)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def rows_with(self, label: str) -> set[int]:
+        """Return the rows carrying ``label`` (case-insensitive exact match)."""
+        wanted = {code for code, name in enumerate(self.labels) if name.lower() == label.lower()}
+        return {row for row, code in zip(self.rows, self.codes) if code in wanted}
+
+
+def build_columns(updates: list["AzureUpdate"]) -> dict[str, CategoricalColumn]:
+    """Build a CategoricalColumn for every field in TAXONOMY_FIELDS."""
+    return {
+        field: CategoricalColumn([read(update) for update in updates])
+        for field, read in TAXONOMY_FIELDS.items()
+    }
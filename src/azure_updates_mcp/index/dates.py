@@ -0,0 +1,133 @@
+"""Sorted date columns with binary-search range lookup.
+
+Every date field of every update is parsed once when the corpus is built and
+stored as epoch seconds in an ascending ``array('q')``, alongside the row number
+of the update it came from. A range query is two bisections and a slice, so
+"GA between X and Y" costs O(log n + k) instead of a parse-and-compare pass over
+all updates.
+"""
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..models.update import AzureUpdate
+
+_QUARTER_RE = re.compile(r"^Q([1-4])\s*(?:CY)?\s*(\d{4})$", re.IGNORECASE)
+_YEAR_MONTH_RE = re.compile(r"^(\d{4})-(\d{1,2})$")
+_YEAR_RE = re.compile(r"^(\d{4})$")
+
+
+def parse_date_value(value: str | datetime | None) -> datetime | None:
+    """Parse an API date value into a naive UTC datetime.
+
+    Accepts ISO dates and datetimes as well as the coarser forms used by the
+    availability fields ("2025-03", "March 2025", "Q1 2025", "2025"). Coarse
+    values map to the first day of the period.
+
+    Args:
+        value: Raw date string, an already parsed datetime, or None.
+
+    Returns:
+        datetime or None if the value is empty or unrecognised.
+    """
+    if value is None or isinstance(value, datetime):
+        return value
+    text = value.strip()
+    if not text:
+        return None
+
+    try:
+        dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return dt
+    except ValueError:
+        pass
+
+    if match := _QUARTER_RE.match(text):
+        quarter, year = int(match.group(1)), int(match.group(2))
+        return datetime(year, 3 * (quarter - 1) + 1, 1)
+    if match := _YEAR_MONTH_RE.match(text):
+        year, month = int(match.group(1)), int(match.group(2))
+        return datetime(year, month, 1) if 1 <= month <= 12 else None
+    if match := _YEAR_RE.match(text):
+        return datetime(int(match.group(1)), 1, 1)
+    for fmt in ("%B %Y", "%b %Y"):
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def to_epoch(dt: datetime) -> int:
+    """Convert a naive UTC datetime to epoch seconds."""
+    return int(dt.replace(tzinfo=timezone.utc).timestamp())
+
+
+def to_month(dt: datetime) -> int:
+    """Convert a datetime to a month number (months since year 0)."""
+    return dt.year * 12 + dt.month - 1
+
+
+# Queryable date fields and how to read each from an update
+DATE_FIELDS: dict[str, Callable[["AzureUpdate"], str | datetime | None]] = {
+    "created": lambda u: u.created,
+    "modified": lambda u: u.modified,
+    "general_availability": lambda u: u.general_availability_date,
+    "preview": lambda u: u.preview_availability_date,
+    "private_preview": lambda u: u.private_preview_availability_date,
+}
+
+
+class DateColumn:
+    """One date field as parallel sorted arrays of epoch seconds and row numbers."""
+
+    def __init__(self, pairs: Iterable[tuple[int, int]]):
+        ordered = sorted(pairs)
+        self.epochs = array("q", (epoch for epoch, _ in ordered))
+        self.rows = array("l", (row for _, row in ordered))
+
+    def __len__(self) -> int:
+        return len(self.epochs)
+
+    def rows_between(self, start: datetime | None, end: datetime | None) -> array:
+        """Return row numbers whose date lies in ``[start, end]`` (either bound optional)."""
+        lo = bisect_left(self.epochs, to_epoch(start)) if start is not None else 0
+        hi = bisect_right(self.epochs, to_epoch(end)) if end is not None else len(self.epochs)
+        return self.rows[lo:hi] if lo < hi else array("l")
+
+
+class DateIndex:
+    """Date columns for every field in DATE_FIELDS over one corpus snapshot.
+
+    Alongside each sorted column, ``months[field]`` holds the month number of
+    every row in row order (-1 where the date is missing), for grouping.
+    """
+
+    def __init__(self, updates: list["AzureUpdate"]):
+        self.columns: dict[str, DateColumn] = {}
+        self.months: dict[str, array] = {}
+        for field, read in DATE_FIELDS.items():
+            pairs = []
+            months = array("l", [-1]) * len(updates)
+            for row, update in enumerate(updates):
+                dt = parse_date_value(read(update))
+                if dt is not None:
+                    pairs.append((to_epoch(dt), row))
+                    months[row] = to_month(dt)
+            self.columns[field] = DateColumn(pairs)
+            self.months[field] = months
+
+    def rows_between(self, field: str, start: datetime | None, end: datetime | None) -> list[int]:
+        """Return row numbers with ``field`` in ``[start, end]``, in row order.
+
+        Raises:
+            KeyError: If ``field`` is not one of DATE_FIELDS.
+        """
+        return sorted(self.columns[field].rows_between(start, end))
@@ -0,0 +1,74 @@
+"""Grouped counts over corpus columns.
+
+Counts ``(period, code)`` pairs for a taxonomy column joined with a per-row
+period column. With NumPy installed the join, mask and count run as array
+operations (``np.bincount`` over a combined key); otherwise the same loop runs
+over the stdlib arrays with a Counter. NumPy is imported on first use only, so
+search requests that never group do not pay for it.
+"""
+
+from array import array
+from collections import Counter
+
+
+def grouped_counts(
+    pair_rows: array,
+    pair_codes: array,
+    row_months: array,
+    selected: bytearray,
+    months_per_period: int = 1,
+) -> dict[tuple[int, int], int]:
+    """Count taxonomy codes per period over the selected rows.
+
+    Args:
+        pair_rows: Row number of every ``(row, code)`` pair of the column.
+        pair_codes: Label code of every pair, parallel to ``pair_rows``.
+        row_months: Month number of every row (-1 where the date is missing).
+        selected: One byte per row, non-zero for rows to include.
+        months_per_period: 1 to group by month, 3 by quarter, 12 by year.
+
+    Returns:
+        Dictionary mapping ``(period, code)`` to a count, where period is the
+        month number divided by ``months_per_period``.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        return _grouped_counts_numpy(
+            np, pair_rows, pair_codes, row_months, selected, months_per_period
+        )
+
+    counts: Counter = Counter()
+    for row, code in zip(pair_rows, pair_codes):
+        month = row_months[row]
+        if selected[row] and month >= 0:
+            counts[month // months_per_period, code] += 1
+    return dict(counts)
+
+
+def _grouped_counts_numpy(
+    np,
+    pair_rows: array,
+    pair_codes: array,
+    row_months: array,
+    selected: bytearray,
+    months_per_period: int,
+) -> dict[tuple[int, int], int]:
+    rows = np.asarray(pair_rows)
+    months = np.asarray(row_months)[rows]
+    keep = np.frombuffer(selected, dtype=np.bool_)[rows] & (months >= 0)
+    if not keep.any():
+        return {}
+
+    periods = months[keep] // months_per_period
+    codes = np.asarray(pair_codes)[keep]
+    width = int(codes.max()) + 1
+    first = int(periods.min())
+    counts = np.bincount((periods - first) * width + codes)
+    return {
+        (first + int(key) // width, int(key) % width): int(counts[key])
+        for key in np.flatnonzero(counts)
+    }
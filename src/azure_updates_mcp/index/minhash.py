@@ -0,0 +1,79 @@
+"""MinHash signatures and LSH banding for near-duplicate detection.
+
+Azure often publishes the same announcement several times (per region, or
+re-posted with a small wording change). Two updates whose word 3-gram sets
+have an estimated Jaccard similarity of at least DUPLICATE_THRESHOLD are
+treated as near duplicates. LSH banding (8 bands of 8 rows) keeps the pairwise
+check to updates that already agree on a whole band.
+"""
+
+import random
+import zlib
+from typing import TYPE_CHECKING
+
+from .text import tokenize
+
+if TYPE_CHECKING:
+    from ..models.update import AzureUpdate
+
+NUM_PERM = 64
+LSH_BANDS = 8
+DUPLICATE_THRESHOLD = 0.8
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+def shingles(update: "AzureUpdate", size: int = 3) -> set[int]:
+    """Return hashed word ``size``-grams of an update's title and description."""
+    words = tokenize(update.title + " " + update.description)
+    if len(words) < size:
+        return {zlib.crc32(" ".join(words).encode())}
+    return {
+        zlib.crc32(" ".join(words[i : i + size]).encode()) for i in range(len(words) - size + 1)
+    }
+
+
+def signature(hashed: set[int]) -> tuple[int, ...]:
+    """Return the MinHash signature of a set of hashed shingles."""
+    return tuple(min((a * x + b) % _PRIME for x in hashed) for a, b in _PERMUTATIONS)
+
+
+def estimated_jaccard(left: tuple[int, ...], right: tuple[int, ...]) -> float:
+    """Estimate Jaccard similarity from two signatures."""
+    return sum(x == y for x, y in zip(left, right)) / len(left)
+
+
+def group_near_duplicates(updates: list["AzureUpdate"]) -> list[list[int]]:
+    """Group near-duplicate updates, preserving the input order.
+
+    Returns:
+        List of groups of indexes into ``updates``. Each group starts with the
+        first occurrence, which is the one to keep.
+    """
+    signatures = [signature(shingles(update)) for update in updates]
+    rows_per_band = NUM_PERM // LSH_BANDS
+    buckets: dict[tuple, list[int]] = {}
+    parent = list(range(len(updates)))
+
+    def root(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, sig in enumerate(signatures):
+        for band in range(LSH_BANDS):
+            key = (band, sig[band * rows_per_band : (band + 1) * rows_per_band])
+            for j in buckets.setdefault(key, []):
+                if root(i) != root(j) and (
+                    estimated_jaccard(signatures[i], signatures[j]) >= DUPLICATE_THRESHOLD
+                ):
+                    parent[max(root(i), root(j))] = min(root(i), root(j))
+            buckets[key].append(i)
+
+    groups: dict[int, list[int]] = {}
+    for i in range(len(updates)):
+        groups.setdefault(root(i), []).append(i)
+    return list(groups.values())
@@ -0,0 +1,119 @@
+"""Hashed TF-IDF vectors for "more like this" lookups.
+
+Every update becomes a sparse TF-IDF vector over hashed features: word tokens
+from the title (counted twice) and description, plus each taxonomy label as a
+single feature. Features are hashed into 2**20 buckets with CRC32, so there is
+no vocabulary to store and the result is the same in every process.
+
+Vectors are L2-normalised and kept twice in flat arrays: by update (to read a
+query vector) and by feature (postings, to score every update sharing a feature
+with the query). Cosine similarity is then one accumulation over the query's
+postings: ``np.bincount`` with NumPy installed, a dict otherwise.
+"""
+
+import math
+import zlib
+from array import array
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from .text import tokenize
+
+if TYPE_CHECKING:
+    from ..models.update import AzureUpdate
+
+HASH_BITS = 20
+_HASH_MASK = (1 << HASH_BITS) - 1
+
+
+def _hash_feature(feature: str) -> int:
+    return zlib.crc32(feature.encode()) & _HASH_MASK
+
+
+def update_features(update: "AzureUpdate") -> Counter:
+    """Return hashed feature counts for one update."""
+    title = tokenize(update.title)
+    words = title + title + tokenize(update.description)
+    labels = [f"status:{update.status}"] if update.status else []
+    labels += [f"product:{p}" for p in update.products]
+    labels += [f"category:{pc}" for pc in update.product_categories]
+    labels += [f"tag:{t}" for t in update.tags]
+    return Counter(_hash_feature(feature) for feature in words + [x.lower() for x in labels])
+
+
+class SimilarityIndex:
+    """Sparse TF-IDF matrix over one corpus snapshot with cosine top-k."""
+
+    def __init__(self, updates: list["AzureUpdate"]):
+        counts = [update_features(update) for update in updates]
+        self.size = len(updates)
+
+        df: Counter = Counter()
+        for features in counts:
+            df.update(features.keys())
+        idf = {f: math.log((1 + self.size) / (1 + n)) + 1.0 for f, n in df.items()}
+
+        # By update: row r's features are doc_features[doc_ptr[r]:doc_ptr[r + 1]]
+        self.doc_ptr = array("l", [0])
+        self.doc_features = array("l")
+        self.doc_weights = array("d")
+        triples = []
+        for row, features in enumerate(counts):
+            weights = {f: (1.0 + math.log(tf)) * idf[f] for f, tf in features.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for f, w in sorted(weights.items()):
+                self.doc_features.append(f)
+                self.doc_weights.append(w / norm)
+                triples.append((f, row, w / norm))
+            self.doc_ptr.append(len(self.doc_features))
+
+        # By feature: postings of feature f are post_rows[start:end]
+        triples.sort()
+        self.post_rows = array("l", (row for _, row, _ in triples))
+        self.post_weights = array("d", (w for _, _, w in triples))
+        self.postings: dict[int, tuple[int, int]] = {}
+        for i, (f, _, _) in enumerate(triples):
+            start, _ = self.postings.get(f, (i, i))
+            self.postings[f] = (start, i + 1)
+
+    def scores(self, row: int) -> dict[int, float]:
+        """Return cosine similarity of ``row`` to every update sharing a feature."""
+        lo, hi = self.doc_ptr[row], self.doc_ptr[row + 1]
+        if lo == hi:
+            # No words or labels: nothing to compare (and nothing to concatenate)
+            return {}
+        query = zip(self.doc_features[lo:hi], self.doc_weights[lo:hi])
+
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if np is not None:
+            rows = np.frombuffer(self.post_rows, dtype=np.dtype(self.post_rows.typecode))
+            weights = np.frombuffer(self.post_weights, dtype=np.float64)
+            parts_rows, parts_weights = [], []
+            for f, wq in query:
+                start, end = self.postings[f]
+                parts_rows.append(rows[start:end])
+                parts_weights.append(weights[start:end] * wq)
+            totals = np.bincount(
+                np.concatenate(parts_rows),
+                weights=np.concatenate(parts_weights),
+                minlength=self.size,
+            )
+            hits = np.flatnonzero(totals)
+            return dict(zip(hits.tolist(), totals[hits].tolist()))
+
+        totals: dict[int, float] = {}
+        for f, wq in query:
+            start, end = self.postings[f]
+            for other, w in zip(self.post_rows[start:end], self.post_weights[start:end]):
+                totals[other] = totals.get(other, 0.0) + w * wq
+        return totals
+
+    def most_similar(self, row: int) -> list[tuple[int, float]]:
+        """Return ``(row, score)`` for every other related update, best first."""
+        ranked = [(other, score) for other, score in self.scores(row).items() if other != row]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked
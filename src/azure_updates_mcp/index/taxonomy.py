@@ -0,0 +1,170 @@
+"""Typo-tolerant resolution of taxonomy names.
+
+Agents often pass "AKS", "Kubernetes Svc", or "Azure Kubernets Service" where
+the API knows "Azure Kubernetes Service". The resolver is built from facet data
+(every product, product category, and tag with its count) and maps such inputs
+to a canonical name in three steps:
+
+1. exact match after normalising case and punctuation;
+2. alias match: acronyms ("aks"), parenthesised short names, and names without
+   the "Azure"/"Microsoft" prefix;
+3. trigram similarity (as in PostgreSQL's pg_trgm), looked up through a
+   trigram -> names inverted index, accepting the best score of at least
+   TRIGRAM_THRESHOLD.
+
+Ties go to the more frequent name.
+"""
+
+import re
+from dataclasses import dataclass
+
+TRIGRAM_THRESHOLD = 0.35
+
+# Facet keys searched for each filter
+FIELD_FACETS = {
+    "product": ("products",),
+    "product_category": ("product_categories",),
+    "category": ("products", "product_categories", "tags"),
+}
+
+_VENDOR_PREFIXES = ("azure ", "microsoft ")
+
+# Common shorthand in agent queries, expanded before matching
+_ABBREVIATIONS = {
+    "svc": "service",
+    "svcs": "services",
+    "mgmt": "management",
+    "k8s": "kubernetes",
+    "func": "functions",
+    "fn": "functions",
+}
+
+_NON_WORD_RE = re.compile(r"[^a-z0-9+#]+")
+_PAREN_RE = re.compile(r"\(([^)]*)\)")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, turn "&" into "and", and collapse punctuation to single spaces."""
+    return " ".join(_NON_WORD_RE.sub(" ", name.lower().replace("&", " and ")).split())
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the pg_trgm style trigrams of a normalised string."""
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _aliases(name: str) -> set[str]:
+    normalized = normalize_name(name)
+    aliases = set()
+    for short in _PAREN_RE.findall(name):
+        aliases.add(normalize_name(short))
+    base = normalize_name(_PAREN_RE.sub(" ", name))
+    aliases.add(base)
+    for prefix in _VENDOR_PREFIXES:
+        if base.startswith(prefix):
+            aliases.add(base[len(prefix) :])
+    words = base.split()
+    if len(words) >= 2:
+        acronym = "".join(word[0] for word in words)
+        if len(acronym) >= 3:
+            aliases.add(acronym)
+    aliases.discard(normalized)
+    aliases.discard("")
+    return aliases
+
+
+@dataclass(frozen=True)
+class Resolution:
+    """A fuzzy input resolved to a canonical taxonomy name."""
+
+    name: str
+    match: str  # "exact", "alias", or "trigram"
+    score: float
+
+    def to_dict(self, value: str) -> dict:
+        return {"input": value, "name": self.name, "match": self.match, "score": self.score}
+
+
+class _NameIndex:
+    """Exact, alias, and trigram lookups over one list of names."""
+
+    def __init__(self, counts: dict[str, int]):
+        self.names = sorted(counts, key=lambda n: (-counts[n], n))
+        self.exact: dict[str, str] = {}
+        self.aliases: dict[str, str] = {}
+        self.grams: list[set[str]] = []
+        self.postings: dict[str, list[int]] = {}
+
+        # Names are in descending frequency, so setdefault keeps the most
+        # frequent name for a shared key
+        for i, name in enumerate(self.names):
+            normalized = normalize_name(name)
+            self.exact.setdefault(normalized, name)
+            for alias in _aliases(name):
+                self.aliases.setdefault(alias, name)
+            grams = trigrams(normalized)
+            self.grams.append(grams)
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(i)
+
+    def lookup(self, normalized: str) -> Resolution | None:
+        if normalized in self.exact:
+            return Resolution(self.exact[normalized], "exact", 1.0)
+        if normalized in self.aliases:
+            return Resolution(self.aliases[normalized], "alias", 1.0)
+
+        query = trigrams(normalized)
+        shared: dict[int, int] = {}
+        for gram in query:
+            for i in self.postings.get(gram, ()):
+                shared[i] = shared.get(i, 0) + 1
+        best = None
+        for i, common in shared.items():
+            score = common / (len(query) + len(self.grams[i]) - common)
+            if best is None or score > best[0] or (score == best[0] and i < best[1]):
+                best = (score, i)
+        if best is None or best[0] < TRIGRAM_THRESHOLD:
+            return None
+        return Resolution(self.names[best[1]], "trigram", round(best[0], 3))
+
+
+class TaxonomyResolver:
+    """Resolve fuzzy product, product category, and category names."""
+
+    def __init__(self, facets: dict):
+        """Build the indexes from facets in the API/count_facets shape."""
+        self._indexes: dict[str, _NameIndex] = {}
+        for field, keys in FIELD_FACETS.items():
+            counts: dict[str, int] = {}
+            for key in keys:
+                for entry in facets.get(key) or []:
+                    counts[entry["name"]] = counts.get(entry["name"], 0) + entry["count"]
+            self._indexes[field] = _NameIndex(counts)
+
+    def knows(self, field: str, value: str) -> bool:
+        """Whether ``value`` already matches a name as the filter would.
+
+        product and product_category filters match names exactly (ignoring
+        case); category matches any name containing it.
+        """
+        value = value.lower()
+        names = self._indexes[field].names
+        if field == "category":
+            return any(value in name.lower() for name in names)
+        return any(value == name.lower() for name in names)
+
+    def resolve(self, field: str, value: str) -> Resolution | None:
+        """Return the canonical name ``value`` most likely refers to, or None."""
+        index = self._indexes[field]
+        normalized = normalize_name(value)
+        expanded = " ".join(_ABBREVIATIONS.get(word, word) for word in normalized.split())
+
+        candidates = [index.lookup(normalized)]
+        if expanded != normalized:
+            candidates.append(index.lookup(expanded))
+        found = [c for c in candidates if c is not None]
+        return max(found, key=lambda c: c.score) if found else None
@@ -0,0 +1,83 @@
+"""Text normalisation shared by the text indexes and response snippets."""
+
+import re
+from array import array
+from html import unescape
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_PATTERN = r"[a-z0-9]+(?:[.+#][a-z0-9]+)*[#+]*"
+_TOKEN_RE = re.compile(_TOKEN_PATTERN)
+_TOKEN_SPAN_RE = re.compile(_TOKEN_PATTERN, re.IGNORECASE)
+
+# Upper bound on snippet length in characters, excluding highlight markers
+SNIPPET_CHARS = 240
+HIGHLIGHT = "**"
+ELLIPSIS = "…"
+
+
+def strip_html(text: str) -> str:
+    """Drop HTML tags and decode entities, collapsing runs of whitespace."""
+    return " ".join(unescape(_TAG_RE.sub(" ", text)).split())
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens (keeping "v12.0", "c#", "ai+ml" whole)."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def token_spans(text: str) -> array:
+    """Return the character offsets of every token as a flat start, end, ... array."""
+    spans = array("l")
+    for match in _TOKEN_SPAN_RE.finditer(text):
+        spans.extend(match.span())
+    return spans
+
+
+def snippet(text: str, spans: array, terms: list[str], max_chars: int = SNIPPET_CHARS) -> str:
+    """Return a bounded excerpt of ``text`` around the first query match.
+
+    Tokens starting with any of ``terms`` (lowercase) are wrapped in HIGHLIGHT
+    markers. The window opens a little before the first match and is cut on
+    token boundaries, with an ellipsis wherever text was left out. Without a
+    match the excerpt is the start of the text.
+
+    Args:
+        text: Plain text (as stored on the update).
+        spans: Token offsets of ``text`` from token_spans().
+        terms: Lowercase query tokens to highlight.
+        max_chars: Maximum excerpt length, not counting markers and ellipses.
+    """
+    bounds = list(zip(spans[::2], spans[1::2]))
+    hits = (
+        [
+            i
+            for i, (start, end) in enumerate(bounds)
+            if text[start:end].lower().startswith(tuple(terms))
+        ]
+        if terms
+        else []
+    )
+
+    if len(text) <= max_chars:
+        lo, hi = 0, len(text)
+    else:
+        # Start about a fifth of the window before the first match
+        anchor = bounds[hits[0]][0] if hits else 0
+        lo = max(0, anchor - max_chars // 5)
+        lo = next((start for start, end in bounds if end > lo), lo) if lo else 0
+        hi = min(len(text), lo + max_chars)
+        if hi < len(text):
+            hi = max((end for start, end in bounds if lo < end <= hi), default=hi)
+
+    parts = [ELLIPSIS] if lo > 0 else []
+    position = lo
+    for i in hits:
+        start, end = bounds[i]
+        if start < lo or end > hi:
+            continue
+        parts += [text[position:start], HIGHLIGHT, text[start:end], HIGHLIGHT]
+        position = end
+    parts.append(text[position:hi])
+    if hi < len(text):
+        parts.append(ELLIPSIS)
+    return "".join(parts).strip()
@@ -1,8 +1,11 @@
 """Pydantic models for Azure Updates."""
 
+from array import array
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from ..index.text import token_spans
 
 
 class AzureUpdate(BaseModel):
@@ -11,7 +14,7 @@ class AzureUpdate(BaseModel):
     id: str = Field(description="Unique identifier for the update")
     title: str = Field(description="Update headline")
     link: str = Field(description="URL to the full update page")
-    description: str = Field(description="Summary text of the update")
+    description: str = Field(description="Summary text of the update (plain text)")
     status: str | None = Field(
         default=None,
         description="Update status: Launched, In preview, In development, or Retirements",
@@ -39,6 +42,20 @@ class AzureUpdate(BaseModel):
         default=None, description="Private preview availability date string"
     )
 
+    # Set on results of federated searches across several feeds
+    feed: str | None = Field(default=None, description="Name of the feed the update came from")
+
+    # Token offsets into description, computed once when the update is built
+    _token_spans: array = PrivateAttr(default_factory=lambda: array("l"))
+
+    def model_post_init(self, context) -> None:
+        self._token_spans = token_spans(self.description)
+
+    @property
+    def token_spans(self) -> array:
+        """Flat start, end character offsets of the description's word tokens."""
+        return self._token_spans
+
     # Backward-compat properties
     @property
     def guid(self) -> str:
@@ -77,4 +94,6 @@ class AzureUpdate(BaseModel):
             "pub_date": self.created.isoformat(),
             "categories": self.categories,
         }
+        if self.feed:
+            result["feed"] = self.feed
         return result
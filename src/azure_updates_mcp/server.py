@@ -2,13 +2,44 @@
 
 import logging
 import os
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+
+from .cache import ToolResultCache
+from .codec import tool_serializer
+from .tools.analytics import azure_updates_analytics
+from .tools.changes import azure_updates_changes, latest_changes
+from .tools.diff import azure_updates_diff
+from .tools.search import azure_updates_search
 
 # Suppress FastMCP's INFO logs to reduce console noise
 logging.getLogger("fastmcp").setLevel(logging.WARNING)
 
-from .tools.search import azure_updates_search
+# Mirrors store.sqlite.STORE_PATH_ENV; not imported so stdio startup skips sqlite3
+STORE_PATH_ENV = "AZURE_UPDATES_STORE"
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[dict]:
+    """Start the background corpus sync for HTTP servers and shared stores.
+
+    A stdio server with a private in-memory store serves a single client, so it
+    skips the sync (and its imports) to keep startup lean and upstream load low.
+    """
+    if os.getenv("MCP_TRANSPORT", "stdio") != "http" and not os.getenv(STORE_PATH_ENV):
+        yield {}
+        return
+
+    from .sync import background_sync
+
+    async with background_sync():
+        yield {}
+
 
 # Create the MCP server
 mcp = FastMCP(
@@ -18,28 +49,127 @@ mcp = FastMCP(
         "Use azure_updates_search to find, filter, and retrieve updates. "
         "Set include_facets=True to get taxonomy counts (product categories, "
         "products, tags, statuses). Use limit=0 with include_facets=True for "
-        "a facets-only response to discover available filter values."
+        "a facets-only response to discover available filter values. "
+        "To follow new and modified updates, call azure_updates_changes and pass "
+        "its next_cursor on later calls instead of re-running searches. "
+        "For counts over time (per month, quarter, or year by status, product, "
+        "product category, or tag), use azure_updates_analytics. "
+        "To see what changed between two dates (new updates, status transitions, "
+        "moved availability dates), use azure_updates_diff."
     ),
+    lifespan=lifespan,
+    tool_serializer=tool_serializer(),
 )
 
 # Register tools
 mcp.tool(azure_updates_search)
+mcp.tool(azure_updates_changes)
+mcp.tool(azure_updates_analytics)
+mcp.tool(azure_updates_diff)
+
+# Serve repeated calls from memory until the corpus changes
+result_cache = ToolResultCache(
+    {
+        "azure_updates_search": azure_updates_search,
+        "azure_updates_analytics": azure_updates_analytics,
+    }
+)
+mcp.add_middleware(result_cache)
+
+# Register resources
+mcp.resource(
+    "azure-updates://changes",
+    name="azure_updates_latest_changes",
+    mime_type="application/json",
+)(latest_changes)
+
+
+# Register HTTP routes
+@mcp.custom_route("/export", methods=["GET"])
+async def export_route(request: Request) -> Response:
+    """Stream the filtered corpus as NDJSON, Arrow IPC, or Parquet.
+
+    Query parameters mirror the ``export`` subcommand: format, status, product,
+    product_category, date_field, start_date, and end_date.
+    """
+    from .export import FORMATS, build_filters, make_encoder, stream_export
+
+    params = request.query_params
+    fmt = params.get("format", "ndjson")
+    try:
+        filters = build_filters(
+            status=params.get("status"),
+            product=params.get("product"),
+            product_category=params.get("product_category"),
+            date_field=params.get("date_field", "created"),
+            start_date=params.get("start_date"),
+            end_date=params.get("end_date"),
+        )
+        encoder = make_encoder(fmt)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+
+    return StreamingResponse(
+        stream_export(encoder, filters),
+        media_type=FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="azure-updates.{fmt}"'},
+    )
+
+
+def http_app():
+    """Build the ASGI app for one HTTP worker process.
+
+    Used as the uvicorn app factory when MCP_WORKERS > 1. Requests from one MCP
+    session may land on any worker, so the transport runs stateless.
+    """
+    return mcp.http_app(path="/mcp", stateless_http=True)
 
 
 def main():
     """Run the MCP server.
 
     Uses stdio transport by default (for MCP client auto-start).
-    Set MCP_TRANSPORT=http to run as an HTTP server for remote access.
+    Set MCP_TRANSPORT=http to run as an HTTP server for remote access, and
+    MCP_WORKERS to the number of worker processes to serve it with. Workers share
+    the corpus and response cache through the SQLite store at AZURE_UPDATES_STORE
+    (a temp-dir default is used when unset), and one elected worker syncs it.
+
+    ``azure-updates-mcp export ...`` streams the corpus to a file or stdout
+    instead of starting the server (see ``--help``).
     """
+    if sys.argv[1:2] == ["export"]:
+        from .export import main as export_main
+
+        sys.exit(export_main(sys.argv[2:]))
+
     transport = os.getenv("MCP_TRANSPORT", "stdio")
 
     if transport == "http":
         host = os.getenv("MCP_HOST", "0.0.0.0")
         port = int(os.getenv("MCP_PORT", "8000"))
+        workers = int(os.getenv("MCP_WORKERS", "1"))
         print(f"Starting Azure Updates MCP server on {host}:{port}")
         print(f"MCP endpoint: http://{host}:{port}/mcp")
-        mcp.run(transport="http", host=host, port=port, show_banner=False)
+
+        if workers > 1:
+            import uvicorn
+
+            from .store.sqlite import default_store_path
+
+            # Worker processes inherit the environment, so they all open this path
+            os.environ.setdefault(STORE_PATH_ENV, default_store_path())
+            print(f"Workers: {workers} (shared store: {os.environ[STORE_PATH_ENV]})")
+            uvicorn.run(
+                "azure_updates_mcp.server:http_app",
+                factory=True,
+                host=host,
+                port=port,
+                workers=workers,
+                lifespan="on",
+                timeout_graceful_shutdown=0,
+            )
+        else:
+            mcp.run(transport="http", host=host, port=port, show_banner=False)
     else:
         # stdio transport (default for MCP client auto-start)
         mcp.run(transport="stdio", show_banner=False)
@@ -0,0 +1,5 @@
+"""Local storage for the updates corpus, its history, and upstream response cache."""
+
+from .sqlite import HISTORY_FIELDS, UpdateStore, get_store
+
+__all__ = ["HISTORY_FIELDS", "UpdateStore", "get_store"]
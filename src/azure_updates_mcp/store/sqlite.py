@@ -0,0 +1,457 @@
+"""SQLite-backed store shared by every server process on a host.
+
+The store keeps four things:
+
+- the updates corpus, as the raw JSON items returned by the API, written by
+  whichever process currently holds the sync lock;
+- a change log of updates added, modified or removed between corpus syncs;
+- an append-only field history: for every update whose status, modified date
+  or availability dates changed in a sync, one delta record holding only the
+  changed fields as ``[old, new]`` pairs;
+- a response cache of upstream API bodies keyed by request URL.
+
+When ``AZURE_UPDATES_STORE`` points at a file, all workers open the same
+database (WAL mode lets readers proceed while the sync leader writes). Without
+it the store lives in memory and is private to the process.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from .. import codec
+
+STORE_PATH_ENV = "AZURE_UPDATES_STORE"
+CACHE_TTL_ENV = "AZURE_UPDATES_CACHE_TTL"
+
+DEFAULT_CACHE_TTL = 300.0
+MEMORY_PATH = ":memory:"
+
+# Expired responses are kept this long as a fallback for calls near their deadline
+STALE_RESPONSE_RETENTION = 3600.0
+
+# Change log entries older than this are pruned on each sync
+CHANGE_RETENTION_SECONDS = 30 * 24 * 3600.0
+
+# API item keys tracked in the field history -> field names used in records
+HISTORY_FIELDS = {
+    "status": "status",
+    "modified": "modified",
+    "generalAvailabilityDate": "general_availability_date",
+    "previewAvailabilityDate": "preview_availability_date",
+    "privatePreviewAvailabilityDate": "private_preview_availability_date",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS updates (
+    id TEXT PRIMARY KEY,
+    created TEXT,
+    modified TEXT,
+    item TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    change TEXT NOT NULL,
+    title TEXT,
+    status TEXT,
+    modified TEXT,
+    detected_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    change TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    recorded_at REAL NOT NULL,
+    title TEXT,
+    delta TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_recorded_at ON history (recorded_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def default_store_path() -> str:
+    """Return the store file used when multi-worker mode has no explicit path."""
+    return os.path.join(tempfile.gettempdir(), "azure-updates-mcp.sqlite3")
+
+
+class UpdateStore:
+    """Corpus, change log and response cache backed by one SQLite database."""
+
+    def __init__(self, path: str = MEMORY_PATH, cache_ttl: float = DEFAULT_CACHE_TTL):
+        self.path = path
+        self.cache_ttl = cache_ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        if self.is_shared:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @property
+    def is_shared(self) -> bool:
+        """Whether the store is a file other processes can open."""
+        return self.path != MEMORY_PATH
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    # -- response cache -----------------------------------------------------
+
+    def get_response(self, key: str, allow_stale: bool = False) -> str | None:
+        """Return a cached response body, or None if missing or expired.
+
+        With ``allow_stale``, bodies that expired less than
+        STALE_RESPONSE_RETENTION seconds ago are returned too, as a fallback
+        when upstream cannot answer in time.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM responses WHERE key = ? AND expires_at > ?",
+                (key, now - STALE_RESPONSE_RETENTION if allow_stale else now),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put_response(self, key: str, body: str, ttl: float | None = None) -> None:
+        """Cache a response body for ``ttl`` seconds (defaults to the store TTL)."""
+        ttl = self.cache_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, expires_at) VALUES (?, ?, ?)",
+                (key, body, now + ttl),
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE expires_at <= ?",
+                (now - STALE_RESPONSE_RETENTION,),
+            )
+
+    # -- corpus -------------------------------------------------------------
+
+    @property
+    def version(self) -> int:
+        """Corpus version, bumped every time the corpus is rewritten."""
+        value = self._get_meta("corpus_version")
+        return int(value) if value else 0
+
+    @property
+    def synced_at(self) -> float | None:
+        """Unix timestamp of the last completed corpus sync, if any."""
+        value = self._get_meta("synced_at")
+        return float(value) if value else None
+
+    def count_items(self) -> int:
+        """Return the number of updates in the corpus."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM updates").fetchone()[0]
+
+    def get_item(self, update_id: str) -> dict | None:
+        """Return the raw API item for an update id, or None if unknown."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT item FROM updates WHERE id = ?", (update_id,)
+            ).fetchone()
+        return codec.loads(row[0]) if row else None
+
+    def get_items(self, update_ids: list[str]) -> dict[str, dict]:
+        """Return the raw API items for several update ids in one query, keyed by id.
+
+        Unknown ids are left out.
+        """
+        ids = list(dict.fromkeys(update_ids))
+        if not ids:
+            return {}
+        placeholders = ", ".join("?" * len(ids))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, item FROM updates WHERE id IN ({placeholders})", ids
+            ).fetchall()
+        return {row[0]: codec.loads(row[1]) for row in rows}
+
+    def load_items(self) -> list[dict]:
+        """Return every raw API item in the corpus, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT item FROM updates ORDER BY created DESC, id"
+            ).fetchall()
+        return [codec.loads(row[0]) for row in rows]
+
+    def load_items_page(
+        self, after: tuple[str, str] | None = None, limit: int = 500
+    ) -> tuple[list[dict], tuple[str, str] | None]:
+        """Return up to ``limit`` raw items after a ``(created, id)`` anchor, newest first.
+
+        Pages are keyed on the corpus order rather than an offset, so a caller
+        can walk the whole corpus a page at a time without holding the store
+        lock in between.
+
+        Returns:
+            Tuple of (items, anchor for the next page or None after the last page).
+        """
+        with self._lock:
+            if after is None:
+                rows = self._conn.execute(
+                    "SELECT COALESCE(created, ''), id, item FROM updates "
+                    "ORDER BY COALESCE(created, '') DESC, id LIMIT ?",
+                    (limit,),
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT COALESCE(created, ''), id, item FROM updates "
+                    "WHERE COALESCE(created, '') < ? OR (COALESCE(created, '') = ? AND id > ?) "
+                    "ORDER BY COALESCE(created, '') DESC, id LIMIT ?",
+                    (after[0], after[0], after[1], limit),
+                ).fetchall()
+        items = [codec.loads(row[2]) for row in rows]
+        anchor = (rows[-1][0], rows[-1][1]) if len(rows) == limit else None
+        return items, anchor
+
+    def replace_items(self, items: list[dict]) -> int:
+        """Replace the whole corpus with ``items`` and return the new version.
+
+        Differences against the previous corpus (by ``id`` and ``modified``) are
+        appended to the change log, and changes to the HISTORY_FIELDS of each
+        update to the field history. The first sync into an empty store only
+        establishes the baseline and records no changes.
+
+        When every item is identical to the stored one, nothing is rewritten
+        and the version stays the same, so corpus snapshots and cached tool
+        results built on it stay valid; only the sync time is updated.
+        """
+        new_items = {str(item["id"]): item for item in items if item.get("id")}
+        rows = [
+            (
+                item_id,
+                item.get("created"),
+                item.get("modified"),
+                codec.dumps_text(item),
+            )
+            for item_id, item in new_items.items()
+        ]
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                previous = self._conn.execute("SELECT id, modified, item FROM updates").fetchall()
+                if previous and _unchanged(previous, rows):
+                    version = self._current_version()
+                    self._set_meta("synced_at", str(now))
+                    self._conn.execute("COMMIT")
+                    return version
+                if previous:
+                    self._conn.executemany(
+                        "INSERT INTO changes (id, change, title, status, modified, detected_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        _diff_rows(previous, new_items, now),
+                    )
+                    self._conn.execute(
+                        "DELETE FROM changes WHERE detected_at < ?",
+                        (now - CHANGE_RETENTION_SECONDS,),
+                    )
+                self._conn.execute("DELETE FROM updates")
+                self._conn.executemany(
+                    "INSERT INTO updates (id, created, modified, item) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                version = self._bump_version()
+                if previous:
+                    self._conn.executemany(
+                        "INSERT INTO history (id, change, version, recorded_at, title, delta) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        _history_rows(previous, new_items, rows, version, now),
+                    )
+                # Stores synced before the history existed start it here
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO meta (key, value) VALUES ('history_since', ?)",
+                    (str(now),),
+                )
+                self._set_meta("synced_at", str(now))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return version
+
+    # -- change log ---------------------------------------------------------
+
+    def list_changes(self, after_seq: int = 0, limit: int = 100) -> list[dict]:
+        """Return change log entries with a sequence number above ``after_seq``.
+
+        Entries are ordered oldest first, so the last entry's ``seq`` is the
+        position to resume from.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, id, change, title, status, modified, detected_at "
+                "FROM changes WHERE seq > ? ORDER BY seq LIMIT ?",
+                (after_seq, limit),
+            ).fetchall()
+        keys = ("seq", "id", "change", "title", "status", "modified", "detected_at")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def latest_change_seq(self) -> int:
+        """Return the sequence number of the newest change log entry (0 if none)."""
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(seq) FROM changes").fetchone()
+        return row[0] or 0
+
+    # -- field history ------------------------------------------------------
+
+    @property
+    def history_since(self) -> float | None:
+        """When the field history started (the baseline sync), or None."""
+        value = self._get_meta("history_since")
+        return float(value) if value is not None else None
+
+    def list_history(self, since: float, until: float | None = None) -> list[dict]:
+        """Return field history records with ``since < recorded_at <= until``, oldest first.
+
+        Each record has seq, id, change ("added", "modified", or "removed"),
+        version (the corpus version it was recorded in), recorded_at, title,
+        and delta ({field: [old, new]} for the fields that changed).
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, id, change, version, recorded_at, title, delta FROM history "
+                "WHERE recorded_at > ? AND recorded_at <= ? ORDER BY seq",
+                (since, until if until is not None else float("inf")),
+            ).fetchall()
+        keys = ("seq", "id", "change", "version", "recorded_at", "title")
+        return [{**dict(zip(keys, row[:6])), "delta": codec.loads(row[6])} for row in rows]
+
+    # -- helpers ------------------------------------------------------------
+
+    def _get_meta(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _current_version(self) -> int:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'corpus_version'").fetchone()
+        return int(row[0]) if row else 0
+
+    def _bump_version(self) -> int:
+        version = self._current_version() + 1
+        self._set_meta("corpus_version", str(version))
+        return version
+
+
+def _unchanged(previous: list[tuple], new_rows: list[tuple]) -> bool:
+    """Whether the old ``(id, modified, item)`` rows hold exactly the new items."""
+    if len(previous) != len(new_rows):
+        return False
+    new_json = {row[0]: row[3] for row in new_rows}
+    return all(new_json.get(item_id) == old_json for item_id, _, old_json in previous)
+
+
+def _diff_rows(previous: list[tuple], new_items: dict[str, dict], now: float) -> list[tuple]:
+    """Build change log rows from the old ``(id, modified, item)`` rows and new items."""
+    rows = []
+    seen = set()
+    for item_id, modified, old_json in previous:
+        seen.add(item_id)
+        item = new_items.get(item_id)
+        if item is None:
+            old = codec.loads(old_json)
+            rows.append((item_id, "removed", old.get("title"), old.get("status"), modified, now))
+        elif item.get("modified") != modified:
+            rows.append(
+                (
+                    item_id,
+                    "modified",
+                    item.get("title"),
+                    item.get("status"),
+                    item.get("modified"),
+                    now,
+                )
+            )
+    for item_id, item in new_items.items():
+        if item_id not in seen:
+            rows.append(
+                (item_id, "added", item.get("title"), item.get("status"), item.get("modified"), now)
+            )
+    return rows
+
+
+def _history_rows(
+    previous: list[tuple],
+    new_items: dict[str, dict],
+    new_rows: list[tuple],
+    version: int,
+    now: float,
+) -> list[tuple]:
+    """Build field history rows from the old ``(id, modified, item)`` rows.
+
+    Only items whose stored JSON differs are decoded and compared, and a row
+    is written only when a tracked field changed.
+    """
+    new_json = {row[0]: row[3] for row in new_rows}
+    rows = []
+    seen = set()
+    for item_id, _, old_json in previous:
+        seen.add(item_id)
+        if new_json.get(item_id) == old_json:
+            continue
+        old = codec.loads(old_json)
+        item = new_items.get(item_id)
+        if item is None:
+            change, title, new = "removed", old.get("title"), {}
+        else:
+            change, title, new = "modified", item.get("title"), item
+        delta = {
+            name: [old.get(key), new.get(key)]
+            for key, name in HISTORY_FIELDS.items()
+            if old.get(key) != new.get(key)
+        }
+        if delta or change == "removed":
+            rows.append((item_id, change, version, now, title, codec.dumps_text(delta)))
+    for item_id, item in new_items.items():
+        if item_id not in seen:
+            delta = {
+                name: [None, item.get(key)]
+                for key, name in HISTORY_FIELDS.items()
+                if item.get(key) is not None
+            }
+            title = item.get("title")
+            rows.append((item_id, "added", version, now, title, codec.dumps_text(delta)))
+    return rows
+
+
+_store: UpdateStore | None = None
+
+
+def get_store() -> UpdateStore:
+    """Return the process-wide store, opening it on first use.
+
+    Reads ``AZURE_UPDATES_STORE`` (database file path; in-memory when unset) and
+    ``AZURE_UPDATES_CACHE_TTL`` (response cache lifetime in seconds).
+    """
+    global _store
+    if _store is None:
+        _store = UpdateStore(
+            os.getenv(STORE_PATH_ENV) or MEMORY_PATH,
+            cache_ttl=float(os.getenv(CACHE_TTL_ENV, str(DEFAULT_CACHE_TTL))),
+        )
+    return _store
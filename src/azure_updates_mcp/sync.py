@@ -0,0 +1,121 @@
+"""Background corpus sync with a single elected leader per store.
+
+The sync keeps the local corpus current and records what changed between runs
+in the store's change log, so clients can follow new and modified updates
+without each of them polling upstream.
+
+Every server process that opens a shared store runs the sync loop, but only the
+process holding an exclusive lock on ``<store>.lock`` talks to the upstream API.
+The others keep retrying the lock, so if the leader exits another worker takes
+over. The lock is an OS advisory lock, released automatically when the holding
+process dies.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from typing import IO
+
+import httpx
+
+from .feeds.azure_api import fetch_all_items
+from .store import UpdateStore, get_store
+
+logger = logging.getLogger(__name__)
+
+SYNC_INTERVAL_ENV = "AZURE_UPDATES_SYNC_INTERVAL"
+
+DEFAULT_SYNC_INTERVAL = 900.0
+LEADER_RETRY_INTERVAL = 30.0
+
+
+def sync_interval() -> float:
+    """Return the seconds between corpus syncs (``AZURE_UPDATES_SYNC_INTERVAL``)."""
+    return float(os.getenv(SYNC_INTERVAL_ENV, str(DEFAULT_SYNC_INTERVAL)))
+
+
+def try_acquire_leader(store_path: str) -> IO | None:
+    """Try to take the sync lock for a store without blocking.
+
+    Args:
+        store_path: Path of the store database file.
+
+    Returns:
+        The open lock file (keep it open to hold the lock), or None if another
+        process is already the leader.
+    """
+    import fcntl
+
+    lock_file = open(f"{store_path}.lock", "a+")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+async def sync_once(store: UpdateStore) -> int:
+    """Pull the full corpus from upstream into the store.
+
+    Returns:
+        The new corpus version.
+
+    Raises:
+        ValueError: If upstream returned no updates (or far fewer than it
+            counted) while the store holds a corpus; the corpus is kept, so a
+            bad response does not show up as every update being removed.
+    """
+    items = await fetch_all_items()
+    if not items:
+        stored = await asyncio.to_thread(store.count_items)
+        if stored:
+            raise ValueError(f"Upstream returned no updates; keeping the {stored} stored")
+    version = await asyncio.to_thread(store.replace_items, items)
+    logger.info("Synced %d updates into corpus version %d", len(items), version)
+    return version
+
+
+async def run_sync_loop(store: UpdateStore, interval: float) -> None:
+    """Keep the store's corpus fresh, syncing only while this process leads."""
+    lock_file = None
+    # A private in-memory store has no other process to compete with
+    leading = not store.is_shared
+    try:
+        while True:
+            if not leading:
+                lock_file = try_acquire_leader(store.path)
+                leading = lock_file is not None
+                if not leading:
+                    await asyncio.sleep(min(interval, LEADER_RETRY_INTERVAL))
+                    continue
+                logger.info("Process %d is the corpus sync leader", os.getpid())
+
+            synced_at = store.synced_at
+            age = interval if synced_at is None else time.time() - synced_at
+            if age >= interval:
+                try:
+                    await sync_once(store)
+                except (httpx.HTTPError, ValueError) as exc:
+                    logger.warning("Corpus sync failed: %s", exc)
+                age = 0.0
+            await asyncio.sleep(interval - age)
+    finally:
+        if lock_file is not None:
+            lock_file.close()
+
+
+@asynccontextmanager
+async def background_sync() -> AsyncIterator[None]:
+    """Run the sync loop for the lifetime of the server."""
+    store = get_store()
+    task = asyncio.create_task(run_sync_loop(store, sync_interval()))
+    try:
+        yield
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
@@ -0,0 +1,150 @@
+"""Analytics tool: update counts over time grouped by a taxonomy field."""
+
+from datetime import datetime
+
+INTERVALS = {"month": 1, "quarter": 3, "year": 12}
+
+
+async def azure_updates_analytics(
+    group_by: str = "status",
+    interval: str = "month",
+    date_field: str = "created",
+    start_date: str | None = None,
+    end_date: str | None = None,
+    status: str | None = None,
+    product: str | None = None,
+    product_category: str | None = None,
+    tag: str | None = None,
+    top: int = 10,
+) -> dict:
+    """Count Azure updates per month, quarter, or year, grouped by a taxonomy field.
+
+    Answers trend questions in one call instead of paging through
+    azure_updates_search and counting by hand, for example:
+    - Retirements per month for Compute over two years (group_by="status",
+      status="Retirements", product_category="Compute", start_date="2024-01-01")
+    - Which product categories launched the most per quarter
+      (group_by="product_category", interval="quarter", status="Launched")
+    - GA dates per month by product (group_by="product",
+      date_field="general_availability")
+
+    Counts come from the server's local copy of the full updates corpus.
+
+    Args:
+        group_by: Field to split counts by: status, product, product_category,
+            or tag (default: status)
+        interval: Time bucket: month, quarter, or year (default: month)
+        date_field: Date that places an update in a bucket: created, modified,
+            general_availability, preview, or private_preview (default: created)
+        start_date: Optional ISO date; only count dates on or after it
+        end_date: Optional ISO date; only count dates on or before it
+        status: Optional status filter (exact match, case-insensitive)
+        product: Optional product filter (exact match, case-insensitive)
+        product_category: Optional product category filter (exact match,
+            case-insensitive)
+        tag: Optional tag filter (exact match, case-insensitive)
+        top: Number of groups to return separately, largest first; the rest
+            are summed into an "Other" series (default: 10, max: 50)
+
+    Returns:
+        Dictionary with:
+        - periods: Period labels ("2025-03", "2025-Q1", or "2025"), oldest first
+        - series: List of {name, total, counts} items, counts aligned with periods
+        - total: Number of (update, group) pairs counted
+        - filters_applied: Summary of the grouping and filters used
+    """
+    # Deferred so the corpus and its indexes load on the first call
+    from ..corpus import get_corpus
+    from ..index import DATE_FIELDS, TAXONOMY_FIELDS, grouped_counts
+
+    filters_applied: dict = {"group_by": group_by, "interval": interval, "date_field": date_field}
+
+    def error(message: str) -> dict:
+        return {"periods": [], "series": [], "total": 0, "filters_applied": {"error": message}}
+
+    if group_by not in TAXONOMY_FIELDS:
+        return error(f"Invalid group_by: {group_by}. Valid values: {', '.join(TAXONOMY_FIELDS)}")
+    if interval not in INTERVALS:
+        return error(f"Invalid interval: {interval}. Valid values: {', '.join(INTERVALS)}")
+    if date_field not in DATE_FIELDS:
+        return error(f"Invalid date_field: {date_field}. Valid values: {', '.join(DATE_FIELDS)}")
+
+    start_dt = end_dt = None
+    if start_date:
+        try:
+            start_dt = datetime.fromisoformat(start_date).replace(tzinfo=None)
+        except ValueError:
+            return error(f"Invalid start_date format: {start_date}")
+        filters_applied["start_date"] = start_date
+    if end_date:
+        try:
+            end_dt = datetime.fromisoformat(end_date).replace(tzinfo=None)
+        except ValueError:
+            return error(f"Invalid end_date format: {end_date}")
+        filters_applied["end_date"] = end_date
+
+    corpus = await get_corpus()
+    if corpus is None:
+        return error("The updates corpus is still syncing; try again shortly")
+
+    # Row selection: the date range from the sorted date column, narrowed by
+    # each taxonomy filter
+    selected = bytearray(len(corpus))
+    for row in corpus.dates.rows_between(date_field, start_dt, end_dt):
+        selected[row] = 1
+    for field, value in (
+        ("status", status),
+        ("product", product),
+        ("product_category", product_category),
+        ("tag", tag),
+    ):
+        if value:
+            filters_applied[field] = value
+            narrowed = bytearray(len(corpus))
+            for row in corpus.columns[field].rows_with(value):
+                narrowed[row] = selected[row]
+            selected = narrowed
+
+    column = corpus.columns[group_by]
+    step = INTERVALS[interval]
+    counts = grouped_counts(
+        column.rows, column.codes, corpus.dates.months[date_field], selected, step
+    )
+    if not counts:
+        return {"periods": [], "series": [], "total": 0, "filters_applied": filters_applied}
+
+    first = min(period for period, _ in counts)
+    last = max(period for period, _ in counts)
+    width = last - first + 1
+
+    by_code: dict[int, list[int]] = {}
+    for (period, code), count in counts.items():
+        by_code.setdefault(code, [0] * width)[period - first] += count
+
+    ranked = sorted(by_code.items(), key=lambda item: (-sum(item[1]), column.labels[item[0]]))
+    top = max(1, min(top, 50))
+    series = [
+        {"name": column.labels[code], "total": sum(row), "counts": row}
+        for code, row in ranked[:top]
+    ]
+    if len(ranked) > top:
+        other = [sum(bucket) for bucket in zip(*(row for _, row in ranked[top:]))]
+        series.append({"name": "Other", "total": sum(other), "counts": other})
+
+    return {
+        "periods": [_period_label(period, step) for period in range(first, last + 1)],
+        "series": series,
+        "total": sum(counts.values()),
+        "filters_applied": filters_applied,
+    }
+
+
+def _period_label(period: int, months_per_period: int) -> str:
+    """Format a period number as "2025-03", "2025-Q1", or "2025"."""
+    month = period * months_per_period
+    year, month_index = divmod(month, 12)
+    if months_per_period == 12:
+        return str(year)
+    if months_per_period == 3:
+        return f"{year}-Q{month_index // 3 + 1}"
+    return f"{year}-{month_index + 1:02d}"
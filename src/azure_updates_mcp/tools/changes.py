@@ -0,0 +1,112 @@
+"""Change-feed tool for following new, modified, and removed Azure Updates."""
+
+import asyncio
+from datetime import datetime, timezone
+
+from ..cursors import decode_cursor, encode_cursor
+
+CURSOR_KIND = "changes"
+
+
+async def azure_updates_changes(cursor: str | None = None, limit: int = 50) -> dict:
+    """List Azure updates that were added, modified, or removed since a cursor.
+
+    The server polls the Azure Updates API once on behalf of all clients and
+    records every difference it sees. Use this tool instead of repeatedly
+    calling azure_updates_search to notice new announcements: call it once
+    without a cursor, keep the returned next_cursor, and pass it on the next
+    call to receive only what changed in between.
+
+    Args:
+        cursor: Opaque cursor from a previous call's next_cursor. When omitted,
+            the most recent changes are returned.
+        limit: Maximum number of changes to return (default: 50, max: 100).
+
+    Returns:
+        Dictionary with:
+        - changes: List of {change, id, title, status, modified, detected_at,
+            update} entries, oldest first. change is "added", "modified", or
+            "removed"; update holds the full update for added/modified entries.
+        - next_cursor: Cursor to pass on the next call
+        - has_more: Whether more changes are waiting after this page
+        - synced_at: When the server last polled upstream (None if it has not)
+    """
+    from ..feeds.azure_api import _parse_item
+    from ..store import get_store
+
+    limit = max(1, min(limit, 100))
+
+    after_seq = None
+    if cursor:
+        try:
+            after_seq = int(decode_cursor(CURSOR_KIND, cursor)["seq"])
+        except (ValueError, KeyError, TypeError):
+            return {
+                "changes": [],
+                "next_cursor": None,
+                "has_more": False,
+                "error": f"Invalid cursor: {cursor}",
+            }
+
+    # One trip off the event loop, as a corpus sync holds the store for its rewrite
+    latest_seq, after_seq, entries, items, synced_at = await asyncio.to_thread(
+        _read_changes, get_store(), after_seq, limit
+    )
+
+    changes = []
+    for entry in entries:
+        update = None
+        if entry["change"] != "removed":
+            item = items.get(entry["id"])
+            parsed = _parse_item(item) if item is not None else None
+            update = parsed.to_dict() if parsed is not None else None
+        changes.append(
+            {
+                "change": entry["change"],
+                "id": entry["id"],
+                "title": entry["title"],
+                "status": entry["status"],
+                "modified": entry["modified"],
+                "detected_at": _isoformat(entry["detected_at"]),
+                "update": update,
+            }
+        )
+
+    next_seq = entries[-1]["seq"] if entries else max(after_seq, 0)
+    response = {
+        "changes": changes,
+        "next_cursor": encode_cursor(CURSOR_KIND, {"seq": next_seq}),
+        "has_more": next_seq < latest_seq,
+        "synced_at": _isoformat(synced_at) if synced_at is not None else None,
+    }
+    if synced_at is None:
+        response["note"] = (
+            "The change feed is filled by the server's background sync, which runs "
+            "for the HTTP transport or when AZURE_UPDATES_STORE is set"
+        )
+    return response
+
+
+async def latest_changes() -> dict:
+    """Most recent changes to the Azure Updates feed, with a cursor to follow on."""
+    return await azure_updates_changes()
+
+
+def _read_changes(store, after_seq: int | None, limit: int) -> tuple:
+    """Read a page of the change log with its current updates.
+
+    ``after_seq`` None means the latest ``limit`` changes.
+
+    Returns:
+        Tuple of (latest seq, after seq, entries, raw items by id, synced_at).
+    """
+    latest_seq = store.latest_change_seq()
+    if after_seq is None:
+        after_seq = max(latest_seq - limit, 0)
+    entries = store.list_changes(after_seq=after_seq, limit=limit)
+    items = store.get_items([entry["id"] for entry in entries if entry["change"] != "removed"])
+    return latest_seq, after_seq, entries, items, store.synced_at
+
+
+def _isoformat(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(tzinfo=None).isoformat()
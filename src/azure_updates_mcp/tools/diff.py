@@ -0,0 +1,171 @@
+"""Diff tool: what changed in the feed between two points in time."""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+CHANGE_TYPES = ("added", "removed", "modified")
+
+# Fields whose changes are reported as date changes
+DATE_FIELDS = (
+    "general_availability_date",
+    "preview_availability_date",
+    "private_preview_availability_date",
+)
+
+
+async def azure_updates_diff(
+    since: str,
+    until: str | None = None,
+    change: str | None = None,
+    field: str | None = None,
+    limit: int = 100,
+) -> dict:
+    """Report what changed in the Azure updates feed between two points in time.
+
+    Answers change-advisory questions such as "what changed since last
+    Tuesday" in one call: new updates, removed updates, status transitions
+    (In preview -> Launched), and moved GA, preview, or retirement dates.
+    Each update appears once with its net change over the whole window, so an
+    update that went In development -> In preview -> Launched is reported as
+    In development -> Launched.
+
+    The answer comes from the server's own history of each update's status,
+    modified date, and availability dates, recorded by its background sync.
+    Use azure_updates_changes instead to follow changes incrementally with a
+    cursor.
+
+    Args:
+        since: Start of the window, as an ISO date or datetime (UTC), e.g.
+            "2025-06-03". Only changes recorded after it are included.
+        until: Optional end of the window (ISO date or datetime, UTC;
+            default: now).
+        change: Optional filter: added, removed, or modified.
+        field: Optional filter: only updates where this field changed. One of
+            status, modified, general_availability_date,
+            preview_availability_date, or private_preview_availability_date
+            (retirement dates are reported in general_availability_date).
+        limit: Maximum number of updates to return (default: 100, max: 500).
+
+    Returns:
+        Dictionary with:
+        - since, until: The window, as UTC ISO datetimes
+        - summary: Counts of added, removed, and modified updates, and of
+            status_changes and date_changes among them
+        - updates: List of {change, id, title, fields, recorded_at} items,
+            oldest change first. fields maps each changed field to
+            {from, to}; recorded_at is when the last change was seen.
+        - total: Number of changed updates before limit was applied
+        - history_since: When the server's history begins (None if no sync
+            has run); earlier changes are not known
+    """
+    from ..store import HISTORY_FIELDS, get_store
+
+    field_names = tuple(HISTORY_FIELDS.values())
+
+    def error(message: str) -> dict:
+        return {"updates": [], "summary": {}, "total": 0, "error": message}
+
+    try:
+        since_ts = _timestamp(since)
+    except ValueError:
+        return error(f"Invalid since date: {since}")
+    try:
+        until_ts = _timestamp(until) if until else time.time()
+    except ValueError:
+        return error(f"Invalid until date: {until}")
+    if change and change not in CHANGE_TYPES:
+        return error(f"Invalid change: {change}. Valid values: {', '.join(CHANGE_TYPES)}")
+    if field and field not in field_names:
+        return error(f"Invalid field: {field}. Valid values: {', '.join(field_names)}")
+    limit = max(1, min(limit, 500))
+
+    # Off the event loop: a corpus sync holds the store while it rewrites it
+    records, history_since = await asyncio.to_thread(_read_history, get_store(), since_ts, until_ts)
+
+    # Fold the window's delta records into one net change per update
+    net: dict[str, dict] = {}
+    for record in records:
+        entry = net.get(record["id"])
+        if entry is None:
+            entry = net[record["id"]] = {"first": record["change"], "fields": {}}
+        entry["last"] = record["change"]
+        entry["title"] = record["title"] or entry.get("title")
+        entry["recorded_at"] = record["recorded_at"]
+        for name, (old, new) in record["delta"].items():
+            if name in entry["fields"]:
+                entry["fields"][name][1] = new
+            else:
+                entry["fields"][name] = [old, new]
+
+    updates = []
+    summary = {"added": 0, "removed": 0, "modified": 0, "status_changes": 0, "date_changes": 0}
+    for update_id, entry in net.items():
+        if entry["first"] == "added":
+            if entry["last"] == "removed":
+                continue
+            kind = "added"
+        elif entry["last"] == "removed":
+            kind = "removed"
+        else:
+            kind = "modified"
+        fields = {
+            name: {"from": old, "to": new}
+            for name, (old, new) in entry["fields"].items()
+            if old != new
+        }
+        if kind == "modified" and not fields:
+            continue
+        if (change and kind != change) or (field and field not in fields):
+            continue
+
+        summary[kind] += 1
+        if kind == "modified":
+            summary["status_changes"] += "status" in fields
+            summary["date_changes"] += any(name in fields for name in DATE_FIELDS)
+        updates.append(
+            {
+                "change": kind,
+                "id": update_id,
+                "title": entry["title"],
+                "fields": fields,
+                "recorded_at": entry["recorded_at"],
+            }
+        )
+
+    updates.sort(key=lambda u: u["recorded_at"])
+    for update in updates:
+        update["recorded_at"] = _isoformat(update["recorded_at"])
+
+    response = {
+        "since": _isoformat(since_ts),
+        "until": _isoformat(until_ts),
+        "summary": summary,
+        "updates": updates[:limit],
+        "total": len(updates),
+        "history_since": _isoformat(history_since) if history_since is not None else None,
+    }
+    if history_since is None or since_ts < history_since:
+        response["note"] = (
+            "The history is recorded by the server's background sync, which runs for "
+            "the HTTP transport or when AZURE_UPDATES_STORE is set; changes before "
+            "history_since are not known"
+        )
+    return response
+
+
+def _read_history(store, since: float, until: float) -> tuple[list[dict], float | None]:
+    """Return the window's history records and when the history begins."""
+    return store.list_history(since, until), store.history_since
+
+
+def _timestamp(value: str) -> float:
+    """Parse an ISO date or datetime (UTC unless it carries an offset) to epoch seconds."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _isoformat(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(tzinfo=None).isoformat()
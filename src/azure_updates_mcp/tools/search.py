@@ -1,8 +1,24 @@
 """Unified search tool for querying and filtering Azure Updates."""
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
-from ..feeds.azure_api import fetch_updates
+from ..cursors import decode_cursor, encode_cursor
+
+if TYPE_CHECKING:
+    from ..index import TaxonomyResolver
+    from ..models.update import AzureUpdate
+
+SINCE_CURSOR_KIND = "since"
+PAGE_CURSOR_KIND = "page"
+
+# Items re-read before a page cursor's position, absorbing updates removed
+# upstream since the previous page was served
+KEYSET_SLACK = 10
+
+# Upper bound on items scanned for one filtered keyset page
+KEYSET_MAX_SCAN = 1000
 
 
 async def azure_updates_search(
@@ -17,6 +33,15 @@ async def azure_updates_search(
     product: str | None = None,
     product_category: str | None = None,
     include_facets: bool = False,
+    since: str | None = None,
+    cursor: str | None = None,
+    date_field: str = "created",
+    retiring_within_days: int | None = None,
+    similar_to: str | None = None,
+    collapse_duplicates: bool = False,
+    full_description: bool = False,
+    feeds: list[str] | None = None,
+    deadline_seconds: float | None = None,
 ) -> dict:
     """Search, filter, and retrieve Azure service updates from the official JSON API.
 
@@ -32,9 +57,17 @@ async def azure_updates_search(
     - Filter by service category (category="Azure Kubernetes Service") -- partial match across all taxonomy
     - Find updates by status (status="In preview", "Launched", "Retirements", "In development")
     - Get updates in a date range (start_date="2025-01-01", end_date="2025-01-31")
+    - Find updates by GA or preview date (date_field="general_availability",
+      start_date="2025-07-01", end_date="2025-09-30")
+    - Find retirements coming up soon (retiring_within_days=90)
     - Retrieve a specific update by its GUID/ID (guid="...")
+    - Find updates related to one you have (similar_to="<update id>")
+    - Hide re-posted copies of the same announcement (collapse_duplicates=True)
+    - Search several release-communications feeds at once (feeds=["azure", "m365"])
     - Combine any of the above (query="networking" + status="Launched")
+    - Paginate with cursors (cursor=<next_cursor from the previous page>)
     - Paginate with offset (offset=10, limit=10 for page 2)
+    - Poll for what is new or changed (since=<next_cursor from the previous call>)
     - Discover available categories and taxonomy (include_facets=True, limit=0)
     - Get an overview with facets + recent items (include_facets=True, limit=10)
 
@@ -57,29 +90,156 @@ async def azure_updates_search(
         offset: Number of results to skip for pagination (default: 0).
         product: Optional product name filter (exact match against products list).
         product_category: Optional product category filter (exact match).
+            product, product_category, and category values that match no known
+            name are resolved to the closest one (acronyms such as "AKS",
+            shorthand, typos); filters_applied["resolved"] reports the mapping.
         include_facets: When True, includes taxonomy facets (product_categories,
             products, tags, statuses) with occurrence counts in the response.
             Use with limit=0 to get only facets (replaces category listing).
+        since: Optional delta cursor. Only updates created or modified after it
+            are returned, oldest change first, together with a next_cursor to
+            pass on the following poll. Accepts a next_cursor from an earlier
+            call or an ISO date/datetime to start from. Other filters still
+            apply; offset and include_facets are ignored, and limit is at
+            least 1 so every poll makes progress.
+        date_field: Which date start_date/end_date apply to: created (default),
+            modified, general_availability, preview, or private_preview.
+            end_date only defaults to today for created and modified.
+        retiring_within_days: Only return Retirements whose retirement date
+            (reported in the GA date field) falls between today and this many
+            days ahead. Overrides start_date, end_date, and date_field.
+        similar_to: Optional update ID. Returns the updates most similar to it
+            (by title, description, and taxonomy), best match first, each with
+            a similarity score between 0 and 1. status, category, product,
+            product_category, and limit still apply; other parameters are
+            ignored.
+        collapse_duplicates: When True, near-duplicate announcements on the
+            returned page are collapsed into the first one, which lists the
+            others' IDs in near_duplicates.
+        full_description: With a query, results carry a short snippet of the
+            description around the matching words (highlighted with **) in
+            place of the full description. Set to True to get the full text as
+            well. Descriptions are always plain text.
+        cursor: Optional page cursor from a previous call's next_cursor. Resumes
+            right after the last update of that page, so every page costs the
+            same and updates published mid-browse do not shift results. Takes
+            precedence over offset.
+        feeds: Optional names of the feeds to search (default: ["azure"]).
+            Naming any other registered feed, or several, searches them
+            concurrently and merges the results newest first, each tagged
+            with its feed. query, status, category, product,
+            product_category, start_date, end_date, limit, and offset apply;
+            cursor, since, similar_to, include_facets, and non-created
+            date_field values are not available across feeds.
+        deadline_seconds: Optional time budget for the call in seconds
+            (defaults to the server's AZURE_UPDATES_DEADLINE, if set). Upstream
+            requests are cut off when it runs out; the call then answers from
+            recently expired cached responses or with the pages read so far,
+            flagged stale or partial, or reports an error if it has nothing.
 
     Returns:
         Dictionary with:
-        - total_found: Number of updates matching the filters (from API count)
-        - updates: List of matching update objects (up to limit)
+        - total_found: Number of updates matching the filters (from API count;
+            with category/product/date filters, matches in the scanned window)
+        - updates: List of matching update objects (up to limit); with a query
+            each has a snippet instead of a description unless full_description=True
         - filters_applied: Summary of which filters were used
         - facets: (only when include_facets=True) Taxonomy with product_categories,
             products, tags, and statuses lists, each containing {name, count} items
+        - next_cursor: Cursor for the next page (None on the last page), or
+            for the next poll when since is given
+        - has_more: (only when since is given) Whether more changes are waiting
+            past this page
+        - collapsed: (only when collapse_duplicates=True) Number of updates
+            folded into a near duplicate on this page
+        - feed_errors: (only with feeds, when set) Feed name -> error for
+            feeds that could not be read; the others are still returned
+        - stale: (only when set) Some results come from expired cached
+            upstream responses because the deadline was reached
+        - partial: (only when set) The deadline cut the scan short; fewer than
+            limit updates may be returned, and next_cursor resumes the scan
     """
+    from ..deadline import DeadlineExceeded, deadline_scope, default_deadline
+
+    if deadline_seconds is None:
+        deadline_seconds = default_deadline()
+    try:
+        with deadline_scope(deadline_seconds) as deadline:
+            response = await _search(
+                query=query,
+                category=category,
+                status=status,
+                start_date=start_date,
+                end_date=end_date,
+                guid=guid,
+                limit=limit,
+                offset=offset,
+                product=product,
+                product_category=product_category,
+                include_facets=include_facets,
+                since=since,
+                cursor=cursor,
+                date_field=date_field,
+                retiring_within_days=retiring_within_days,
+                similar_to=similar_to,
+                collapse_duplicates=collapse_duplicates,
+                full_description=full_description,
+                feeds=feeds,
+            )
+    except DeadlineExceeded as exc:
+        return {"total_found": 0, "updates": [], "filters_applied": {"error": str(exc)}}
+
+    if deadline is not None:
+        if deadline.stale:
+            response["stale"] = True
+        if deadline.partial:
+            response["partial"] = True
+    return response
+
+
+async def _search(
+    query: str | None = None,
+    category: str | None = None,
+    status: str | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    guid: str | None = None,
+    limit: int = 10,
+    offset: int = 0,
+    product: str | None = None,
+    product_category: str | None = None,
+    include_facets: bool = False,
+    since: str | None = None,
+    cursor: str | None = None,
+    date_field: str = "created",
+    retiring_within_days: int | None = None,
+    similar_to: str | None = None,
+    collapse_duplicates: bool = False,
+    full_description: bool = False,
+    feeds: list[str] | None = None,
+) -> dict:
+    """Run azure_updates_search (see there) under the caller's deadline."""
+    # Deferred so the feed client and pydantic models load on the first call,
+    # not while the stdio server is starting up
+    from ..corpus import corpus_available, count_facets, get_corpus, get_taxonomy
+    from ..feeds.azure_api import (
+        change_position,
+        fetch_update_by_id,
+        fetch_updates,
+        fetch_updates_since,
+    )
+    from ..feeds.registry import DEFAULT_FEED, resolve_feeds
+    from ..index import DATE_FIELDS
+
     # GUID lookup is a fast path that ignores all other filters
     if guid:
-        # Fetch with search for the specific ID
-        updates, _, _ = await fetch_updates(search=guid, top=20)
-        for update in updates:
-            if update.id == guid:
-                return {
-                    "total_found": 1,
-                    "updates": [update.to_dict()],
-                    "filters_applied": {"guid": guid},
-                }
+        update = await fetch_update_by_id(guid)
+        if update is not None:
+            return {
+                "total_found": 1,
+                "updates": [update.to_dict()],
+                "filters_applied": {"guid": guid},
+            }
         return {
             "total_found": 0,
             "updates": [],
@@ -90,6 +250,11 @@ async def azure_updates_search(
     limit = max(0, min(limit, 100))
     offset = max(0, offset)
 
+    if similar_to:
+        return await _similar_updates(
+            similar_to, limit, status, category, product, product_category
+        )
+
     # Parse date filters
     start_dt = None
     end_dt = None
@@ -111,72 +276,266 @@ async def azure_updates_search(
                 "updates": [],
                 "filters_applied": {"error": f"Invalid end_date format: {end_date}"},
             }
-    elif start_dt:
+    elif start_dt and date_field in ("created", "modified"):
         # Default end_date to now when start_date is provided
         end_dt = datetime.now().replace(tzinfo=None)
 
-    # Determine if we need client-side filtering
-    needs_client_filter = any([
-        category,
-        product,
-        product_category,
-        start_dt,
-        end_dt,
-    ])
-
-    # When client-side filtering is needed, fetch more items to filter from
-    api_top = max(limit * 5, 1) if needs_client_filter else limit
-    api_skip = 0 if needs_client_filter else offset
-
-    updates, total_count, facets = await fetch_updates(
-        search=query,
-        status=status,
-        top=api_top,
-        skip=api_skip,
-        order_by="created desc",
-        include_facets=include_facets,
+    if date_field not in DATE_FIELDS:
+        return {
+            "total_found": 0,
+            "updates": [],
+            "filters_applied": {
+                "error": f"Invalid date_field: {date_field}. Valid values: {', '.join(DATE_FIELDS)}"
+            },
+        }
+
+    # Any feed other than the default one is searched by federation
+    federated = None
+    if feeds and [name.strip().lower() for name in feeds] != [DEFAULT_FEED]:
+        try:
+            federated = resolve_feeds(feeds)
+        except ValueError as exc:
+            return {"total_found": 0, "updates": [], "filters_applied": {"error": str(exc)}}
+        if (
+            since
+            or cursor
+            or include_facets
+            or date_field != "created"
+            or retiring_within_days is not None
+        ):
+            return {
+                "total_found": 0,
+                "updates": [],
+                "filters_applied": {
+                    "error": "since, cursor, include_facets, retiring_within_days, and "
+                    "date_field are not available when searching several feeds"
+                },
+            }
+
+    # Map fuzzy taxonomy names ("AKS", "Kubernetes Svc") to canonical ones.
+    # The taxonomy is Azure's, so federated searches keep names as given.
+    resolved: dict = {}
+    if (category or product or product_category) and federated is None:
+        taxonomy = await get_taxonomy()
+        if taxonomy is not None:
+            if category:
+                category, resolved["category"] = _resolve_name(taxonomy, "category", category)
+            if product:
+                product, resolved["product"] = _resolve_name(taxonomy, "product", product)
+            if product_category:
+                product_category, resolved["product_category"] = _resolve_name(
+                    taxonomy, "product_category", product_category
+                )
+            resolved = {field: r for field, r in resolved.items() if r is not None}
+
+    if retiring_within_days is not None:
+        status = "Retirements"
+        date_field = "general_availability"
+        start_dt = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        end_dt = start_dt + timedelta(days=max(0, retiring_within_days))
+
+    extra: dict = {}
+    facets = None
+
+    # Non-created date ranges can only be answered from the local corpus's
+    # date index. created ranges and taxonomy filters use it too once the
+    # corpus is loaded, unless the query needs the API's full-text search.
+    corpus_dates_only = date_field != "created" and bool(start_dt or end_dt)
+    client_filters = any([category, product, product_category, start_dt, end_dt])
+    use_corpus = (
+        not query
+        and not since
+        and federated is None
+        and (corpus_dates_only or (client_filters and await corpus_available()))
     )
 
-    # Apply client-side filters
-    if needs_client_filter:
-        category_lower = category.lower() if category else None
-        product_lower = product.lower() if product else None
-        product_category_lower = product_category.lower() if product_category else None
-
-        matched = []
-        for update in updates:
-            # Category filter (partial match across all taxonomy)
-            if category_lower:
-                all_cats = update.categories
-                if not any(category_lower in cat.lower() for cat in all_cats):
-                    continue
-
-            # Product filter (exact match)
-            if product_lower:
-                if not any(product_lower == p.lower() for p in update.products):
-                    continue
-
-            # Product category filter (exact match)
-            if product_category_lower:
-                if not any(product_category_lower == pc.lower() for pc in update.product_categories):
-                    continue
-
-            # Date range filter
-            if start_dt or end_dt:
-                created_dt = update.created.replace(tzinfo=None)
-                if start_dt and created_dt < start_dt:
-                    continue
-                if end_dt and created_dt > end_dt:
-                    continue
+    # Created-date bounds still checked per update on the API paths
+    created_start, created_end = (start_dt, end_dt) if date_field == "created" else (None, None)
+    allowed_ids = None
 
-            matched.append(update)
+    if corpus_dates_only or use_corpus:
+        corpus = await get_corpus()
+        if corpus is None:
+            return {
+                "total_found": 0,
+                "updates": [],
+                "filters_applied": {
+                    "error": "The local corpus is still syncing; "
+                    f"date_field={date_field} is not available yet"
+                },
+            }
+        if start_dt or end_dt:
+            rows = corpus.dates.rows_between(date_field, start_dt, end_dt)
+            candidates = [corpus.updates[row] for row in rows]
+        else:
+            candidates = corpus.updates
+        if not use_corpus:
+            allowed_ids = {update.id for update in candidates}
 
-        # Apply offset and limit to client-filtered results
+    if use_corpus:
+        matched = [
+            update
+            for update in candidates
+            if _matches_status(update, status)
+            and _matches_filters(update, category, product, product_category, None, None)
+        ]
+        result_updates, next_cursor, error = _page_corpus_matches(matched, offset, limit, cursor)
+        if error:
+            return {"total_found": 0, "updates": [], "filters_applied": {"error": error}}
         total_found = len(matched)
+        extra = {"next_cursor": next_cursor}
+        if include_facets:
+            facets = count_facets(matched)
+    elif federated:
+        needs_client_filter = bool(status) or client_filters
+        matched, total_count, feed_errors = await _federated_matches(
+            federated,
+            query,
+            status,
+            (category, product, product_category, created_start, created_end),
+            offset + limit,
+        )
+        if len(feed_errors) == len(federated):
+            errors = "; ".join(f"{name}: {error}" for name, error in feed_errors.items())
+            return {
+                "total_found": 0,
+                "updates": [],
+                "filters_applied": {"error": f"No feed could be read ({errors})"},
+            }
+        total_found = len(matched) if needs_client_filter else total_count
         result_updates = matched[offset : offset + limit]
+        extra = {"next_cursor": None}
+        if feed_errors:
+            extra["feed_errors"] = feed_errors
+    elif since:
+        try:
+            position = _decode_since(since)
+        except ValueError:
+            return {
+                "total_found": 0,
+                "updates": [],
+                "filters_applied": {"error": f"Invalid since cursor: {since}"},
+            }
+
+        changed = await fetch_updates_since(*position, search=query, status=status)
+
+        # Walk changes oldest first; the cursor advances past filtered-out
+        # updates too, so they are not re-scanned on the next poll
+        result_updates = []
+        has_more = False
+        # limit=0 would return the cursor it was given with has_more set forever
+        since_limit = max(limit, 1)
+        for update in changed:
+            if len(result_updates) >= since_limit:
+                has_more = True
+                break
+            position = change_position(update)
+            if _matches_filters(
+                update, category, product, product_category, created_start, created_end, allowed_ids
+            ):
+                result_updates.append(update)
+
+        total_found = len(result_updates)
+        extra = {"next_cursor": _encode_since(position), "has_more": has_more}
+    elif cursor:
+        try:
+            anchor, skip_hint = _decode_page_cursor(cursor)
+        except ValueError:
+            return {
+                "total_found": 0,
+                "updates": [],
+                "filters_applied": {"error": f"Invalid cursor: {cursor}"},
+            }
+
+        result_updates, total_found, facets, next_cursor = await _keyset_page(
+            anchor,
+            skip_hint,
+            limit,
+            query=query,
+            status=status,
+            filters=(category, product, product_category, created_start, created_end, allowed_ids),
+            include_facets=include_facets,
+        )
+        extra = {"next_cursor": next_cursor}
+    elif offset > 0 and (status or client_filters or allowed_ids is not None):
+        # The matches before the offset can lie anywhere upstream, so they are
+        # counted off by the keyset scan rather than sliced out of one window
+        result_updates, total_found, facets, next_cursor = await _keyset_page(
+            None,
+            0,
+            limit,
+            query=query,
+            status=status,
+            filters=(category, product, product_category, created_start, created_end, allowed_ids),
+            include_facets=include_facets,
+            skip_matches=offset,
+        )
+        extra = {"next_cursor": next_cursor}
     else:
-        total_found = total_count
-        result_updates = updates
+        # Determine if we need client-side filtering
+        needs_client_filter = any(
+            [
+                category,
+                product,
+                product_category,
+                created_start,
+                created_end,
+                allowed_ids is not None,
+                status,
+            ]
+        )
+
+        # When client-side filtering is needed, fetch more items to filter from.
+        # Status is checked here rather than in fetch_updates so that the page
+        # length shows whether upstream has more and list indexes stay equal to
+        # upstream positions.
+        api_top = max(limit * 5, 1) if needs_client_filter else limit
+        api_skip = 0 if needs_client_filter else offset
+
+        updates, total_count, facets = await fetch_updates(
+            search=query,
+            top=api_top,
+            skip=api_skip,
+            order_by="created desc",
+            include_facets=include_facets,
+        )
+
+        # Apply client-side filters
+        if needs_client_filter:
+            matched = [
+                update
+                for update in updates
+                if _matches_status(update, status)
+                and _matches_filters(
+                    update,
+                    category,
+                    product,
+                    product_category,
+                    created_start,
+                    created_end,
+                    allowed_ids,
+                )
+            ]
+
+            # Apply offset and limit to client-filtered results
+            total_found = len(matched)
+            result_updates = matched[offset : offset + limit]
+            has_next = len(matched) > offset + limit or len(updates) >= api_top
+        else:
+            total_found = total_count
+            result_updates = updates
+            has_next = offset + len(updates) < total_count
+
+        # Continue after the last returned update, at its upstream position, or
+        # after the whole window when none of it matched
+        next_cursor = None
+        if result_updates and has_next:
+            last = result_updates[-1]
+            position = api_skip + next(i for i, u in enumerate(updates) if u is last) + 1
+            next_cursor = _encode_page_cursor(last, position)
+        elif updates and has_next:
+            next_cursor = _encode_page_cursor(updates[-1], api_skip + len(updates))
+        extra = {"next_cursor": next_cursor}
 
     # Build filters summary
     filters_applied: dict = {}
@@ -190,20 +549,405 @@ async def azure_updates_search(
         filters_applied["product_category"] = product_category
     if status:
         filters_applied["status"] = status
+    if resolved:
+        filters_applied["resolved"] = resolved
     if start_date:
         filters_applied["start_date"] = start_date
-    if end_date or end_dt:
+    if retiring_within_days is not None:
+        filters_applied["retiring_within_days"] = retiring_within_days
+        filters_applied["start_date"] = start_dt.strftime("%Y-%m-%d")
+        filters_applied["end_date"] = end_dt.strftime("%Y-%m-%d")
+    elif end_date or end_dt:
         filters_applied["end_date"] = end_date or end_dt.strftime("%Y-%m-%d")
-    if offset > 0:
+    if date_field != "created":
+        filters_applied["date_field"] = date_field
+    if federated:
+        filters_applied["feeds"] = [feed.name for feed in federated]
+    if since:
+        filters_applied["since"] = since
+    elif cursor:
+        filters_applied["cursor"] = cursor
+    elif offset > 0:
         filters_applied["offset"] = offset
     if not filters_applied:
         filters_applied["note"] = "No filters applied, returning most recent updates"
 
+    if collapse_duplicates:
+        from ..index import group_near_duplicates
+
+        filters_applied.pop("note", None)
+        filters_applied["collapse_duplicates"] = True
+        groups = group_near_duplicates(result_updates)
+        updates_out = []
+        for group in groups:
+            update = _render_update(result_updates[group[0]], query, full_description)
+            update["near_duplicates"] = [result_updates[i].id for i in group[1:]]
+            updates_out.append(update)
+        extra["collapsed"] = len(result_updates) - len(groups)
+    else:
+        updates_out = [_render_update(u, query, full_description) for u in result_updates]
+
     response = {
         "total_found": total_found,
-        "updates": [u.to_dict() for u in result_updates],
+        "updates": updates_out,
         "filters_applied": filters_applied,
     }
     if facets is not None:
         response["facets"] = facets
+    response.update(extra)
     return response
+
+
+async def _similar_updates(
+    update_id: str,
+    limit: int,
+    status: str | None,
+    category: str | None,
+    product: str | None,
+    product_category: str | None,
+) -> dict:
+    """Rank corpus updates by cosine similarity to ``update_id``."""
+    from ..corpus import get_corpus
+
+    filters_applied: dict = {"similar_to": update_id}
+    corpus = await get_corpus()
+    row = corpus.rows_by_id.get(update_id) if corpus is not None else None
+    if row is None:
+        error = (
+            "The local corpus is still syncing; similar_to is not available yet"
+            if corpus is None
+            else f"Unknown update id: {update_id}"
+        )
+        return {"total_found": 0, "updates": [], "filters_applied": {"error": error}}
+
+    # Built once per corpus version, off the event loop
+    index = await asyncio.to_thread(lambda: corpus.similarity)
+
+    matched = []
+    for other, score in index.most_similar(row):
+        update = corpus.updates[other]
+        if _matches_status(update, status) and _matches_filters(
+            update, category, product, product_category, None, None
+        ):
+            matched.append((update, score))
+
+    for key, value in (
+        ("status", status),
+        ("category", category),
+        ("product", product),
+        ("product_category", product_category),
+    ):
+        if value:
+            filters_applied[key] = value
+
+    return {
+        "total_found": len(matched),
+        "updates": [
+            {**update.to_dict(), "similarity": round(score, 4)} for update, score in matched[:limit]
+        ],
+        "filters_applied": filters_applied,
+    }
+
+
+def _render_update(update: "AzureUpdate", query: str | None, full_description: bool) -> dict:
+    """Serialize an update, swapping the description for a snippet on queries."""
+    result = update.to_dict()
+    if query:
+        from ..index import snippet, tokenize
+
+        result["snippet"] = snippet(update.description, update.token_spans, tokenize(query))
+        if not full_description:
+            del result["description"]
+    return result
+
+
+def _resolve_name(taxonomy: "TaxonomyResolver", field: str, value: str) -> tuple[str, dict | None]:
+    """Return the filter value to use and how it was resolved (None if unchanged)."""
+    if taxonomy.knows(field, value):
+        return value, None
+    resolution = taxonomy.resolve(field, value)
+    if resolution is None:
+        return value, None
+    return resolution.name, resolution.to_dict(value)
+
+
+def _matches_filters(
+    update: "AzureUpdate",
+    category: str | None,
+    product: str | None,
+    product_category: str | None,
+    start_dt: datetime | None,
+    end_dt: datetime | None,
+    allowed_ids: set[str] | None = None,
+) -> bool:
+    """Apply the client-side taxonomy and date filters to one update.
+
+    ``allowed_ids`` carries the result of a corpus index lookup (such as a GA
+    date range) so API results can be narrowed by it with a set probe.
+    """
+    if allowed_ids is not None and update.id not in allowed_ids:
+        return False
+
+    # Category filter (partial match across all taxonomy)
+    if category:
+        category_lower = category.lower()
+        if not any(category_lower in cat.lower() for cat in update.categories):
+            return False
+
+    # Product filter (exact match)
+    if product:
+        product_lower = product.lower()
+        if not any(product_lower == p.lower() for p in update.products):
+            return False
+
+    # Product category filter (exact match)
+    if product_category:
+        product_category_lower = product_category.lower()
+        if not any(product_category_lower == pc.lower() for pc in update.product_categories):
+            return False
+
+    # Date range filter
+    if start_dt or end_dt:
+        created_dt = update.created.replace(tzinfo=None)
+        if start_dt and created_dt < start_dt:
+            return False
+        if end_dt and created_dt > end_dt:
+            return False
+
+    return True
+
+
+async def _keyset_page(
+    anchor: tuple[datetime, str] | None,
+    skip_hint: int,
+    limit: int,
+    query: str | None,
+    status: str | None,
+    filters: tuple,
+    include_facets: bool,
+    skip_matches: int = 0,
+) -> tuple[list["AzureUpdate"], int, dict | None, str | None]:
+    """Serve the page after a ``(created, id)`` anchor.
+
+    The API only pages by offset, so the cursor carries a skip hint: the
+    anchor's upstream position when it was served. Reading starts a little
+    before the hint, and anything at or above the anchor in ``created desc, id
+    desc`` order is skipped. New updates published at the top and small shifts
+    from removals therefore never repeat or drop results, and a page costs one
+    request however deep it is.
+
+    Without an anchor the scan starts at the top and the first
+    ``skip_matches`` matches are passed over, which serves an offset into
+    client-filtered results.
+
+    When a later page misses the call deadline, the pages already read are
+    returned and the deadline is marked partial.
+
+    Returns:
+        Tuple of (updates, total_found, facets or None, next cursor or None).
+    """
+    from ..deadline import DeadlineExceeded, current_deadline
+    from ..feeds.azure_api import CORPUS_PAGE_SIZE, fetch_updates
+
+    needs_client_filter = any(filters) or bool(status)
+    window = CORPUS_PAGE_SIZE if needs_client_filter else limit + 2 * KEYSET_SLACK
+    skip = max(skip_hint - KEYSET_SLACK, 0)
+
+    matched: list[AzureUpdate] = []
+    facets = None
+    total_count = 0
+    last_seen = None
+    passed_over = 0
+    scanned = 0
+    upstream_done = False
+
+    while len(matched) < limit and scanned < KEYSET_MAX_SCAN:
+        # Status is checked here rather than in fetch_updates so that list
+        # indexes stay equal to upstream positions
+        try:
+            updates, total_count, page_facets = await fetch_updates(
+                search=query,
+                top=window,
+                skip=skip,
+                order_by="created desc",
+                include_facets=include_facets and facets is None,
+            )
+        except DeadlineExceeded:
+            # Out of time: return what was read, with a cursor that resumes after it
+            deadline = current_deadline()
+            if last_seen is None or deadline is None:
+                raise
+            deadline.partial = True
+            break
+        facets = facets or page_facets
+
+        for i, update in enumerate(updates):
+            if anchor is not None and (update.created, update.id) >= anchor:
+                continue
+            last_seen = (update, skip + i + 1)
+            if not _matches_status(update, status):
+                continue
+            if not _matches_filters(update, *filters):
+                continue
+            if passed_over < skip_matches:
+                passed_over += 1
+                continue
+            matched.append(update)
+            if len(matched) == limit:
+                break
+
+        scanned += len(updates)
+        skip += len(updates)
+        if not updates or skip >= total_count:
+            upstream_done = True
+            break
+
+    next_cursor = None
+    if last_seen is not None and not (upstream_done and last_seen[1] >= skip):
+        next_cursor = _encode_page_cursor(*last_seen)
+
+    total_found = passed_over + len(matched) if needs_client_filter else total_count
+    return matched, total_found, facets, next_cursor
+
+
+async def _federated_matches(
+    feeds: list,
+    query: str | None,
+    status: str | None,
+    filters: tuple,
+    wanted: int,
+) -> tuple[list["AzureUpdate"], int, dict[str, str]]:
+    """Collect the newest ``wanted`` matches across ``feeds``, merged newest first.
+
+    The feeds are read a page at a time, all at the same skip, and a feed
+    stops once it has supplied ``wanted`` matches or runs out. Each feed is
+    newest first, so the top ``wanted`` merged matches are then among those
+    read. A feed cut off by KEYSET_MAX_SCAN before that point bounds the
+    result: matches older than the last update it returned are dropped, as
+    that feed may hold newer ones it was not read for.
+
+    Returns:
+        Tuple of (matches, total from the feeds' counts, feed name -> error).
+    """
+    from ..feeds.azure_api import CORPUS_PAGE_SIZE
+    from ..feeds.registry import fetch_federated
+
+    needs_client_filter = bool(status) or any(filters)
+    top = CORPUS_PAGE_SIZE if needs_client_filter else max(min(wanted, CORPUS_PAGE_SIZE), 1)
+    matched: dict[str, list[AzureUpdate]] = {feed.name: [] for feed in feeds}
+    last_read: dict[str, tuple] = {}
+    errors: dict[str, str] = {}
+    total = 0
+
+    active = list(feeds)
+    skip = 0
+    while active and skip < KEYSET_MAX_SCAN:
+        page = await fetch_federated(active, search=query, top=top, skip=skip)
+        if skip == 0:
+            total = page.total
+        errors.update(page.errors)
+        by_feed: dict[str, list[AzureUpdate]] = {}
+        for update in page.updates:
+            by_feed.setdefault(update.feed, []).append(update)
+
+        still_active = []
+        for feed in active:
+            if feed.name in page.errors:
+                continue
+            updates = by_feed.get(feed.name, [])
+            if updates:
+                last_read[feed.name] = (updates[-1].created, updates[-1].id)
+            matched[feed.name].extend(
+                update
+                for update in updates
+                if _matches_status(update, status) and _matches_filters(update, *filters)
+            )
+            if len(updates) == top and len(matched[feed.name]) < wanted:
+                still_active.append(feed)
+        active = still_active
+        skip += top
+
+    merged = sorted(
+        (update for updates in matched.values() for update in updates),
+        key=lambda u: (u.created, u.id),
+        reverse=True,
+    )
+    cut_off = [last_read[feed.name] for feed in active if feed.name in last_read]
+    if cut_off:
+        horizon = max(cut_off)
+        merged = [update for update in merged if (update.created, update.id) >= horizon]
+    return merged, total, errors
+
+
+def _matches_status(update: "AzureUpdate", status: str | None) -> bool:
+    """Case-insensitive status check (always true when no status is given)."""
+    return not status or (update.status or "").lower() == status.lower()
+
+
+def _page_corpus_matches(
+    matched: list["AzureUpdate"], offset: int, limit: int, cursor: str | None
+) -> tuple[list["AzureUpdate"], str | None, str | None]:
+    """Slice one page out of corpus-ordered matches.
+
+    With a cursor the page starts right after its ``(created, id)`` anchor,
+    found by binary search; otherwise at ``offset``.
+
+    Returns:
+        Tuple of (page, next cursor or None, error message or None).
+    """
+    from ..corpus import position_after
+
+    start = offset
+    if cursor:
+        try:
+            anchor, _ = _decode_page_cursor(cursor)
+        except ValueError:
+            return [], None, f"Invalid cursor: {cursor}"
+        start = position_after(matched, anchor)
+
+    page = matched[start : start + limit]
+    next_cursor = None
+    if page and start + limit < len(matched):
+        next_cursor = _encode_page_cursor(page[-1], start + len(page))
+    return page, next_cursor, None
+
+
+def _encode_page_cursor(last: "AzureUpdate", position: int) -> str:
+    """Encode the position after ``last`` as an opaque page cursor."""
+    return encode_cursor(
+        PAGE_CURSOR_KIND,
+        {"created": last.created.isoformat(), "id": last.id, "skip": position},
+    )
+
+
+def _decode_page_cursor(cursor: str) -> tuple[tuple[datetime, str], int]:
+    """Decode a page cursor into its ``(created, id)`` anchor and skip hint.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        payload = decode_cursor(PAGE_CURSOR_KIND, cursor)
+        anchor = (datetime.fromisoformat(payload["created"]), str(payload["id"]))
+        return anchor, max(int(payload["skip"]), 0)
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+
+
+def _encode_since(position: tuple[datetime, str]) -> str:
+    """Encode a ``(modified, id)`` position as an opaque delta cursor."""
+    modified, update_id = position
+    return encode_cursor(SINCE_CURSOR_KIND, {"modified": modified.isoformat(), "id": update_id})
+
+
+def _decode_since(since: str) -> tuple[datetime, str]:
+    """Decode a delta cursor, or start one from an ISO date/datetime.
+
+    Raises:
+        ValueError: If ``since`` is neither a valid cursor nor an ISO date.
+    """
+    try:
+        payload = decode_cursor(SINCE_CURSOR_KIND, since)
+        return datetime.fromisoformat(payload["modified"]), str(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        return datetime.fromisoformat(since).replace(tzinfo=None), ""
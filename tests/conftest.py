@@ -0,0 +1,20 @@
+"""Shared fixtures for Azure Updates MCP tests."""
+
+import pytest
+
+from azure_updates_mcp.feeds import azure_api
+from azure_updates_mcp.store import UpdateStore, sqlite
+
+
+@pytest.fixture
+def memory_store(monkeypatch):
+    """Replace the process-wide store with a fresh in-memory one."""
+    store = UpdateStore()
+    monkeypatch.setattr(sqlite, "_store", store)
+    return store
+
+
+@pytest.fixture(autouse=True)
+def empty_parsed_cache():
+    """Start every test without updates parsed by an earlier one."""
+    azure_api._parsed.clear()
@@ -0,0 +1,101 @@
+"""Tests for the tool result cache."""
+
+import pytest
+
+
+def _items(version: int) -> list[dict]:
+    return [
+        {
+            "id": f"c{n}",
+            "title": f"Update {n} v{version}",
+            "created": f"2025-01-0{n}T00:00:00Z",
+            "productCategories": ["Compute"],
+        }
+        for n in range(1, 4)
+    ]
+
+
+@pytest.fixture
+def cached_server(memory_store):
+    from azure_updates_mcp.server import mcp, result_cache
+
+    result_cache.clear()
+    result_cache.hits = result_cache.misses = 0
+    memory_store.replace_items(_items(1))
+    yield mcp, result_cache
+    result_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_hit_the_cache(cached_server):
+    """Calls with equivalent arguments share one cached result."""
+    from fastmcp import Client
+
+    mcp, cache = cached_server
+    async with Client(mcp) as client:
+        first = await client.call_tool("azure_updates_search", {"product_category": "Compute"})
+        second = await client.call_tool(
+            "azure_updates_search", {"product_category": " Compute ", "limit": 10}
+        )
+
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert first.content[0].text == second.content[0].text
+    assert second.structured_content["total_found"] == 3
+
+
+@pytest.mark.asyncio
+async def test_corpus_version_change_invalidates(cached_server, memory_store):
+    """A corpus sync makes the next identical call recompute."""
+    from fastmcp import Client
+
+    mcp, cache = cached_server
+    args = {"product_category": "Compute", "limit": 1}
+    async with Client(mcp) as client:
+        before = await client.call_tool("azure_updates_search", args)
+        memory_store.replace_items(_items(2))
+        after = await client.call_tool("azure_updates_search", args)
+
+    assert cache.hits == 0
+    assert before.structured_content["updates"][0]["title"].endswith("v1")
+    assert after.structured_content["updates"][0]["title"].endswith("v2")
+
+
+@pytest.mark.asyncio
+async def test_error_results_are_not_cached(cached_server):
+    """Error responses are recomputed on every call."""
+    from fastmcp import Client
+
+    mcp, cache = cached_server
+    async with Client(mcp) as client:
+        for _ in range(2):
+            await client.call_tool("azure_updates_search", {"cursor": "bogus"})
+
+    assert cache.hits == 0
+
+
+def test_cache_key_normalises_defaults():
+    """Omitted arguments and explicit defaults produce the same key."""
+    from azure_updates_mcp.cache import ToolResultCache
+
+    async def tool(query: str | None = None, limit: int = 10) -> dict:
+        return {}
+
+    cache = ToolResultCache({"tool": tool}, max_entries=8)
+
+    assert cache.cache_key("tool", {}) == cache.cache_key("tool", {"limit": 10})
+    assert cache.cache_key("tool", {"query": "x"}) != cache.cache_key("tool", {})
+    assert cache.cache_key("tool", {"bogus": 1}) is None
+    assert cache.cache_key("other", {}) is None
+    assert ToolResultCache({"tool": tool}, max_entries=0).cache_key("tool", {}) is None
+
+
+def test_cache_key_ignores_deadline():
+    """A complete result does not depend on the deadline it was computed under."""
+    from azure_updates_mcp.cache import ToolResultCache
+
+    async def tool(query: str | None = None, deadline_seconds: float | None = None) -> dict:
+        return {}
+
+    cache = ToolResultCache({"tool": tool}, max_entries=8)
+
+    assert cache.cache_key("tool", {"deadline_seconds": 2}) == cache.cache_key("tool", {})
@@ -0,0 +1,45 @@
+"""Tests for the pluggable JSON codec."""
+
+import pytest
+
+from azure_updates_mcp.codec import available_codecs, select_codec
+
+DOCUMENT = {
+    "id": "u1",
+    "title": "Café Ω launch",
+    "products": ["AKS", "VMs"],
+    "count": 3,
+    "ratio": 0.5,
+    "nested": {"ok": True, "missing": None},
+}
+
+
+@pytest.mark.parametrize("name", sorted(available_codecs()))
+def test_backends_round_trip_identically(name):
+    """Every installed backend decodes str and bytes and emits the same compact JSON."""
+    codec = available_codecs()[name]
+    reference = available_codecs()["json"]
+
+    encoded = codec.dumps(DOCUMENT)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == DOCUMENT
+    assert codec.loads(encoded.decode()) == DOCUMENT
+    assert reference.loads(encoded) == DOCUMENT
+    assert b" " not in codec.dumps({"a": [1, 2]})
+    assert "Café Ω".encode() in encoded
+
+
+def test_select_codec_falls_back_to_stdlib(monkeypatch):
+    """A configured backend that is not installed falls back to json."""
+    from azure_updates_mcp import codec
+
+    def missing():
+        raise ImportError("not installed")
+
+    monkeypatch.setitem(codec._FACTORIES, "orjson", missing)
+    monkeypatch.setitem(codec._FACTORIES, "msgspec", missing)
+
+    assert select_codec("orjson").name == "json"
+    assert select_codec().name == "json"
+    with pytest.raises(ValueError, match="Invalid JSON codec"):
+        select_codec("simdjson")
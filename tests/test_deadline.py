@@ -0,0 +1,96 @@
+"""Tests for per-call deadlines on upstream requests."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from azure_updates_mcp.deadline import (
+    DEADLINE_ENV,
+    UPSTREAM_TIMEOUT,
+    DeadlineExceeded,
+    deadline_scope,
+    default_deadline,
+    upstream_timeout,
+)
+from azure_updates_mcp.feeds.azure_api import AzureUpdatesQuery, fetch_raw
+
+
+def _slow_client(started: list, cancelled: list) -> httpx.AsyncClient:
+    """Client whose upstream never answers, recording starts and cancellations."""
+
+    async def handler(request):
+        started.append(request.url)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(request.url)
+            raise
+        return httpx.Response(200, text="{}")
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_upstream_timeout_follows_deadline():
+    """Upstream timeouts shrink to the time left and fail once it is gone."""
+    assert upstream_timeout() == UPSTREAM_TIMEOUT
+    with deadline_scope(2):
+        assert 0 < upstream_timeout() <= 2
+        with deadline_scope(None):
+            assert upstream_timeout() == UPSTREAM_TIMEOUT
+    with deadline_scope(0.001):
+        time.sleep(0.01)
+        with pytest.raises(DeadlineExceeded):
+            upstream_timeout()
+
+
+def test_default_deadline_from_env(monkeypatch):
+    """The deployment default comes from the environment and is off when unset."""
+    monkeypatch.delenv(DEADLINE_ENV, raising=False)
+    assert default_deadline() is None
+    monkeypatch.setenv(DEADLINE_ENV, "4.5")
+    assert default_deadline() == 4.5
+
+
+@pytest.mark.asyncio
+async def test_fetch_raw_cancels_request_at_deadline(memory_store):
+    """A request still running at the deadline is cancelled, not left to finish."""
+    started, cancelled = [], []
+    async with _slow_client(started, cancelled) as client:
+        began = time.monotonic()
+        with deadline_scope(0.05), pytest.raises(DeadlineExceeded):
+            await fetch_raw(AzureUpdatesQuery(), client=client)
+
+    assert time.monotonic() - began < 1
+    assert started and cancelled == started
+
+
+@pytest.mark.asyncio
+async def test_fetch_raw_falls_back_to_stale_response(memory_store):
+    """Near the deadline an expired cached body is served and flagged stale."""
+    query = AzureUpdatesQuery()
+    memory_store.put_response(query.to_url(), '{"value": [], "@odata.count": 7}', ttl=0.001)
+    await asyncio.sleep(0.01)
+
+    async with _slow_client([], []) as client:
+        with deadline_scope(0.05) as deadline:
+            data = await fetch_raw(query, client=client)
+
+    assert data["@odata.count"] == 7
+    assert deadline.stale
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_cancels_upstream_request(memory_store):
+    """Cancelling the calling task cancels its in-flight upstream request."""
+    started, cancelled = [], []
+    async with _slow_client(started, cancelled) as client:
+        task = asyncio.create_task(fetch_raw(AzureUpdatesQuery(), client=client))
+        while not started:
+            await asyncio.sleep(0.001)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert cancelled == started
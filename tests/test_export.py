@@ -0,0 +1,112 @@
+"""Tests for the streaming corpus export."""
+
+import json
+
+import pytest
+
+
+def _items(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"e{n:03d}",
+            "title": f"Update {n}",
+            "status": "Retirements" if n % 3 == 0 else "Launched",
+            "created": f"2025-01-{n % 28 + 1:02d}T00:00:{n % 60:02d}Z",
+            "productCategories": ["Compute"],
+        }
+        for n in range(count)
+    ]
+
+
+def test_load_items_page_walks_corpus_in_order(memory_store):
+    """Keyset pages cover every item once, in load_items order."""
+    memory_store.replace_items(_items(23))
+
+    seen, after = [], None
+    while True:
+        items, after = memory_store.load_items_page(after, limit=5)
+        seen += [item["id"] for item in items]
+        if after is None:
+            break
+
+    assert seen == [item["id"] for item in memory_store.load_items()]
+
+
+@pytest.mark.asyncio
+async def test_stream_export_ndjson_in_batches(memory_store):
+    """NDJSON is yielded once per store page and honours the filters."""
+    from azure_updates_mcp.export import NdjsonEncoder, build_filters, stream_export
+
+    memory_store.replace_items(_items(23))
+    filters = build_filters(status="retirements")
+
+    chunks = [chunk async for chunk in stream_export(NdjsonEncoder(), filters, batch_size=5)]
+    lines = b"".join(chunks).splitlines()
+
+    assert len(chunks) == 5
+    assert len(lines) == 8
+    assert all(json.loads(line)["status"] == "Retirements" for line in lines)
+
+
+def test_build_filters_rejects_bad_values():
+    """Unknown date fields and unparseable dates raise ValueError."""
+    from azure_updates_mcp.export import build_filters, make_encoder
+
+    with pytest.raises(ValueError):
+        build_filters(date_field="bogus")
+    with pytest.raises(ValueError):
+        build_filters(start_date="not a date")
+    with pytest.raises(ValueError):
+        make_encoder("csv")
+
+
+@pytest.mark.asyncio
+async def test_stream_export_arrow_and_parquet(memory_store):
+    """Arrow IPC and Parquet exports read back as the filtered table."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    from azure_updates_mcp.export import build_filters, make_encoder, stream_export
+
+    memory_store.replace_items(_items(23))
+    filters = build_filters(start_date="2025-01-10", end_date="2025-01-20")
+
+    arrow = b"".join([c async for c in stream_export(make_encoder("arrow"), filters, batch_size=5)])
+    parquet = b"".join(
+        [c async for c in stream_export(make_encoder("parquet"), filters, batch_size=5)]
+    )
+
+    table = pa.ipc.open_stream(arrow).read_all()
+    assert table.num_rows == 10
+    assert table.column("product_categories").to_pylist()[0] == ["Compute"]
+    assert pq.read_table(pa.BufferReader(parquet)).equals(table)
+
+
+def test_export_cli_writes_file(memory_store, tmp_path):
+    """The export subcommand streams NDJSON to --output."""
+    from azure_updates_mcp.export import main
+
+    memory_store.replace_items(_items(7))
+    output = tmp_path / "updates.ndjson"
+
+    assert main(["--output", str(output), "--status", "Launched"]) == 0
+
+    ids = [json.loads(line)["id"] for line in output.read_text().splitlines()]
+    assert ids == [item["id"] for item in memory_store.load_items() if item["status"] == "Launched"]
+
+
+def test_export_route_streams_ndjson(memory_store):
+    """GET /export on the HTTP app streams NDJSON and rejects bad filters."""
+    from starlette.testclient import TestClient
+
+    from azure_updates_mcp.server import http_app
+
+    memory_store.replace_items(_items(7))
+
+    with TestClient(http_app()) as client:
+        response = client.get("/export", params={"status": "Retirements"})
+        bad = client.get("/export", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert len(response.text.splitlines()) == 3
+    assert bad.status_code == 400
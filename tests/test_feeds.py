@@ -1,13 +1,17 @@
 """Tests for JSON API feed functionality."""
 
+import asyncio
 from datetime import datetime
 
 import pytest
 
+from azure_updates_mcp.feeds import azure_api
 from azure_updates_mcp.feeds.azure_api import (
     AzureUpdatesQuery,
     _parse_item,
+    fetch_all_items,
     fetch_updates,
+    fetch_updates_since,
 )
 
 # ---------------------------------------------------------------------------
@@ -97,6 +101,8 @@ def test_parse_item_basic():
     assert update.general_availability_date == "Q1 2025"
     assert "azure.microsoft.com" in update.link
     assert "test-123" in update.link
+    assert update.description == "Some description"
+    assert list(update.token_spans) == [0, 4, 5, 16]
 
 
 def test_parse_item_backward_compat():
@@ -176,6 +182,206 @@ def test_parse_item_to_dict():
     assert "Databases" in d["categories"]
 
 
+# ---------------------------------------------------------------------------
+# Unit tests for fetch_all_items
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_items_plans_pages_from_count(monkeypatch):
+    """One counted request plans the rest, which run concurrently up to the limit."""
+    feed = [{"id": f"item-{n}"} for n in range(10, 0, -1)]
+    requested = []
+    in_flight = 0
+    peak = 0
+
+    async def fake_fetch_raw(query, use_cache=True, client=None):
+        nonlocal in_flight, peak
+        requested.append((query.skip, query.count))
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"@odata.count": len(feed), "value": feed[query.skip : query.skip + query.top]}
+
+    monkeypatch.setattr(azure_api, "fetch_raw", fake_fetch_raw)
+
+    items = await fetch_all_items(page_size=2, concurrency=2)
+
+    assert [item["id"] for item in items] == [item["id"] for item in feed]
+    assert requested[0] == (0, True)
+    assert sorted(requested[1:]) == [(2, False), (4, False), (6, False), (8, False)]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_items_survives_items_shifting(monkeypatch):
+    """Updates published mid-backfill do not push items through page gaps."""
+    feed = [{"id": f"item-{n}"} for n in range(9, 0, -1)]
+
+    async def fake_fetch_raw(query, use_cache=True, client=None):
+        if query.skip == 0:
+            page = feed[: query.top]
+            # Two new updates land before the remaining pages are read
+            feed[:0] = [{"id": "new-2"}, {"id": "new-1"}]
+            return {"@odata.count": 9, "value": page}
+        return {"value": feed[query.skip : query.skip + query.top]}
+
+    monkeypatch.setattr(azure_api, "fetch_raw", fake_fetch_raw)
+
+    items = await fetch_all_items(page_size=3)
+
+    ids = [item["id"] for item in items]
+    assert len(ids) == len(set(ids))
+    assert {f"item-{n}" for n in range(1, 10)} <= set(ids)
+
+
+# ---------------------------------------------------------------------------
+# Unit tests for the feed registry
+# ---------------------------------------------------------------------------
+
+M365_URL = "https://example.com/api/v2/m365"
+
+
+def test_feed_registry_from_env(monkeypatch):
+    """Extra feeds are registered from name=url pairs next to the built-in one."""
+    from azure_updates_mcp.feeds.registry import FEEDS_ENV, get_feeds, resolve_feeds
+
+    monkeypatch.setenv(FEEDS_ENV, f" M365={M365_URL}, ")
+    feeds = get_feeds()
+    assert list(feeds) == ["azure", "m365"]
+    assert feeds["m365"].url == M365_URL
+    assert [feed.name for feed in resolve_feeds(["m365", "AZURE", "m365"])] == ["m365", "azure"]
+
+    with pytest.raises(ValueError, match="Unknown feed: roadmap"):
+        resolve_feeds(["roadmap"])
+    monkeypatch.setenv(FEEDS_ENV, "m365")
+    with pytest.raises(ValueError, match="expected name=url"):
+        get_feeds()
+
+
+@pytest.mark.asyncio
+async def test_fetch_federated_merges_feeds_concurrently(monkeypatch):
+    """Feeds are read at the same time and merged newest first, tagged by feed."""
+    import httpx
+
+    from azure_updates_mcp.feeds.registry import FEEDS_ENV, fetch_federated, resolve_feeds
+
+    monkeypatch.setenv(FEEDS_ENV, f"m365={M365_URL},broken=https://example.com/broken")
+    pages = {
+        None: [
+            {"id": "a3", "title": "a3", "created": "2025-01-03T00:00:00Z"},
+            {"id": "a1", "title": "a1", "created": "2025-01-01T00:00:00Z"},
+        ],
+        M365_URL: [
+            {"id": "m2", "title": "m2", "created": "2025-01-02T00:00:00Z"},
+            {"id": "m0", "title": "m0", "created": "2024-12-31T00:00:00Z"},
+        ],
+    }
+    clients = set()
+
+    async def fake_fetch_raw(query, use_cache=True, client=None):
+        clients.add(id(client))
+        await asyncio.sleep(0.1)
+        if query.base_url not in pages:
+            raise httpx.ConnectError("unreachable")
+        return {"@odata.count": 10, "value": pages[query.base_url][: query.top]}
+
+    monkeypatch.setattr(azure_api, "fetch_raw", fake_fetch_raw)
+
+    began = asyncio.get_running_loop().time()
+    page = await fetch_federated(resolve_feeds(["azure", "m365", "broken"]), top=5)
+    elapsed = asyncio.get_running_loop().time() - began
+
+    assert elapsed < 0.25
+    assert len(clients) == 1
+    assert [(u.id, u.feed) for u in page.updates] == [
+        ("a3", "azure"),
+        ("m2", "m365"),
+        ("a1", "azure"),
+        ("m0", "m365"),
+    ]
+    assert page.updates[0].link.endswith("?id=a3")
+    assert page.total == 20
+    assert page.errors == {"broken": "unreachable"}
+
+
+# ---------------------------------------------------------------------------
+# Unit tests for fetch_updates_since
+# ---------------------------------------------------------------------------
+
+
+def _modified_item(item_id: str, modified: str, status: str = "Launched") -> dict:
+    return {
+        "id": item_id,
+        "title": item_id,
+        "status": status,
+        "created": "2025-01-01T00:00:00Z",
+        "modified": modified,
+    }
+
+
+@pytest.mark.asyncio
+async def test_fetch_updates_since_stops_at_position(monkeypatch):
+    """Paging stops on the page that crosses the position; results are oldest first."""
+    feed = [
+        _modified_item("d", "2025-03-04T00:00:00Z"),
+        _modified_item("c", "2025-03-03T00:00:00Z", status="In preview"),
+        _modified_item("b", "2025-03-02T00:00:00Z"),
+        _modified_item("a", "2025-03-02T00:00:00Z"),  # the cursor position itself
+        _modified_item("z", "2025-03-01T00:00:00Z"),
+        _modified_item("y", "2025-02-01T00:00:00Z"),
+    ]
+    requested = []
+
+    async def fake_fetch_raw(query, use_cache=True):
+        requested.append((query.order_by, query.skip))
+        return {"value": feed[query.skip : query.skip + query.top]}
+
+    monkeypatch.setattr(azure_api, "fetch_raw", fake_fetch_raw)
+
+    updates = await fetch_updates_since(datetime(2025, 3, 2), "a", page_size=2)
+    assert [u.id for u in updates] == ["b", "c", "d"]
+    assert requested == [("modified desc", 0), ("modified desc", 2), ("modified desc", 4)]
+
+    launched = await fetch_updates_since(datetime(2025, 3, 2), "a", status="Launched")
+    assert [u.id for u in launched] == ["b", "d"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_updates_reuses_parsed_items(monkeypatch):
+    """Items seen before with the same modified date are not parsed again."""
+    page = [
+        {**_modified_item("b", "2025-03-02T00:00:00Z"), "description": "<p>Two</p>"},
+        {**_modified_item("a", "2025-03-01T00:00:00Z"), "description": "<p>One</p>"},
+    ]
+    stripped = []
+    strip_html = azure_api.strip_html
+
+    async def fake_fetch_raw(query, use_cache=True):
+        return {"@odata.count": len(page), "value": page}
+
+    def counting_strip_html(html):
+        stripped.append(html)
+        return strip_html(html)
+
+    monkeypatch.setattr(azure_api, "fetch_raw", fake_fetch_raw)
+    monkeypatch.setattr(azure_api, "strip_html", counting_strip_html)
+
+    first, _, _ = await fetch_updates(search="two")
+    again, _, _ = await fetch_updates(search="one", status="Launched")
+    assert [u.id for u in again] == ["b", "a"]
+    assert all(x is y for x, y in zip(first, again))
+    assert len(stripped) == 2
+
+    # An update edited upstream carries a new modified date and is parsed afresh
+    page[0] = {**page[0], "modified": "2025-03-05T00:00:00Z", "description": "<p>Edited</p>"}
+    edited, _, _ = await fetch_updates()
+    assert edited[0].description == "Edited"
+    assert edited[1] is first[1]
+    assert len(stripped) == 3
+
+
 # ---------------------------------------------------------------------------
 # Integration tests (hit real API)
 # ---------------------------------------------------------------------------
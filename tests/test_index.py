@@ -0,0 +1,285 @@
+"""Tests for the corpus indexes."""
+
+from array import array
+from datetime import datetime
+
+import pytest
+
+from azure_updates_mcp.feeds.azure_api import _parse_item
+from azure_updates_mcp.index import (
+    CategoricalColumn,
+    DateColumn,
+    DateIndex,
+    Resolution,
+    SimilarityIndex,
+    TaxonomyResolver,
+    group_near_duplicates,
+    grouped_counts,
+    parse_date_value,
+    snippet,
+    strip_html,
+    token_spans,
+    tokenize,
+)
+from azure_updates_mcp.index.dates import to_epoch
+
+# ---------------------------------------------------------------------------
+# parse_date_value
+# ---------------------------------------------------------------------------
+
+
+def test_parse_date_value_formats():
+    """ISO and coarse availability formats map to the start of their period."""
+    assert parse_date_value("2025-03-31") == datetime(2025, 3, 31)
+    assert parse_date_value("2025-03-31T12:00:00Z") == datetime(2025, 3, 31, 12)
+    assert parse_date_value("2025-03") == datetime(2025, 3, 1)
+    assert parse_date_value("March 2025") == datetime(2025, 3, 1)
+    assert parse_date_value("Mar 2025") == datetime(2025, 3, 1)
+    assert parse_date_value("Q3 2025") == datetime(2025, 7, 1)
+    assert parse_date_value("2025") == datetime(2025, 1, 1)
+
+
+def test_parse_date_value_rejects_unknown():
+    """Empty and unrecognised values parse to None."""
+    assert parse_date_value(None) is None
+    assert parse_date_value("") is None
+    assert parse_date_value("TBD") is None
+    assert parse_date_value("2025-13") is None
+
+
+# ---------------------------------------------------------------------------
+# DateColumn / DateIndex
+# ---------------------------------------------------------------------------
+
+
+def test_date_column_range_bounds_inclusive():
+    """rows_between is inclusive at both ends and accepts open bounds."""
+    days = [datetime(2025, 1, d) for d in (5, 1, 3, 2, 4)]
+    column = DateColumn((to_epoch(day), row) for row, day in enumerate(days))
+
+    assert list(column.epochs) == sorted(column.epochs)
+    assert sorted(column.rows_between(datetime(2025, 1, 2), datetime(2025, 1, 4))) == [2, 3, 4]
+    assert sorted(column.rows_between(None, datetime(2025, 1, 1))) == [1]
+    assert sorted(column.rows_between(datetime(2025, 1, 5), None)) == [0]
+    assert list(column.rows_between(datetime(2025, 2, 1), None)) == []
+
+
+def test_date_index_skips_unparseable_values():
+    """Updates without a parseable date are left out of that field's column."""
+    updates = [
+        _parse_item(
+            {"id": "a", "created": "2025-01-01T00:00:00Z", "generalAvailabilityDate": "Q2 2025"}
+        ),
+        _parse_item(
+            {"id": "b", "created": "2025-01-02T00:00:00Z", "generalAvailabilityDate": "TBD"}
+        ),
+        _parse_item({"id": "c", "created": "2025-01-03T00:00:00Z"}),
+    ]
+    index = DateIndex(updates)
+
+    assert len(index.columns["created"]) == 3
+    assert len(index.columns["general_availability"]) == 1
+    assert index.rows_between("general_availability", datetime(2025, 4, 1), None) == [0]
+
+
+# ---------------------------------------------------------------------------
+# CategoricalColumn / grouped_counts
+# ---------------------------------------------------------------------------
+
+
+def test_categorical_column_encodes_multi_valued_rows():
+    """Each distinct label gets one code; rows contribute one pair per label."""
+    column = CategoricalColumn([["Compute", "AI"], [], ["compute"], ["AI", "AI"]])
+
+    assert column.labels == ["Compute", "AI", "compute"]
+    assert list(column.rows) == [0, 0, 2, 3]
+    assert list(column.codes) == [0, 1, 2, 1]
+    assert column.rows_with("COMPUTE") == {0, 2}
+
+
+def test_grouped_counts_by_month_and_quarter():
+    """Pairs are counted per period over selected rows with a known date."""
+    column = CategoricalColumn([["A"], ["B"], ["A", "B"], ["A"], ["A"]])
+    jan, feb, apr = 2025 * 12, 2025 * 12 + 1, 2025 * 12 + 3
+    months = array("l", [jan, feb, feb, apr, -1])
+    selected = bytearray([1, 1, 1, 1, 1])
+
+    assert grouped_counts(column.rows, column.codes, months, selected) == {
+        (jan, 0): 1,
+        (feb, 1): 2,
+        (feb, 0): 1,
+        (apr, 0): 1,
+    }
+
+    selected[0] = 0
+    q1, q2 = jan // 3, apr // 3
+    assert grouped_counts(column.rows, column.codes, months, selected, 3) == {
+        (q1, 1): 2,
+        (q1, 0): 1,
+        (q2, 0): 1,
+    }
+
+
+def test_grouped_counts_numpy_matches_counter_fallback(monkeypatch):
+    """The NumPy join and bincount give exactly the Counter loop's counts."""
+    import sys
+
+    np = pytest.importorskip("numpy")
+    from azure_updates_mcp.index.groupby import _grouped_counts_numpy
+
+    column = CategoricalColumn(
+        [["A", "C"], ["B"], [], ["A", "B", "C"], ["C"], ["A"], ["B", "A"], ["C"]]
+    )
+    months = array("l", [24300, 24301, 24301, -1, 24305, 24300, 24311, 24312])
+    selected = bytearray([1, 1, 1, 1, 1, 0, 1, 1])
+
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    for months_per_period in (1, 3, 12):
+        expected = grouped_counts(column.rows, column.codes, months, selected, months_per_period)
+        assert expected
+        assert (
+            _grouped_counts_numpy(
+                np, column.rows, column.codes, months, selected, months_per_period
+            )
+            == expected
+        )
+
+    assert grouped_counts(column.rows, column.codes, months, bytearray(8)) == {}
+    assert _grouped_counts_numpy(np, column.rows, column.codes, months, bytearray(8), 1) == {}
+
+
+# ---------------------------------------------------------------------------
+# SimilarityIndex / near duplicates
+# ---------------------------------------------------------------------------
+
+
+def _text_update(item_id: str, title: str, description: str, products: list[str] | None = None):
+    return _parse_item(
+        {
+            "id": item_id,
+            "title": title,
+            "description": description,
+            "created": "2025-01-01T00:00:00Z",
+            "products": products or [],
+        }
+    )
+
+
+def test_strip_html_and_tokenize():
+    """Tags and entities are removed; version-like tokens stay whole."""
+    assert strip_html("<p>Azure&nbsp;SQL <b>v12.0</b></p>") == "Azure SQL v12.0"
+    assert tokenize("Azure SQL v12.0, C# & AI+ML!") == ["azure", "sql", "v12.0", "c#", "ai+ml"]
+
+
+def test_snippet_highlights_and_bounds():
+    """Snippets wrap matching tokens and stay within the character budget."""
+    short = "Azure Functions now supports Python 3.12."
+    assert snippet(short, token_spans(short), ["python"]) == (
+        "Azure Functions now supports **Python** 3.12."
+    )
+
+    text = " ".join(f"word{i}" for i in range(200)) + " Kubernetes support " + "tail " * 50
+    excerpt = snippet(text, token_spans(text), ["kube"], max_chars=80)
+    assert "**Kubernetes**" in excerpt
+    assert excerpt.startswith("…") and excerpt.endswith("…")
+    assert len(excerpt.replace("**", "").strip("…")) <= 80
+
+    assert snippet(text, token_spans(text), ["absent"], max_chars=40).startswith("word0 word1")
+
+
+def test_similarity_ranks_related_updates_first():
+    """Updates sharing title words and products score above unrelated ones."""
+    updates = [
+        _text_update("a", "AKS node autoscaling preview", "Autoscale AKS node pools.", ["AKS"]),
+        _text_update("b", "AKS node autoscaling now GA", "Autoscale AKS node pools GA.", ["AKS"]),
+        _text_update("c", "Cosmos DB vector search", "Vector search in Cosmos DB.", ["Cosmos DB"]),
+        _text_update("d", "AKS cost analysis", "See AKS costs.", ["AKS"]),
+    ]
+    index = SimilarityIndex(updates)
+
+    ranked = index.most_similar(0)
+    assert [row for row, _ in ranked][:2] == [1, 3]
+    assert 0 < ranked[0][1] <= 1.0
+    assert index.scores(0)[0] == pytest.approx(1.0)
+
+
+def test_similarity_numpy_matches_pure_python(monkeypatch):
+    """The bincount scores equal the dict accumulation, featureless rows included."""
+    import sys
+
+    pytest.importorskip("numpy")
+    updates = [
+        _text_update("a", "AKS node autoscaling preview", "Autoscale AKS node pools.", ["AKS"]),
+        _text_update("b", "AKS node autoscaling now GA", "Autoscale AKS node pools GA.", ["AKS"]),
+        _text_update("c", "Cosmos DB vector search", "Vector search in Cosmos DB.", ["Cosmos DB"]),
+        _text_update("empty", "", ""),
+    ]
+    index = SimilarityIndex(updates)
+    with_numpy = [index.scores(row) for row in range(len(updates))]
+
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    pure = [index.scores(row) for row in range(len(updates))]
+
+    assert with_numpy[3] == pure[3] == {}
+    assert index.most_similar(3) == []
+    for fast, slow in zip(with_numpy, pure):
+        assert fast.keys() == slow.keys()
+        assert all(fast[row] == pytest.approx(slow[row]) for row in slow)
+
+
+def test_group_near_duplicates_keeps_first_occurrence():
+    """Re-posted announcements fall in one group headed by the first copy."""
+    body = (
+        "Azure Monitor now supports exporting platform metrics to storage accounts "
+        "and event hubs with diagnostic settings in every public region."
+    )
+    updates = [
+        _text_update("first", "Metrics export GA", body),
+        _text_update("other", "Cosmos DB vector search", "Vector search in Cosmos DB."),
+        _text_update("copy", "Metrics export GA", body + " Learn more."),
+    ]
+
+    assert group_near_duplicates(updates) == [[0, 2], [1]]
+
+
+# ---------------------------------------------------------------------------
+# TaxonomyResolver
+# ---------------------------------------------------------------------------
+
+_FACETS = {
+    "products": [
+        {"name": "Azure Kubernetes Service (AKS)", "count": 40},
+        {"name": "Azure Kubernetes Fleet Manager", "count": 3},
+        {"name": "Azure Functions", "count": 25},
+        {"name": "Azure Cosmos DB", "count": 30},
+    ],
+    "product_categories": [
+        {"name": "Compute", "count": 90},
+        {"name": "Management and governance", "count": 40},
+    ],
+    "tags": [{"name": "Retirements", "count": 12}],
+}
+
+
+def test_taxonomy_resolver_aliases_and_typos():
+    """Acronyms, shorthand, and typos resolve to the canonical name."""
+    resolver = TaxonomyResolver(_FACETS)
+    aks = "Azure Kubernetes Service (AKS)"
+
+    assert resolver.resolve("product", "AKS") == Resolution(aks, "alias", 1.0)
+    assert resolver.resolve("product", "kubernetes service").name == aks
+    assert resolver.resolve("product", "Kubernetes Svc").name == aks
+    assert resolver.resolve("product", "Azure Kubernets Service").match == "trigram"
+    assert resolver.resolve("product", "Azure Kubernets Service").name == aks
+    assert resolver.resolve("product_category", "management & governance").match == "exact"
+    assert resolver.resolve("product", "Quantum teleporter") is None
+
+
+def test_taxonomy_resolver_knows_filter_semantics():
+    """knows() mirrors the filters: exact for product, substring for category."""
+    resolver = TaxonomyResolver(_FACETS)
+
+    assert resolver.knows("product", "azure functions")
+    assert not resolver.knows("product", "Functions")
+    assert resolver.knows("category", "Functions")
+    assert resolver.resolve("category", "Retirments").name == "Retirements"
@@ -0,0 +1,18 @@
+"""Tests for MCP server startup."""
+
+import subprocess
+import sys
+
+
+def test_server_import_defers_feed_client():
+    """Importing the server must not load the feed client or update models."""
+    code = (
+        "import sys, azure_updates_mcp.server; "
+        "print(','.join(m for m in sys.modules if m.startswith('azure_updates_mcp')))"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    loaded = proc.stdout.strip().split(",")
+
+    assert "azure_updates_mcp.server" in loaded
+    assert "azure_updates_mcp.feeds.azure_api" not in loaded
+    assert "azure_updates_mcp.models.update" not in loaded
@@ -0,0 +1,228 @@
+"""Tests for the SQLite store and corpus sync leadership."""
+
+import time
+
+import pytest
+
+from azure_updates_mcp.feeds import azure_api
+from azure_updates_mcp.store import UpdateStore
+from azure_updates_mcp.sync import sync_once, try_acquire_leader
+
+
+def _item(item_id: str, created: str) -> dict:
+    return {"id": item_id, "title": f"Update {item_id}", "created": created}
+
+
+def test_replace_items_bumps_version():
+    """Each corpus rewrite produces a new version and replaces old rows."""
+    store = UpdateStore()
+    assert store.version == 0
+    assert store.synced_at is None
+
+    v1 = store.replace_items([_item("a", "2025-01-01T00:00:00Z")])
+    v2 = store.replace_items([_item("b", "2025-01-02T00:00:00Z")])
+
+    assert (v1, v2) == (1, 2)
+    assert store.get_item("a") is None
+    assert store.get_item("b")["title"] == "Update b"
+    assert store.count_items() == 1
+    assert store.synced_at is not None
+
+
+def test_unchanged_sync_keeps_version():
+    """A sync that finds every item as stored rewrites nothing but the sync time."""
+    store = UpdateStore()
+    items = [_item("a", "2025-01-01T00:00:00Z"), _item("b", "2025-01-02T00:00:00Z")]
+    v1 = store.replace_items(items)
+    first_sync = store.synced_at
+    time.sleep(0.01)
+
+    assert store.replace_items(list(reversed(items))) == v1
+    assert store.version == v1
+    assert store.synced_at > first_sync
+    assert store.list_changes() == []
+    assert store.list_history(0) == []
+
+    changed = [items[0], {**items[1], "title": "Renamed"}]
+    assert store.replace_items(changed) == v1 + 1
+    assert store.get_item("b")["title"] == "Renamed"
+
+
+def test_get_items_batches_lookups():
+    """get_items returns every known id from one query and skips unknown ones."""
+    store = UpdateStore()
+    store.replace_items([_item("a", "2025-01-01T00:00:00Z"), _item("b", "2025-01-02T00:00:00Z")])
+
+    items = store.get_items(["b", "missing", "a", "b"])
+
+    assert {key: item["title"] for key, item in items.items()} == {
+        "a": "Update a",
+        "b": "Update b",
+    }
+    assert store.get_items([]) == {}
+
+
+def test_load_items_newest_first():
+    """load_items returns raw items ordered by created descending."""
+    store = UpdateStore()
+    store.replace_items(
+        [
+            _item("old", "2024-01-01T00:00:00Z"),
+            _item("new", "2025-01-01T00:00:00Z"),
+            {"title": "no id is skipped"},
+        ]
+    )
+
+    assert [item["id"] for item in store.load_items()] == ["new", "old"]
+
+
+def test_response_cache_expires():
+    """Cached responses are returned until their TTL passes."""
+    store = UpdateStore(cache_ttl=60)
+    store.put_response("url", "body")
+    store.put_response("short", "body", ttl=0.01)
+    store.put_response("disabled", "body", ttl=0)
+
+    time.sleep(0.02)
+
+    assert store.get_response("url") == "body"
+    assert store.get_response("short") is None
+    assert store.get_response("disabled") is None
+    # Expired bodies stay available as a fallback for calls near their deadline
+    assert store.get_response("short", allow_stale=True) == "body"
+
+
+def test_shared_store_visible_across_connections(tmp_path):
+    """Two stores opened on the same file see each other's writes."""
+    path = str(tmp_path / "store.sqlite3")
+    writer = UpdateStore(path)
+    reader = UpdateStore(path)
+
+    writer.replace_items([_item("x", "2025-01-01T00:00:00Z")])
+    writer.put_response("url", "cached")
+
+    assert reader.is_shared
+    assert reader.version == 1
+    assert reader.get_item("x") is not None
+    assert reader.get_response("url") == "cached"
+
+
+def test_only_one_sync_leader(tmp_path):
+    """The sync lock can be held by one holder at a time."""
+    path = str(tmp_path / "store.sqlite3")
+
+    leader = try_acquire_leader(path)
+    assert leader is not None
+    assert try_acquire_leader(path) is None
+
+    leader.close()
+    successor = try_acquire_leader(path)
+    assert successor is not None
+    successor.close()
+
+
+def test_replace_items_records_changes():
+    """Syncs after the baseline log added, modified, and removed updates."""
+    store = UpdateStore()
+    store.replace_items(
+        [
+            {"id": "keep", "title": "Keep", "created": "2025-01-01", "modified": "m1"},
+            {"id": "edit", "title": "Edit", "created": "2025-01-01", "modified": "m1"},
+            {"id": "drop", "title": "Drop", "created": "2025-01-01", "modified": "m1"},
+        ]
+    )
+    assert store.latest_change_seq() == 0
+
+    store.replace_items(
+        [
+            {"id": "keep", "title": "Keep", "created": "2025-01-01", "modified": "m1"},
+            {"id": "edit", "title": "Edited", "status": "Launched", "modified": "m2"},
+            {"id": "new", "title": "New", "created": "2025-02-01", "modified": "m1"},
+        ]
+    )
+
+    changes = {c["id"]: c for c in store.list_changes()}
+    assert set(changes) == {"edit", "drop", "new"}
+    assert changes["edit"]["change"] == "modified"
+    assert changes["edit"]["status"] == "Launched"
+    assert changes["drop"]["change"] == "removed"
+    assert changes["drop"]["title"] == "Drop"
+    assert changes["new"]["change"] == "added"
+
+    last_seq = store.latest_change_seq()
+    assert store.list_changes(after_seq=last_seq) == []
+
+
+def test_replace_items_records_field_history():
+    """Syncs append one delta record per update whose tracked fields changed."""
+    store = UpdateStore()
+    base = {"created": "2025-01-01", "modified": "m1", "status": "In preview"}
+    store.replace_items(
+        [
+            {"id": "keep", "title": "Keep", **base},
+            {"id": "retitle", "title": "Old title", **base},
+            {"id": "launch", "title": "Launch", **base, "generalAvailabilityDate": "2025-06"},
+            {"id": "drop", "title": "Drop", **base},
+        ]
+    )
+    assert store.history_since is not None
+    assert store.list_history(0) == []
+
+    version = store.replace_items(
+        [
+            {"id": "keep", "title": "Keep", **base},
+            # A change outside the tracked fields records nothing
+            {"id": "retitle", "title": "New title", **base},
+            {
+                "id": "launch",
+                "title": "Launch",
+                **base,
+                "status": "Launched",
+                "generalAvailabilityDate": "2025-07",
+            },
+            {"id": "new", "title": "New", **base},
+        ]
+    )
+
+    history = {record["id"]: record for record in store.list_history(0)}
+    assert set(history) == {"launch", "drop", "new"}
+    assert history["launch"]["change"] == "modified"
+    assert history["launch"]["version"] == version
+    assert history["launch"]["delta"] == {
+        "status": ["In preview", "Launched"],
+        "general_availability_date": ["2025-06", "2025-07"],
+    }
+    assert history["drop"]["change"] == "removed"
+    assert history["drop"]["delta"]["status"] == ["In preview", None]
+    assert history["new"]["delta"] == {"status": [None, "In preview"], "modified": [None, "m1"]}
+
+    recorded_at = history["new"]["recorded_at"]
+    assert store.list_history(recorded_at) == []
+    assert len(store.list_history(0, until=recorded_at)) == 3
+
+
+@pytest.mark.asyncio
+async def test_sync_keeps_corpus_when_upstream_returns_nothing(monkeypatch):
+    """An empty or short upstream answer is refused instead of removing every update."""
+    store = UpdateStore()
+    items = [_item(item_id, "2025-01-01T00:00:00Z") for item_id in ("a", "b", "c")]
+    version = store.replace_items(items)
+    pages = {"@odata.count": 0, "value": []}
+
+    async def fake_fetch_raw(query, use_cache=True, client=None):
+        return pages
+
+    monkeypatch.setattr(azure_api, "fetch_raw", fake_fetch_raw)
+
+    with pytest.raises(ValueError, match="no updates"):
+        await sync_once(store)
+
+    # Counted but not returned
+    pages = {"@odata.count": 3, "value": []}
+    with pytest.raises(ValueError, match="0 of 3"):
+        await sync_once(store)
+
+    assert store.version == version
+    assert store.count_items() == 3
+    assert store.list_changes() == []
+    assert store.list_history(0) == []
@@ -182,6 +182,526 @@ async def test_search_total_found_reflects_api_count():
     assert result["total_found"] >= len(result["updates"])
 
 
+@pytest.mark.asyncio
+async def test_search_since_cursor_round_trip(monkeypatch, memory_store):
+    """since returns changes oldest first and a cursor that skips them next time."""
+    from azure_updates_mcp.feeds import azure_api
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    feed = [
+        {
+            "id": "new",
+            "title": "New",
+            "products": ["AKS"],
+            "created": "2025-03-01T00:00:00Z",
+            "modified": "2025-03-03T00:00:00Z",
+        },
+        {
+            "id": "edited",
+            "title": "Edited",
+            "products": ["VMs"],
+            "created": "2024-01-01T00:00:00Z",
+            "modified": "2025-03-02T00:00:00Z",
+        },
+        {
+            "id": "old",
+            "title": "Old",
+            "created": "2024-01-01T00:00:00Z",
+            "modified": "2025-01-01T00:00:00Z",
+        },
+    ]
+
+    async def fake_fetch_raw(query, use_cache=True):
+        return {"value": feed[query.skip : query.skip + query.top]}
+
+    monkeypatch.setattr(azure_api, "fetch_raw", fake_fetch_raw)
+
+    first = await azure_updates_search(since="2025-02-01")
+    assert [u["id"] for u in first["updates"]] == ["edited", "new"]
+    assert first["has_more"] is False
+    assert first["filters_applied"]["since"] == "2025-02-01"
+
+    second = await azure_updates_search(since=first["next_cursor"])
+    assert second["updates"] == []
+    assert second["next_cursor"] == first["next_cursor"]
+
+    paged = await azure_updates_search(since="2025-02-01", limit=1)
+    assert [u["id"] for u in paged["updates"]] == ["edited"]
+    assert paged["has_more"] is True
+    rest = await azure_updates_search(since=paged["next_cursor"], limit=1)
+    assert [u["id"] for u in rest["updates"]] == ["new"]
+
+    # A zero limit still advances, so looping on has_more terminates
+    zero = await azure_updates_search(since="2025-02-01", limit=0)
+    assert [u["id"] for u in zero["updates"]] == ["edited"]
+    assert zero["next_cursor"] == paged["next_cursor"]
+
+    filtered = await azure_updates_search(since="2025-02-01", product="AKS")
+    assert [u["id"] for u in filtered["updates"]] == ["new"]
+
+
+@pytest.mark.asyncio
+async def test_search_invalid_since_returns_error():
+    """An unparseable since value is reported in filters_applied."""
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    result = await azure_updates_search(since="not-a-cursor")
+
+    assert result["updates"] == []
+    assert "error" in result["filters_applied"]
+
+
+def _fake_feed(monkeypatch, feed: list[dict]) -> list[int]:
+    """Serve ``feed`` (newest first) as the API and return the requested skips."""
+    from azure_updates_mcp.feeds import azure_api
+
+    skips = []
+
+    async def fake_fetch_raw(query, use_cache=True):
+        skips.append(query.skip)
+        return {"@odata.count": len(feed), "value": feed[query.skip : query.skip + query.top]}
+
+    monkeypatch.setattr(azure_api, "fetch_raw", fake_fetch_raw)
+    return skips
+
+
+@pytest.mark.asyncio
+async def test_search_query_returns_snippets(monkeypatch, memory_store):
+    """Keyword results carry a highlighted snippet instead of the description."""
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    description = "<p>Intro text.</p><p>Node <b>autoscaling</b> is now available for AKS.</p>"
+    _fake_feed(
+        monkeypatch,
+        [{**_dated_item(1), "title": "AKS autoscaling", "description": description}],
+    )
+
+    result = await azure_updates_search(query="autoscaling")
+    update = result["updates"][0]
+    assert "description" not in update
+    assert update["snippet"] == "Intro text. Node **autoscaling** is now available for AKS."
+
+    full = await azure_updates_search(query="autoscaling", full_description=True)
+    assert full["updates"][0]["description"] == (
+        "Intro text. Node autoscaling is now available for AKS."
+    )
+
+
+def _dated_item(n: int) -> dict:
+    return {"id": f"u{n:03d}", "title": f"Update {n}", "created": f"2025-01-01T00:{n:02d}:00Z"}
+
+
+@pytest.mark.asyncio
+async def test_search_cursor_pages_are_stable(monkeypatch, memory_store):
+    """Cursor pages cover every update once even when new ones arrive mid-browse."""
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    feed = [_dated_item(n) for n in range(30, 0, -1)]
+    skips = _fake_feed(monkeypatch, feed)
+
+    page = await azure_updates_search(limit=10)
+    seen = [u["id"] for u in page["updates"]]
+
+    # Two updates are published between page 1 and page 2
+    feed[:0] = [_dated_item(n) for n in (32, 31)]
+
+    while page["next_cursor"]:
+        skips.clear()
+        page = await azure_updates_search(limit=10, cursor=page["next_cursor"])
+        seen += [u["id"] for u in page["updates"]]
+        assert len(skips) == 1
+
+    assert seen == [f"u{n:03d}" for n in range(30, 0, -1)]
+
+
+@pytest.mark.asyncio
+async def test_search_cursor_with_client_filters(monkeypatch, memory_store):
+    """Filtered cursor pages resume the scan instead of starting from zero."""
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    feed = [
+        {**_dated_item(n), "products": ["AKS" if n % 3 == 0 else "VMs"]} for n in range(59, 0, -1)
+    ]
+    skips = _fake_feed(monkeypatch, feed)
+
+    page = await azure_updates_search(product="AKS", limit=4)
+    seen = [u["id"] for u in page["updates"]]
+    while page["next_cursor"]:
+        skips.clear()
+        page = await azure_updates_search(product="AKS", limit=4, cursor=page["next_cursor"])
+        seen += [u["id"] for u in page["updates"]]
+        assert all(skip > 0 for skip in skips)
+
+    assert seen == [f"u{n:03d}" for n in range(57, 0, -3)]
+
+
+@pytest.mark.asyncio
+async def test_search_status_with_client_filters_pages_through(monkeypatch, memory_store):
+    """Status is matched with the other client filters, so paging does not stop early."""
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    def item(n: int) -> dict:
+        return {
+            "id": f"u{n:03d}",
+            "title": f"Update {n}",
+            "created": f"2025-01-{1 + n // 24:02d}T{n % 24:02d}:00:00Z",
+            "status": "Launched" if n % 2 == 0 else "In preview",
+            "products": ["AKS" if n % 5 == 0 else "VMs"],
+        }
+
+    # 200 updates, 20 of them Launched for AKS
+    _fake_feed(monkeypatch, [item(n) for n in range(199, -1, -1)])
+
+    # The first 50-item window holds only 5 matches; the rest are behind the cursor
+    page = await azure_updates_search(status="Launched", product="AKS", limit=10)
+    seen = [u["id"] for u in page["updates"]]
+    assert seen == ["u190", "u180", "u170", "u160", "u150"]
+    assert page["next_cursor"] is not None
+
+    while page["next_cursor"]:
+        page = await azure_updates_search(
+            status="Launched", product="AKS", limit=10, cursor=page["next_cursor"]
+        )
+        seen += [u["id"] for u in page["updates"]]
+
+    assert seen == [f"u{n:03d}" for n in range(190, -1, -10)]
+
+
+@pytest.mark.asyncio
+async def test_search_status_offset_pages_deep(monkeypatch, memory_store):
+    """Offsets past the first window count matches off instead of dead-ending."""
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    from datetime import datetime, timedelta
+
+    def item(n: int) -> dict:
+        return {
+            "id": f"u{n:04d}",
+            "title": f"Update {n}",
+            "created": (datetime(2025, 6, 1) - timedelta(minutes=n)).isoformat() + "Z",
+            "status": "Retirements" if n % 2 == 0 else "Launched",
+        }
+
+    # 1000 updates, newest first, half of them Retirements
+    feed = [item(n) for n in range(1000)]
+    retirements = [i["id"] for i in feed if i["status"] == "Retirements"]
+    _fake_feed(monkeypatch, feed)
+
+    page = await azure_updates_search(status="Retirements", offset=50, limit=10)
+    assert [u["id"] for u in page["updates"]] == retirements[50:60]
+    assert page["next_cursor"] is not None
+
+    following = await azure_updates_search(
+        status="Retirements", limit=10, cursor=page["next_cursor"]
+    )
+    assert [u["id"] for u in following["updates"]] == retirements[60:70]
+
+    # A first window with no match still hands back a cursor past it
+    sparse = [{**i, "status": "Launched"} for i in feed[:60]] + feed[60:]
+    _fake_feed(monkeypatch, sparse)
+    empty = await azure_updates_search(status="Retirements", limit=10)
+    assert empty["updates"] == []
+    assert empty["next_cursor"] is not None
+    after = await azure_updates_search(status="Retirements", limit=10, cursor=empty["next_cursor"])
+    assert after["updates"][0]["id"] == next(
+        i["id"] for i in sparse[50:] if i["status"] == "Retirements"
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_invalid_cursor_returns_error():
+    """A malformed page cursor is reported in filters_applied."""
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    result = await azure_updates_search(cursor="bogus")
+
+    assert result["updates"] == []
+    assert "error" in result["filters_applied"]
+
+
+# ---------------------------------------------------------------------------
+# azure_updates_search over the local corpus
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def corpus_store(memory_store):
+    """An in-memory store holding a small synced corpus."""
+    memory_store.replace_items(
+        [
+            {
+                "id": "ga-soon",
+                "title": "GA soon",
+                "status": "In preview",
+                "created": "2025-01-10T00:00:00Z",
+                "productCategories": ["Compute"],
+                "generalAvailabilityDate": "2025-08-15",
+            },
+            {
+                "id": "ga-quarter",
+                "title": "GA in Q3",
+                "status": "In development",
+                "created": "2025-01-05T00:00:00Z",
+                "productCategories": ["Databases"],
+                "generalAvailabilityDate": "Q3 2025",
+            },
+            {
+                "id": "ga-later",
+                "title": "GA later",
+                "status": "Launched",
+                "created": "2025-01-01T00:00:00Z",
+                "productCategories": ["Compute"],
+                "generalAvailabilityDate": "2026-01-01",
+            },
+        ]
+    )
+    return memory_store
+
+
+@pytest.mark.asyncio
+async def test_search_by_ga_date_range(corpus_store):
+    """date_field ranges are answered from the corpus date index."""
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    result = await azure_updates_search(
+        date_field="general_availability", start_date="2025-07-01", end_date="2025-09-30"
+    )
+
+    assert [u["id"] for u in result["updates"]] == ["ga-soon", "ga-quarter"]
+    assert result["total_found"] == 2
+    assert result["filters_applied"]["date_field"] == "general_availability"
+
+    compute = await azure_updates_search(
+        date_field="general_availability", start_date="2025-01-01", product_category="Compute"
+    )
+    assert [u["id"] for u in compute["updates"]] == ["ga-soon", "ga-later"]
+
+
+@pytest.mark.asyncio
+async def test_search_retiring_within_days(memory_store):
+    """retiring_within_days finds Retirements dated between today and the horizon."""
+    from datetime import datetime, timedelta
+
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    def retirement(item_id: str, days: int, status: str = "Retirements") -> dict:
+        date = (datetime.now() + timedelta(days=days)).strftime("%Y-%m-%d")
+        return {
+            "id": item_id,
+            "title": item_id,
+            "status": status,
+            "created": "2025-01-01T00:00:00Z",
+            "generalAvailabilityDate": date,
+        }
+
+    memory_store.replace_items(
+        [
+            retirement("soon", 30),
+            retirement("far", 200),
+            retirement("past", -10),
+            retirement("launch", 30, status="Launched"),
+        ]
+    )
+
+    result = await azure_updates_search(retiring_within_days=90)
+
+    assert [u["id"] for u in result["updates"]] == ["soon"]
+    assert result["filters_applied"]["retiring_within_days"] == 90
+    assert result["filters_applied"]["status"] == "Retirements"
+
+
+@pytest.mark.asyncio
+async def test_search_created_range_from_corpus_with_cursor(memory_store):
+    """With a corpus loaded, created ranges page through exact matches."""
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    memory_store.replace_items(
+        [
+            {"id": f"u{n:02d}", "title": "t", "created": f"2025-01-{n:02d}T00:00:00Z"}
+            for n in range(1, 21)
+        ]
+    )
+
+    page = await azure_updates_search(start_date="2025-01-05", end_date="2025-01-14", limit=4)
+    assert page["total_found"] == 10
+    seen = [u["id"] for u in page["updates"]]
+    while page["next_cursor"]:
+        page = await azure_updates_search(
+            start_date="2025-01-05", end_date="2025-01-14", limit=4, cursor=page["next_cursor"]
+        )
+        seen += [u["id"] for u in page["updates"]]
+
+    assert seen == [f"u{n:02d}" for n in range(14, 4, -1)]
+
+
+@pytest.mark.asyncio
+async def test_search_corpus_facets_reflect_filters(corpus_store):
+    """Facets computed from the corpus count only the matching updates."""
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    result = await azure_updates_search(product_category="Compute", include_facets=True, limit=0)
+
+    assert result["updates"] == []
+    assert result["total_found"] == 2
+    assert result["facets"]["product_categories"] == [{"name": "Compute", "count": 2}]
+
+
+@pytest.mark.asyncio
+async def test_search_invalid_date_field_returns_error():
+    """Unknown date_field values are reported in filters_applied."""
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    result = await azure_updates_search(date_field="bogus", start_date="2025-01-01")
+
+    assert result["updates"] == []
+    assert "error" in result["filters_applied"]
+
+
+@pytest.mark.asyncio
+async def test_search_resolves_fuzzy_product_names(memory_store):
+    """Acronyms and typos in product filters resolve to the canonical name."""
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    memory_store.replace_items(
+        [
+            {
+                "id": f"k{n}",
+                "title": f"AKS update {n}",
+                "created": f"2025-03-0{n}T00:00:00Z",
+                "products": ["Azure Kubernetes Service (AKS)"],
+                "productCategories": ["Compute", "Containers"],
+            }
+            for n in range(1, 4)
+        ]
+    )
+
+    result = await azure_updates_search(product="AKS")
+    assert result["total_found"] == 3
+    assert result["filters_applied"]["product"] == "Azure Kubernetes Service (AKS)"
+    assert result["filters_applied"]["resolved"]["product"] == {
+        "input": "AKS",
+        "name": "Azure Kubernetes Service (AKS)",
+        "match": "alias",
+        "score": 1.0,
+    }
+
+    typo = await azure_updates_search(product_category="Containrs")
+    assert typo["total_found"] == 3
+    assert typo["filters_applied"]["resolved"]["product_category"]["match"] == "trigram"
+
+    exact = await azure_updates_search(product_category="compute")
+    assert "resolved" not in exact["filters_applied"]
+
+
+@pytest.fixture
+def similar_store(memory_store):
+    """An in-memory store with related, unrelated, and re-posted updates."""
+    body = (
+        "Azure Monitor now supports exporting platform metrics to storage accounts "
+        "and event hubs with diagnostic settings in every public region."
+    )
+
+    def item(item_id: str, title: str, description: str, products: list[str], day: int) -> dict:
+        return {
+            "id": item_id,
+            "title": title,
+            "description": description,
+            "status": "Launched",
+            "created": f"2025-02-{day:02d}T00:00:00Z",
+            "products": products,
+            "productCategories": ["Management and governance"],
+        }
+
+    memory_store.replace_items(
+        [
+            item(
+                "aks-preview", "AKS node autoscaling preview", "Autoscale node pools.", ["AKS"], 1
+            ),
+            item("aks-ga", "AKS node autoscaling GA", "Autoscale node pools, now GA.", ["AKS"], 2),
+            item("cosmos", "Cosmos DB vector search", "Vector search.", ["Cosmos DB"], 3),
+            item("metrics", "Metrics export GA", body, ["Azure Monitor"], 4),
+            item("metrics-copy", "Metrics export GA", body + " Learn more.", ["Azure Monitor"], 5),
+        ]
+    )
+    return memory_store
+
+
+@pytest.mark.asyncio
+async def test_search_similar_to(similar_store):
+    """similar_to ranks the closest updates first and leaves out the source."""
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    result = await azure_updates_search(similar_to="aks-preview", limit=2)
+
+    assert result["updates"][0]["id"] == "aks-ga"
+    assert "aks-preview" not in [u["id"] for u in result["updates"]]
+    assert 0 < result["updates"][0]["similarity"] <= 1
+    assert result["filters_applied"] == {"similar_to": "aks-preview"}
+
+    filtered = await azure_updates_search(similar_to="aks-preview", product="Cosmos DB")
+    assert [u["id"] for u in filtered["updates"]] in ([], ["cosmos"])
+
+    missing = await azure_updates_search(similar_to="nope")
+    assert "error" in missing["filters_applied"]
+
+
+@pytest.mark.asyncio
+async def test_search_collapse_duplicates(similar_store):
+    """Near-duplicate updates on a page are folded into the first one."""
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    result = await azure_updates_search(
+        product_category="Management and governance", collapse_duplicates=True
+    )
+
+    ids = [u["id"] for u in result["updates"]]
+    assert ids == ["metrics-copy", "cosmos", "aks-ga", "aks-preview"]
+    assert result["updates"][0]["near_duplicates"] == ["metrics"]
+    assert result["collapsed"] == 1
+    assert result["total_found"] == 5
+
+
+@pytest.mark.asyncio
+async def test_private_corpus_is_refreshed_after_sync_interval(monkeypatch, memory_store):
+    """An out-of-date private corpus is bypassed by searches and re-backfilled on use."""
+    import asyncio
+
+    from azure_updates_mcp.corpus import get_corpus
+    from azure_updates_mcp.feeds import azure_api
+    from azure_updates_mcp.sync import SYNC_INTERVAL_ENV
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    feed = [
+        {**_dated_item(2), "products": ["AKS"]},
+        {**_dated_item(1), "products": ["VMs"]},
+    ]
+    requests = []
+
+    async def fake_fetch_raw(query, use_cache=True, client=None):
+        requests.append(query.skip)
+        return {"@odata.count": len(feed), "value": feed[query.skip : query.skip + query.top]}
+
+    monkeypatch.setattr(azure_api, "fetch_raw", fake_fetch_raw)
+    monkeypatch.setenv(SYNC_INTERVAL_ENV, "0.05")
+    memory_store.replace_items(list(feed))
+
+    fresh = await azure_updates_search(product="AKS")
+    assert [u["id"] for u in fresh["updates"]] == ["u002"]
+    assert requests == []
+
+    # Published upstream after the corpus was synced
+    feed.insert(0, {**_dated_item(3), "products": ["AKS"]})
+    await asyncio.sleep(0.06)
+
+    stale = await azure_updates_search(product="AKS")
+    assert [u["id"] for u in stale["updates"]] == ["u003", "u002"]
+    assert requests
+
+    corpus = await get_corpus()
+    assert corpus.get("u003") is not None
+    assert memory_store.version == 2
+
+
 # ---------------------------------------------------------------------------
 # azure_updates_search with include_facets
 # ---------------------------------------------------------------------------
@@ -256,3 +776,395 @@ async def test_search_with_facets_and_filters():
     assert isinstance(result["facets"], dict)
     for update in result["updates"]:
         assert update["status"].lower() == "launched"
+
+
+# ---------------------------------------------------------------------------
+# azure_updates_analytics
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def analytics_store(memory_store):
+    """An in-memory store with updates spread over three months."""
+
+    def item(n: int, created: str, status: str, categories: list[str]) -> dict:
+        return {
+            "id": f"a{n}",
+            "title": f"Update {n}",
+            "status": status,
+            "created": created,
+            "productCategories": categories,
+        }
+
+    memory_store.replace_items(
+        [
+            item(1, "2025-01-10T00:00:00Z", "Retirements", ["Compute"]),
+            item(2, "2025-01-20T00:00:00Z", "Launched", ["Compute", "Databases"]),
+            item(3, "2025-03-05T00:00:00Z", "Retirements", ["Compute"]),
+            item(4, "2025-03-06T00:00:00Z", "Retirements", ["Databases"]),
+            item(5, "2025-04-01T00:00:00Z", "In preview", ["AI + machine learning"]),
+        ]
+    )
+    return memory_store
+
+
+@pytest.mark.asyncio
+async def test_analytics_counts_by_month(analytics_store):
+    """Monthly series are contiguous and aligned with the period labels."""
+    from azure_updates_mcp.tools.analytics import azure_updates_analytics
+
+    result = await azure_updates_analytics(
+        group_by="status", status="Retirements", product_category="Compute"
+    )
+
+    assert result["periods"] == ["2025-01", "2025-02", "2025-03"]
+    assert result["series"] == [{"name": "Retirements", "total": 2, "counts": [1, 0, 1]}]
+    assert result["filters_applied"]["product_category"] == "Compute"
+
+
+@pytest.mark.asyncio
+async def test_analytics_quarters_with_top_and_other(analytics_store):
+    """Groups past top are summed into an Other series."""
+    from azure_updates_mcp.tools.analytics import azure_updates_analytics
+
+    result = await azure_updates_analytics(
+        group_by="product_category", interval="quarter", end_date="2025-03-31", top=1
+    )
+
+    assert result["periods"] == ["2025-Q1"]
+    assert result["series"] == [
+        {"name": "Compute", "total": 3, "counts": [3]},
+        {"name": "Other", "total": 2, "counts": [2]},
+    ]
+    assert result["total"] == 5
+
+
+@pytest.mark.asyncio
+async def test_analytics_invalid_group_by(analytics_store):
+    """Unknown group_by values are reported in filters_applied."""
+    from azure_updates_mcp.tools.analytics import azure_updates_analytics
+
+    result = await azure_updates_analytics(group_by="color")
+
+    assert result["series"] == []
+    assert "error" in result["filters_applied"]
+
+
+@pytest.mark.asyncio
+async def test_analytics_invalid_dates_name_the_bad_value(analytics_store):
+    """Each malformed date is reported with the parameter it came from."""
+    from azure_updates_mcp.tools.analytics import azure_updates_analytics
+
+    result = await azure_updates_analytics(end_date="next month")
+    assert result["filters_applied"]["error"] == "Invalid end_date format: next month"
+
+    result = await azure_updates_analytics(start_date="2025-13-01", end_date="2025-06-01")
+    assert result["filters_applied"]["error"] == "Invalid start_date format: 2025-13-01"
+
+
+# ---------------------------------------------------------------------------
+# azure_updates_changes
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def change_store(memory_store):
+    """An in-memory store with one sync's worth of changes recorded."""
+    memory_store.replace_items([{"id": "a", "title": "A", "created": "2025-01-01T00:00:00Z"}])
+    memory_store.replace_items(
+        [
+            {"id": "a", "title": "A", "created": "2025-01-01T00:00:00Z", "modified": "x"},
+            {"id": "b", "title": "B", "created": "2025-02-01T00:00:00Z"},
+        ]
+    )
+    return memory_store
+
+
+@pytest.mark.asyncio
+async def test_changes_without_cursor_returns_recent(change_store):
+    """First call returns recent changes with full updates and a cursor."""
+    from azure_updates_mcp.tools.changes import azure_updates_changes
+
+    result = await azure_updates_changes()
+
+    assert [c["id"] for c in result["changes"]] == ["a", "b"]
+    assert [c["change"] for c in result["changes"]] == ["modified", "added"]
+    assert result["changes"][1]["update"]["title"] == "B"
+    assert result["next_cursor"]
+    assert result["has_more"] is False
+    assert result["synced_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_changes_cursor_returns_only_new_entries(change_store):
+    """Passing next_cursor back yields only changes recorded afterwards."""
+    from azure_updates_mcp.tools.changes import azure_updates_changes
+
+    first = await azure_updates_changes()
+    change_store.replace_items([{"id": "b", "title": "B", "created": "2025-02-01T00:00:00Z"}])
+
+    second = await azure_updates_changes(cursor=first["next_cursor"])
+
+    assert [(c["id"], c["change"]) for c in second["changes"]] == [("a", "removed")]
+    assert second["changes"][0]["update"] is None
+
+    third = await azure_updates_changes(cursor=second["next_cursor"])
+    assert third["changes"] == []
+
+
+@pytest.mark.asyncio
+async def test_changes_invalid_cursor_returns_error(change_store):
+    """A malformed cursor is reported instead of raising."""
+    from azure_updates_mcp.tools.changes import azure_updates_changes
+
+    result = await azure_updates_changes(cursor="not-a-cursor")
+
+    assert result["changes"] == []
+    assert "error" in result
+
+
+def _fake_upstream(monkeypatch, feed: list[dict], hang_from_skip: dict) -> None:
+    """Serve ``feed`` over a mock HTTP transport.
+
+    Pages at or past ``hang_from_skip["skip"]`` hang, as a stalled upstream would.
+    """
+    import asyncio
+    import json
+
+    import httpx
+
+    async def handler(request):
+        skip = int(request.url.params["skip"])
+        top = int(request.url.params["top"])
+        if skip >= hang_from_skip["skip"]:
+            await asyncio.sleep(10)
+        body = {"@odata.count": len(feed), "value": feed[skip : skip + top]}
+        return httpx.Response(200, text=json.dumps(body))
+
+    class MockClient(httpx.AsyncClient):
+        def __init__(self, **kwargs):
+            super().__init__(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", MockClient)
+
+
+@pytest.mark.asyncio
+async def test_search_deadline_returns_partial_cursor_page(monkeypatch, memory_store):
+    """A cursor scan that runs out of time returns the pages it read and resumes after."""
+    from datetime import datetime, timedelta
+
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    retirements = {249, 248, 247, 246, 245, 5}
+    feed = [
+        {
+            "id": f"d{n:03d}",
+            "title": f"Update {n}",
+            "created": (datetime(2025, 1, 1) + timedelta(minutes=n)).isoformat() + "Z",
+            "status": "Retirements" if n in retirements else "Launched",
+        }
+        for n in range(249, -1, -1)
+    ]
+    hang = {"skip": len(feed)}
+    _fake_upstream(monkeypatch, feed, hang)
+
+    first = await azure_updates_search(status="Retirements", limit=2)
+    assert [u["id"] for u in first["updates"]] == ["d249", "d248"]
+
+    # Every page past the first window hangs
+    hang["skip"] = 100
+    page = await azure_updates_search(
+        status="Retirements", limit=10, cursor=first["next_cursor"], deadline_seconds=0.2
+    )
+    assert page["partial"] is True
+    assert [u["id"] for u in page["updates"]] == ["d247", "d246", "d245"]
+    assert page["next_cursor"]
+
+    hang["skip"] = len(feed)
+    rest = await azure_updates_search(status="Retirements", limit=10, cursor=page["next_cursor"])
+    assert [u["id"] for u in rest["updates"]] == ["d005"]
+    assert "partial" not in rest
+
+
+@pytest.mark.asyncio
+async def test_search_deadline_serves_stale_or_reports_error(monkeypatch, memory_store):
+    """A stalled upstream is answered from an expired cache entry, or reported."""
+    import asyncio
+
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    hang = {"skip": 0}
+    _fake_upstream(monkeypatch, [_dated_item(1)], hang)
+
+    result = await azure_updates_search(query="aks", deadline_seconds=0.05)
+    assert result["updates"] == []
+    assert "Deadline of 0.05s exceeded" in result["filters_applied"]["error"]
+
+    memory_store.cache_ttl = 0.001
+    hang["skip"] = 1
+    fresh = await azure_updates_search(query="update")
+    assert "stale" not in fresh
+
+    await asyncio.sleep(0.01)
+    hang["skip"] = 0
+    stale = await azure_updates_search(query="update", deadline_seconds=0.05)
+    assert stale["stale"] is True
+    assert [u["id"] for u in stale["updates"]] == [u["id"] for u in fresh["updates"]]
+
+
+@pytest.mark.asyncio
+async def test_search_across_feeds(monkeypatch, memory_store):
+    """feeds= merges several feeds newest first and applies filters to all of them."""
+    from azure_updates_mcp.feeds import azure_api
+    from azure_updates_mcp.feeds.registry import FEEDS_ENV
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    m365_url = "https://example.com/api/v2/m365"
+    monkeypatch.setenv(FEEDS_ENV, f"m365={m365_url}")
+    pages = {
+        None: [
+            {**_dated_item(4), "status": "Launched"},
+            {**_dated_item(2), "status": "In preview"},
+        ],
+        m365_url: [
+            {**_dated_item(3), "id": "m3", "status": "Launched"},
+            {**_dated_item(1), "id": "m1", "status": "Launched"},
+        ],
+    }
+
+    async def fake_fetch_raw(query, use_cache=True, client=None):
+        page = pages[query.base_url]
+        return {"@odata.count": len(page), "value": page[query.skip : query.skip + query.top]}
+
+    monkeypatch.setattr(azure_api, "fetch_raw", fake_fetch_raw)
+
+    result = await azure_updates_search(feeds=["azure", "m365"], limit=3)
+    assert [(u["id"], u["feed"]) for u in result["updates"]] == [
+        ("u004", "azure"),
+        ("m3", "m365"),
+        ("u002", "azure"),
+    ]
+    assert result["total_found"] == 4
+    assert result["filters_applied"]["feeds"] == ["azure", "m365"]
+
+    launched = await azure_updates_search(feeds=["m365", "azure"], status="Launched", offset=1)
+    assert [u["id"] for u in launched["updates"]] == ["m3", "m1"]
+
+    unknown = await azure_updates_search(feeds=["roadmap"])
+    assert unknown["filters_applied"]["error"].startswith("Unknown feed: roadmap")
+
+    # Facets describe Azure's taxonomy only, so they are refused rather than dropped
+    facets = await azure_updates_search(feeds=["azure", "m365"], include_facets=True)
+    assert "include_facets" in facets["filters_applied"]["error"]
+    assert facets["updates"] == []
+
+    # The default feed alone is an ordinary search with no feed tags
+    plain = await azure_updates_search(feeds=["azure"])
+    assert "feed" not in plain["updates"][0]
+
+
+@pytest.mark.asyncio
+async def test_search_across_feeds_deep_offset(monkeypatch, memory_store):
+    """Offsets past one page read each feed far enough to merge them correctly."""
+    from datetime import datetime, timedelta
+
+    from azure_updates_mcp.feeds import azure_api
+    from azure_updates_mcp.feeds.registry import FEEDS_ENV
+    from azure_updates_mcp.tools.search import azure_updates_search
+
+    m365_url = "https://example.com/api/v2/m365"
+    monkeypatch.setenv(FEEDS_ENV, f"m365={m365_url}")
+    start = datetime(2025, 6, 1)
+
+    def items(prefix: str, hours: int) -> list[dict]:
+        return [
+            {
+                "id": f"{prefix}{n:04d}",
+                "title": f"Update {n}",
+                "status": "Launched" if n % 2 == 0 else "In preview",
+                "created": (start - timedelta(hours=hours * n)).isoformat() + "Z",
+            }
+            for n in range(500)
+        ]
+
+    # A dense feed (hourly) and a sparse one (every ten hours)
+    pages = {None: items("a", 1), m365_url: items("b", 10)}
+
+    async def fake_fetch_raw(query, use_cache=True, client=None):
+        page = pages[query.base_url]
+        return {"@odata.count": len(page), "value": page[query.skip : query.skip + query.top]}
+
+    monkeypatch.setattr(azure_api, "fetch_raw", fake_fetch_raw)
+
+    def merged(status: str | None = None) -> list[str]:
+        every = [item for page in pages.values() for item in page]
+        every = [item for item in every if not status or item["status"] == status]
+        every.sort(key=lambda item: (item["created"], item["id"]), reverse=True)
+        return [item["id"] for item in every]
+
+    result = await azure_updates_search(feeds=["azure", "m365"], offset=150, limit=10)
+    assert [u["id"] for u in result["updates"]] == merged()[150:160]
+    assert result["total_found"] == 1000
+
+    launched = await azure_updates_search(
+        feeds=["azure", "m365"], status="Launched", offset=120, limit=10
+    )
+    assert [u["id"] for u in launched["updates"]] == merged("Launched")[120:130]
+
+
+@pytest.mark.asyncio
+async def test_diff_reports_net_changes_in_window(memory_store):
+    """The diff folds each update's history in the window into one net change."""
+    import time
+    from datetime import datetime, timezone
+
+    from azure_updates_mcp.tools.diff import azure_updates_diff
+
+    def iso(timestamp: float) -> str:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+    def sync(**statuses):
+        memory_store.replace_items(
+            [
+                {"id": item_id, "title": item_id.upper(), "created": "2025-01-01", **fields}
+                for item_id, fields in statuses.items()
+            ]
+        )
+        time.sleep(0.01)
+
+    sync(aks={"status": "In development"}, vm={"status": "Launched"}, old={"status": "Launched"})
+    before_window = time.time()
+    sync(aks={"status": "In preview"}, vm={"status": "Launched"}, old={"status": "Launched"})
+    sync(
+        aks={"status": "Launched"},
+        vm={"status": "Retirements", "generalAvailabilityDate": "2026-03"},
+        new={"status": "In preview"},
+    )
+
+    result = await azure_updates_diff(since=iso(before_window))
+    by_id = {u["id"]: u for u in result["updates"]}
+    assert set(by_id) == {"aks", "vm", "old", "new"}
+    assert by_id["aks"]["fields"] == {"status": {"from": "In development", "to": "Launched"}}
+    assert by_id["vm"]["fields"]["general_availability_date"] == {"from": None, "to": "2026-03"}
+    assert by_id["old"]["change"] == "removed"
+    assert by_id["new"]["change"] == "added"
+    assert result["summary"] == {
+        "added": 1,
+        "removed": 1,
+        "modified": 2,
+        "status_changes": 2,
+        "date_changes": 1,
+    }
+    assert "note" not in result
+
+    dates = await azure_updates_diff(since=iso(before_window), field="general_availability_date")
+    assert [u["id"] for u in dates["updates"]] == ["vm"]
+
+    launched = await azure_updates_diff(since=iso(before_window), change="added", limit=1)
+    assert [u["id"] for u in launched["updates"]] == ["new"]
+
+    early = await azure_updates_diff(since="2020-01-01")
+    assert "note" in early
+
+    invalid = await azure_updates_diff(since="last tuesday")
+    assert invalid["error"] == "Invalid since date: last tuesday"